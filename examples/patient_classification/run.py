@@ -107,7 +107,8 @@ def create_pipeline() -> Pipeline:
                 "confidence": lambda s: s.processed["visit_type"]["confidence"],
                 "reasoning": lambda s: s.processed["visit_type"]["reasoning"],
                 "clinical_summary": lambda s: s.processed["summary"]["text"],
-                "processed_at": lambda s: s.completed_at.isoformat() if s.completed_at else "",
+                # Datetimes are ISO-formatted (and memoized) by the sink
+                "processed_at": lambda s: s.completed_at,
             },
         ),
 
@@ -4,66 +4,67 @@ LLM ETL Framework - A modular Python framework for Cognitive ETL pipelines.
 Extract data from SQL Server, process unstructured text with Azure OpenAI,
 and sink structured results back to SQL Server—all with type-safe schemas
 and automatic retry logic.
+
+All public symbols are resolved lazily (PEP 562): `import llm_etl` pays
+for nothing, and each subsystem is imported on first attribute access.
+This keeps cold start fast and means e.g. test suites that only touch
+MockProvider never import the Azure provider (openai, httpx) or the
+SQL Server components (pyodbc) at all.
 """
 
 __version__ = "0.1.0"
 
-# Core components
-from llm_etl.core.pipeline import Pipeline
-from llm_etl.core.state import GlobalState
-from llm_etl.core.exceptions import (
-    LLMETLError,
-    StepExecutionError,
-    LLMValidationError,
-    SourceError,
-    SinkError,
-)
+# Every public symbol maps to (module, attribute). Resolved names are
+# cached into the module dict so __getattr__ only fires on the first
+# access; subsequent lookups are plain module-dict hits.
+_LAZY_IMPORTS = {
+    # Core
+    "Pipeline": ("llm_etl.core.pipeline", "Pipeline"),
+    "GlobalState": ("llm_etl.core.state", "GlobalState"),
+    "LLMETLError": ("llm_etl.core.exceptions", "LLMETLError"),
+    "StepExecutionError": ("llm_etl.core.exceptions", "StepExecutionError"),
+    "LLMValidationError": ("llm_etl.core.exceptions", "LLMValidationError"),
+    "SourceError": ("llm_etl.core.exceptions", "SourceError"),
+    "SinkError": ("llm_etl.core.exceptions", "SinkError"),
+    # Steps
+    "ClassifierStep": ("llm_etl.steps.classifier", "ClassifierStep"),
+    "FusedStep": ("llm_etl.steps.fused", "FusedStep"),
+    "SummarizerStep": ("llm_etl.steps.summarizer", "SummarizerStep"),
+    # Sources
+    "SQLServerSource": ("llm_etl.sources.sql_server", "SQLServerSource"),
+    "CSVSource": ("llm_etl.sources.csv_source", "CSVSource"),
+    # Sinks
+    "SQLServerSink": ("llm_etl.sinks.sql_server", "SQLServerSink"),
+    "CSVSink": ("llm_etl.sinks.csv_sink", "CSVSink"),
+    # LLM infrastructure
+    "MemoryCache": ("llm_etl.llm.cache", "MemoryCache"),
+    "ResponseCache": ("llm_etl.llm.cache", "ResponseCache"),
+    # LLM Providers
+    "MockProvider": ("llm_etl.llm.providers.mock", "MockProvider"),
+    "AzureOpenAIProvider": ("llm_etl.llm.providers.azure_openai", "AzureOpenAIProvider"),
+}
 
-# Steps
-from llm_etl.steps.classifier import ClassifierStep
-from llm_etl.steps.summarizer import SummarizerStep
 
-# Sources
-from llm_etl.sources.csv_source import CSVSource
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
 
-# Sinks
-from llm_etl.sinks.csv_sink import CSVSink
+    import importlib
 
-# LLM Providers
-from llm_etl.llm.providers.mock import MockProvider
-from llm_etl.llm.providers.azure_openai import AzureOpenAIProvider
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
 
-# Lazy imports for SQL Server components to avoid pyodbc dependency
-def __getattr__(name):
-    if name == "SQLServerSource":
-        from llm_etl.sources.sql_server import SQLServerSource
-        return SQLServerSource
-    elif name == "SQLServerSink":
-        from llm_etl.sinks.sql_server import SQLServerSink
-        return SQLServerSink
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
-    # Version
     "__version__",
-    # Core
-    "Pipeline",
-    "GlobalState",
-    "LLMETLError",
-    "StepExecutionError",
-    "LLMValidationError",
-    "SourceError",
-    "SinkError",
-    # Steps
-    "ClassifierStep",
-    "SummarizerStep",
-    # Sources
-    "SQLServerSource",
-    "CSVSource",
-    # Sinks
-    "SQLServerSink",
-    "CSVSink",
-    # LLM Providers
-    "MockProvider",
-    "AzureOpenAIProvider",
+    *_LAZY_IMPORTS,
 ]
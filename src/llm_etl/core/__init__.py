@@ -2,24 +2,40 @@
 Core components for the LLM ETL framework.
 
 Includes pipeline orchestration, state management, and exception handling.
+
+Symbols are resolved lazily (PEP 562) so importing the package — which
+happens implicitly whenever any core module is imported — never eagerly
+pulls in the pipeline and everything it orchestrates.
 """
 
-from llm_etl.core.pipeline import Pipeline
-from llm_etl.core.state import GlobalState
-from llm_etl.core.exceptions import (
-    LLMETLError,
-    StepExecutionError,
-    LLMValidationError,
-    SourceError,
-    SinkError,
-)
-
-__all__ = [
-    "Pipeline",
-    "GlobalState",
-    "LLMETLError",
-    "StepExecutionError",
-    "LLMValidationError",
-    "SourceError",
-    "SinkError",
-]
+_LAZY_IMPORTS = {
+    "Pipeline": ("llm_etl.core.pipeline", "Pipeline"),
+    "GlobalState": ("llm_etl.core.state", "GlobalState"),
+    "LLMETLError": ("llm_etl.core.exceptions", "LLMETLError"),
+    "StepExecutionError": ("llm_etl.core.exceptions", "StepExecutionError"),
+    "LLMValidationError": ("llm_etl.core.exceptions", "LLMValidationError"),
+    "SourceError": ("llm_etl.core.exceptions", "SourceError"),
+    "SinkError": ("llm_etl.core.exceptions", "SinkError"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+__all__ = [*_LAZY_IMPORTS]
@@ -22,7 +22,7 @@ class LLMETLError(Exception):
         ...     print(f"Framework error: {e}")
     """
 
-    pass
+    __slots__ = ()
 
 
 class StepExecutionError(LLMETLError):
@@ -49,6 +49,8 @@ class StepExecutionError(LLMETLError):
         ...     )
     """
 
+    __slots__ = ("step_name", "pk", "original_error")
+
     def __init__(self, step_name: str, pk: str, original_error: Exception):
         """
         Initialize a StepExecutionError.
@@ -62,11 +64,16 @@ class StepExecutionError(LLMETLError):
         self.pk = pk
         self.original_error = original_error
 
-        message = (
-            f"Step '{step_name}' failed for pk='{pk}': "
-            f"{type(original_error).__name__}: {original_error}"
+        # Message formatting is deferred to __str__: handlers that only
+        # inspect .step_name/.pk (like dead_letter handling) never pay for it
+        super().__init__()
+
+    def __str__(self) -> str:
+        """Build the formatted message on demand."""
+        return (
+            f"Step '{self.step_name}' failed for pk='{self.pk}': "
+            f"{type(self.original_error).__name__}: {self.original_error}"
         )
-        super().__init__(message)
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -99,6 +106,8 @@ class LLMValidationError(LLMETLError):
         ... )
     """
 
+    __slots__ = ("step_name", "pk", "validation_errors", "retry_count")
+
     def __init__(
         self,
         step_name: str,
@@ -120,12 +129,17 @@ class LLMValidationError(LLMETLError):
         self.validation_errors = validation_errors
         self.retry_count = retry_count
 
-        errors_str = "; ".join(validation_errors)
-        message = (
-            f"Step '{step_name}' validation failed for pk='{pk}' "
-            f"after {retry_count} retries. Errors: {errors_str}"
+        # Message formatting (including joining every accumulated validation
+        # error) is deferred to __str__ so retry-heavy runs don't pay for it
+        super().__init__()
+
+    def __str__(self) -> str:
+        """Build the formatted message on demand."""
+        errors_str = "; ".join(self.validation_errors)
+        return (
+            f"Step '{self.step_name}' validation failed for pk='{self.pk}' "
+            f"after {self.retry_count} retries. Errors: {errors_str}"
         )
-        super().__init__(message)
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -147,7 +161,7 @@ class SourceError(LLMETLError):
         >>> raise SourceError("Failed to connect to SQL Server: timeout")
     """
 
-    pass
+    __slots__ = ()
 
 
 class SinkError(LLMETLError):
@@ -169,6 +183,8 @@ class SinkError(LLMETLError):
         ...     raise SinkError(pk="enc_12345", original_error=e)
     """
 
+    __slots__ = ("pk", "original_error")
+
     def __init__(self, pk: str, original_error: Exception):
         """
         Initialize a SinkError.
@@ -180,11 +196,15 @@ class SinkError(LLMETLError):
         self.pk = pk
         self.original_error = original_error
 
-        message = (
-            f"Failed to write pk='{pk}' to sink: "
-            f"{type(original_error).__name__}: {original_error}"
+        # Message formatting is deferred to __str__ (see StepExecutionError)
+        super().__init__()
+
+    def __str__(self) -> str:
+        """Build the formatted message on demand."""
+        return (
+            f"Failed to write pk='{self.pk}' to sink: "
+            f"{type(self.original_error).__name__}: {self.original_error}"
         )
-        super().__init__(message)
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -4,17 +4,32 @@ Pipeline orchestration for the LLM ETL framework.
 Coordinates source ingestion, step execution, error handling, and sink persistence.
 """
 
-import json
+import asyncio
+import itertools
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, Optional
 
+# Optional event-loop accelerator: uvloop's libuv-based loop is
+# substantially faster than the stdlib selector loop for socket-heavy
+# workloads like high fan-out LLM calls. Falls back silently when absent
+# (it is not available on Windows).
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from ..core.exceptions import StepExecutionError
-from ..core.state import GlobalState
-from ..llm.client import LLMClient, LLMClientWithRetry
+from ..core.serialization import dumps_line
+from ..core.state import GlobalState, ModelView
+from ..llm.cache import ResponseCache
+from ..llm.client import LLMClient, LLMClientWithRetry, schema_for
 from ..sinks.base import AbstractSink
 from ..sources.base import AbstractSource
 from ..steps.base import AbstractBaseStep
@@ -90,6 +105,10 @@ class Pipeline:
         on_row_error: ErrorHandling = "dead_letter",
         dead_letter_path: str = "output/dead_letter.jsonl",
         max_retries: int = 3,
+        max_concurrency: int = 16,
+        batch_size: int = 1,
+        cache_path: Optional[str] = None,
+        dedup_dead_letters: bool = False,
     ):
         """
         Initialize the pipeline with all components.
@@ -106,6 +125,26 @@ class Pipeline:
                          - "dead_letter": Write failed row to dead letter file and continue
             dead_letter_path: Path for dead letter file (if on_row_error="dead_letter")
             max_retries: Maximum LLM validation retry attempts (default: 3)
+            max_concurrency: Maximum number of rows processed concurrently.
+                            LLM round-trips are latency-bound, so overlapping them
+                            dominates wall-clock time. Set to 1 for strictly
+                            sequential processing (default: 16)
+            batch_size: Number of rows grouped together before invoking steps.
+                       Steps that support batch execution (e.g. ClassifierStep)
+                       can marshal a whole group into a single LLM call.
+                       When > 1, groups are processed sequentially and
+                       max_concurrency is not used (default: 1)
+            cache_path: Optional path to an on-disk LLM response cache.
+                       When set, rows whose exact prompts have been seen
+                       before (duplicate inputs, or a re-run over the same
+                       data) skip their LLM calls entirely.
+            dedup_dead_letters: When True, rows failing the same way (same
+                       step, error type and first error line) are written
+                       once with a duplicate_count, then sampled 1-in-100.
+                       Keeps systemic failures (schema drift, auth) from
+                       ballooning the dead-letter file. Off by default
+                       because the full file is what makes every failed
+                       row replayable.
 
         Raises:
             ValueError: If on_row_error is not a valid option
@@ -127,6 +166,18 @@ class Pipeline:
         self.on_row_error = on_row_error
         self.dead_letter_path = Path(dead_letter_path)
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+
+        # Validate concurrency setting
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got {max_concurrency}"
+            )
+
+        # Validate batch setting
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.batch_size = batch_size
 
         # Validate error handling mode
         valid_modes: tuple[ErrorHandling, ...] = ("fail", "skip", "dead_letter")
@@ -136,8 +187,22 @@ class Pipeline:
                 f"Must be one of: {', '.join(valid_modes)}"
             )
 
-        # Wrap LLM provider with retry logic
-        self.llm_client = LLMClientWithRetry(llm_provider, max_retries=max_retries)
+        # Wrap LLM provider with retry logic, plus the response cache when
+        # one is configured
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        self.llm_client = LLMClientWithRetry(
+            llm_provider, max_retries=max_retries, cache=self.cache
+        )
+
+        # Background dead-letter writer, spawned lazily on the first failure
+        # so error-free runs never pay for the thread
+        self._dead_letter_queue: Optional[queue.Queue] = None
+        self._dead_letter_thread: Optional[threading.Thread] = None
+
+        # Duplicate-failure tracking for dead-letter dedup
+        self.dedup_dead_letters = dedup_dead_letters
+        self._dead_letter_seen: dict[tuple, int] = {}
+        self._dead_letter_seen_lock = threading.Lock()
 
         # Setup logging
         self.logger = logging.getLogger(f"llm_etl.pipeline.{name}")
@@ -171,6 +236,7 @@ class Pipeline:
         success_count = 0
         failure_count = 0
         total_count = 0
+        source_iter = None
 
         # Get total count for progress tracking (may be None)
         total_rows = self.source.count()
@@ -180,37 +246,58 @@ class Pipeline:
             self.logger.info(f"Pipeline '{self.name}' starting (row count unknown)")
 
         try:
-            for state in self.source:
-                total_count += 1
-
-                try:
-                    # Process the row through all steps and write to sink
-                    self._process_row(state)
-                    success_count += 1
-
-                except KeyboardInterrupt:
-                    self.logger.warning("Keyboard interrupt received, stopping pipeline...")
-                    raise
-
-                except Exception as e:
-                    # Handle error according to configured strategy
-                    self._handle_error(state, e)
-                    failure_count += 1
-
-                # Progress logging every 100 rows or 10% milestones
+            if self.batch_size > 1:
+                # Group rows so batch-aware steps can marshal them into
+                # a single LLM call
+                success_count, failure_count, total_count = self._run_batched()
+
+            elif self.max_concurrency > 1:
+                # Overlap LLM round-trips by processing rows concurrently.
+                # Use uvloop's faster event loop when it is installed.
+                if uvloop is not None:
+                    uvloop.install()
+                success_count, failure_count, total_count = asyncio.run(
+                    self._run_concurrent(total_rows)
+                )
+
+            else:
+                # Hoist the progress-report interval out of the loop: every
+                # 100 rows, or at 10% milestones for small sources
                 if total_rows is not None:
-                    milestone_interval = max(1, total_rows // 10)  # 10% milestones
-                    if total_count % min(100, milestone_interval) == 0:
-                        progress_pct = (total_count / total_rows) * 100
-                        self.logger.info(
-                            f"Progress: {total_count}/{total_rows} ({progress_pct:.1f}%) - "
-                            f"Success: {success_count}, Failed: {failure_count}"
-                        )
-                elif total_count % 100 == 0:
-                    self.logger.info(
-                        f"Progress: {total_count} rows - "
-                        f"Success: {success_count}, Failed: {failure_count}"
-                    )
+                    report_every = min(100, max(1, total_rows // 10))
+                else:
+                    report_every = 100
+
+                source_iter = self._prefetch()
+                for state in source_iter:
+                    total_count += 1
+
+                    # Failures come back as values, so skipped and
+                    # dead-lettered rows never pay for a raise-and-unwind;
+                    # _handle_error raises when on_row_error="fail"
+                    error = self._process_row_safe(state)
+                    if error is None:
+                        success_count += 1
+                    else:
+                        self._handle_error(state, error)
+                        failure_count += 1
+
+                    # Progress logging; the level guard keeps the f-string
+                    # build off the hot path when INFO is disabled
+                    if total_count % report_every == 0 and self.logger.isEnabledFor(
+                        logging.INFO
+                    ):
+                        if total_rows is not None:
+                            progress_pct = (total_count / total_rows) * 100
+                            self.logger.info(
+                                f"Progress: {total_count}/{total_rows} ({progress_pct:.1f}%) - "
+                                f"Success: {success_count}, Failed: {failure_count}"
+                            )
+                        else:
+                            self.logger.info(
+                                f"Progress: {total_count} rows - "
+                                f"Success: {success_count}, Failed: {failure_count}"
+                            )
 
         except KeyboardInterrupt:
             self.logger.warning(
@@ -219,6 +306,15 @@ class Pipeline:
             )
             # Don't re-raise, return partial results
 
+        finally:
+            # Stop the prefetch reader if the loop bailed out early (error
+            # raise, interrupt) so it cannot linger blocked on a full queue
+            if source_iter is not None:
+                source_iter.close()
+            # Persist anything the sink may still be buffering and make sure
+            # every queued dead-letter and payload-log record has hit disk
+            self._close_run_resources()
+
         duration_seconds = time.time() - start_time
 
         # Log final summary
@@ -237,6 +333,440 @@ class Pipeline:
             dead_letter_path=str(self.dead_letter_path) if failure_count > 0 else None,
         )
 
+    async def arun(self) -> PipelineResult:
+        """
+        Execute the pipeline from within an existing asyncio event loop.
+
+        run() owns its own loop via asyncio.run(), which raises if called
+        from async code. arun() is the awaitable entry point for callers
+        that already run a loop (async web handlers, notebook kernels,
+        schedulers): it always takes the concurrent path, overlapping up
+        to max_concurrency rows. Providers with a native async client get
+        awaited directly through LLMClient.acomplete; sync providers are
+        offloaded to worker threads. The caller's loop is left untouched
+        (no uvloop.install()).
+
+        Returns:
+            PipelineResult with execution metrics
+
+        Raises:
+            Exception: If on_row_error="fail" and a row fails processing
+
+        Example:
+            >>> async def handler():
+            ...     result = await pipeline.arun()
+            ...     return result.success_count
+        """
+        start_time = time.time()
+
+        total_rows = self.source.count()
+        if total_rows is not None:
+            self.logger.info(f"Pipeline '{self.name}' starting: {total_rows} rows to process")
+        else:
+            self.logger.info(f"Pipeline '{self.name}' starting (row count unknown)")
+
+        success_count = failure_count = total_count = 0
+        try:
+            success_count, failure_count, total_count = await self._run_concurrent(
+                total_rows
+            )
+        finally:
+            self._close_run_resources()
+
+        duration_seconds = time.time() - start_time
+        self.logger.info(
+            f"Pipeline '{self.name}' completed: {success_count} succeeded, "
+            f"{failure_count} failed out of {total_count} total "
+            f"in {duration_seconds:.2f}s"
+        )
+
+        return PipelineResult(
+            success_count=success_count,
+            failure_count=failure_count,
+            total_count=total_count,
+            duration_seconds=duration_seconds,
+            dead_letter_path=str(self.dead_letter_path) if failure_count > 0 else None,
+        )
+
+    def run_batch_api(
+        self,
+        poll_interval: float = 30.0,
+        timeout: float = 86400.0,
+    ) -> PipelineResult:
+        """
+        Execute the pipeline offline through the provider's Batch API.
+
+        Intended for bulk, non-interactive runs (e.g. nightly enrichment):
+        batch jobs cost roughly half as much as synchronous calls and sustain
+        higher throughput. One batch job is submitted per step so later steps
+        can read earlier steps' outputs, exactly as in synchronous runs.
+        Rows whose requests fail server-side or fail validation are handled
+        according to on_row_error, like any other row failure.
+
+        Requires an LLM provider implementing submit_batch() and
+        wait_for_batch() (e.g. AzureOpenAIProvider), and steps exposing
+        _build_prompt() and output_schema.
+
+        Args:
+            poll_interval: Seconds between batch status polls
+            timeout: Maximum seconds to wait for each batch job
+
+        Returns:
+            PipelineResult with execution metrics
+
+        Raises:
+            LLMETLError: If the provider does not support the Batch API
+            Exception: If on_row_error="fail" and a row fails processing
+        """
+        from ..core.exceptions import LLMETLError
+
+        provider = self.llm_client.client
+        if not (hasattr(provider, "submit_batch") and hasattr(provider, "wait_for_batch")):
+            raise LLMETLError(
+                f"LLM provider {type(provider).__name__} does not support the "
+                f"Batch API (requires submit_batch/wait_for_batch)"
+            )
+
+        start_time = time.time()
+
+        # Materialize all rows upfront; the batch file needs every request
+        states = list(self.source)
+        total_count = len(states)
+        failure_count = 0
+        self.logger.info(
+            f"Pipeline '{self.name}' starting batch API run: {total_count} rows"
+        )
+
+        success_count = 0
+        alive = states
+        try:
+            for step in self.steps:
+                # Ship the output schema with each request so the provider
+                # can ask for schema-constrained decoding: the model then
+                # cannot produce the wrong shape, eliminating validation
+                # retries
+                step_schema = schema_for(step.output_schema)
+                requests = [
+                    {
+                        "custom_id": f"{state.pk}:{step.name}",
+                        "messages": step._build_prompt(step._apply_input_map(state)),
+                        "response_schema": step_schema,
+                        "response_schema_name": step.output_schema.__name__,
+                    }
+                    for state in alive
+                ]
+                if not requests:
+                    break
+
+                batch_id = provider.submit_batch(requests)
+                results, errors = provider.wait_for_batch(
+                    batch_id, poll_interval=poll_interval, timeout=timeout
+                )
+
+                survivors = []
+                for state in alive:
+                    custom_id = f"{state.pk}:{step.name}"
+                    try:
+                        if custom_id not in results:
+                            raise ValueError(
+                                errors.get(custom_id, "no result returned for request")
+                            )
+
+                        output = step.output_schema.model_validate_json(
+                            results[custom_id]
+                        )
+                        output = step._validate_output(output)
+
+                        state.processed[step.output_key] = ModelView(output)
+                        state.log.append(step.name)
+                        survivors.append(state)
+
+                    except Exception as e:
+                        self._handle_error(
+                            state,
+                            StepExecutionError(
+                                step_name=step.name, pk=state.pk, original_error=e
+                            ),
+                        )
+                        failure_count += 1
+
+                alive = survivors
+
+            # Persist rows that made it through every step
+            for state in alive:
+                try:
+                    state.completed_at = datetime.now()
+                    self.sink.write(state)
+                    success_count += 1
+                except Exception as e:
+                    self._handle_error(
+                        state,
+                        StepExecutionError(
+                            step_name="sink", pk=state.pk, original_error=e
+                        ),
+                    )
+                    failure_count += 1
+
+        finally:
+            # Mirror run(): a batch timeout or a "fail"-mode raise must not
+            # skip the sink flush or strand queued dead letters
+            self._close_run_resources()
+
+        duration_seconds = time.time() - start_time
+        self.logger.info(
+            f"Pipeline '{self.name}' batch API run completed: {success_count} succeeded, "
+            f"{failure_count} failed out of {total_count} total "
+            f"in {duration_seconds:.2f}s"
+        )
+
+        return PipelineResult(
+            success_count=success_count,
+            failure_count=failure_count,
+            total_count=total_count,
+            duration_seconds=duration_seconds,
+            dead_letter_path=str(self.dead_letter_path) if failure_count > 0 else None,
+        )
+
+    # Sentinel marking the end of the prefetch queue
+    _PREFETCH_SENTINEL = object()
+
+    def _prefetch(self):
+        """
+        Iterate source rows through a bounded queue filled by a reader thread.
+
+        Without prefetching, no rows are fetched from the source (CSV
+        parse, SQL cursor) while a step blocks on an LLM call. A dedicated
+        reader thread overlaps that I/O with processing; the bounded queue
+        provides backpressure so a fast source cannot outrun processing by
+        more than the queue depth.
+
+        Closing the generator (or exhausting it) signals the reader
+        thread to stop, so an abandoned iteration — an on_row_error="fail"
+        abort, any exception escaping the consuming loop — cannot leave
+        the thread blocked on a full queue pinning the source's file
+        handle or cursor. Consumers must close() the generator in a
+        finally when they bail out early.
+
+        Yields:
+            GlobalState objects in source order
+
+        Raises:
+            Exception: Re-raised from the reader thread if the source fails
+        """
+        rows: queue.Queue = queue.Queue(maxsize=max(64, self.max_concurrency * 2))
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Bounded put that gives up once the consumer is gone; the
+            # timeout is how long an abandoned reader lingers at worst
+            while not stop.is_set():
+                try:
+                    rows.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def reader() -> None:
+            try:
+                for state in self.source:
+                    if not put(state):
+                        return
+            except BaseException as e:  # noqa: BLE001 - forwarded to consumer
+                put(e)
+                return
+            put(self._PREFETCH_SENTINEL)
+
+        thread = threading.Thread(
+            target=reader,
+            name=f"llm-etl-{self.name}-prefetch",
+            daemon=True,
+        )
+        thread.start()
+
+        try:
+            while True:
+                item = rows.get()
+                if item is self._PREFETCH_SENTINEL:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Runs on exhaustion, on close(), and on GC of an abandoned
+            # generator alike: release the reader from any blocked put
+            stop.set()
+
+    def _run_batched(self) -> tuple[int, int, int]:
+        """
+        Process rows in groups of batch_size through batch-aware steps.
+
+        Chunks the source iterator with itertools.islice and hands each
+        group to the steps' run_batch. If a whole group fails, falls back
+        to per-row processing for that group so a single bad batch cannot
+        fail all of its rows and error semantics stay per-row.
+
+        Returns:
+            Tuple of (success_count, failure_count, total_count)
+
+        Raises:
+            Exception: If on_row_error="fail" and a row fails processing
+        """
+        success_count = 0
+        failure_count = 0
+        total_count = 0
+
+        source_iter = self._prefetch()
+        try:
+            while batch := list(itertools.islice(source_iter, self.batch_size)):
+                total_count += len(batch)
+
+                try:
+                    states = batch
+                    for step in self.steps:
+                        states = step.run_batch(states, self.llm_client)
+
+                except KeyboardInterrupt:
+                    self.logger.warning(
+                        "Keyboard interrupt received, stopping pipeline..."
+                    )
+                    raise
+
+                except Exception:
+                    # Isolate the failure: finish this group row by row so
+                    # only the genuinely bad rows are skipped or
+                    # dead-lettered. resume=True skips steps a state has
+                    # already been through (recorded in state.log), so
+                    # successful earlier steps are never re-executed and
+                    # don't get duplicate log entries
+                    self.logger.warning(
+                        f"Batch of {len(batch)} rows failed; retrying rows individually"
+                    )
+                    for state in batch:
+                        error = self._process_row_safe(state, resume=True)
+                        if error is None:
+                            success_count += 1
+                        else:
+                            self._handle_error(state, error)
+                            failure_count += 1
+
+                else:
+                    # Steps succeeded for the whole group; persist row by
+                    # row so a sink failure only affects its own row
+                    for state in states:
+                        try:
+                            state.completed_at = datetime.now()
+                            self.sink.write(state)
+                            success_count += 1
+                        except Exception as e:
+                            self._handle_error(
+                                state,
+                                StepExecutionError(
+                                    step_name="sink", pk=state.pk, original_error=e
+                                ),
+                            )
+                            failure_count += 1
+
+                if total_count % 100 < self.batch_size:
+                    self.logger.info(
+                        f"Progress: {total_count} rows - "
+                        f"Success: {success_count}, Failed: {failure_count}"
+                    )
+        finally:
+            # Stop the prefetch reader on early exit ("fail" mode raise,
+            # interrupt) so it cannot linger blocked on a full queue
+            source_iter.close()
+
+        return success_count, failure_count, total_count
+
+    async def _run_concurrent(self, total_rows: Optional[int]) -> tuple[int, int, int]:
+        """
+        Process rows concurrently with a pool of bounded worker tasks.
+
+        Runs max_concurrency worker tasks that each pull the next row
+        from the prefetch iterator and process it, so at most
+        max_concurrency rows plus the bounded prefetch queue are in
+        memory at once — the source streams exactly as in the sequential
+        path. The LLM providers are synchronous clients, so fetching and
+        processing are offloaded to a dedicated thread pool sized to
+        max_concurrency; the blocking network wait releases the GIL,
+        letting rows overlap. A dedicated pool (rather than the loop's
+        default executor, which caps at min(32, cpus + 4) threads)
+        guarantees the window is never throttled below max_concurrency.
+
+        Args:
+            total_rows: Total row count for progress logging (may be None)
+
+        Returns:
+            Tuple of (success_count, failure_count, total_count)
+
+        Raises:
+            Exception: If on_row_error="fail" and a row fails processing
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=f"llm-etl-{self.name}",
+        )
+        counts = {"success": 0, "failure": 0, "done": 0, "total": 0}
+
+        # Workers share one prefetch iterator; next() on a generator is
+        # not thread-safe, so pulls are serialized with a lock. Each
+        # worker has at most one executor job in flight (a fetch or a
+        # row), so the pool never starves fetches behind row processing.
+        source_iter = self._prefetch()
+        iter_lock = threading.Lock()
+        exhausted = object()
+
+        def next_state():
+            with iter_lock:
+                return next(source_iter, exhausted)
+
+        async def worker() -> None:
+            while True:
+                state = await loop.run_in_executor(executor, next_state)
+                if state is exhausted:
+                    return
+                counts["total"] += 1
+
+                error = await loop.run_in_executor(
+                    executor, self._process_row_safe, state
+                )
+                if error is None:
+                    counts["success"] += 1
+                else:
+                    # _handle_error raises when on_row_error="fail"
+                    self._handle_error(state, error)
+                    counts["failure"] += 1
+
+                counts["done"] += 1
+                if counts["done"] % 100 == 0 and self.logger.isEnabledFor(logging.INFO):
+                    progress = f"{counts['done']}/{total_rows}" if total_rows else str(counts["done"])
+                    self.logger.info(
+                        f"Progress: {progress} rows - "
+                        f"Success: {counts['success']}, Failed: {counts['failure']}"
+                    )
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)
+        ]
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # On failure ("fail" mode) cancel any workers still running
+            for task in workers:
+                if not task.done():
+                    task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Stop the prefetch reader; the lock waits out any fetch still
+            # executing in a pool thread so close() cannot hit a running
+            # generator
+            with iter_lock:
+                source_iter.close()
+
+        return counts["success"], counts["failure"], counts["total"]
+
     def _run_dry_run(self) -> PipelineResult:
         """
         Validate pipeline configuration without processing data.
@@ -300,42 +830,64 @@ class Pipeline:
             The processed GlobalState with completed_at timestamp
 
         Raises:
-            StepExecutionError: If any step fails
-            SinkError: If writing to sink fails
+            StepExecutionError: If any step or the sink write fails
         """
-        try:
-            # Run through all steps
-            for step in self.steps:
-                try:
-                    state = step.run(state, self.llm_client)
-                except Exception as e:
-                    # Wrap in StepExecutionError with context
-                    raise StepExecutionError(
-                        step_name=step.name,
-                        pk=state.pk,
-                        original_error=e,
-                    )
+        error = self._process_row_safe(state)
+        if error is not None:
+            raise error
+        return state
+
+    def _process_row_safe(
+        self, state: GlobalState, resume: bool = False
+    ) -> Optional[StepExecutionError]:
+        """
+        Process a single row, returning failure as a value instead of raising.
 
-            # Mark completion timestamp
-            state.completed_at = datetime.now()
+        Steps run through safe_run, so a failed row costs one exception
+        construction rather than a raise-and-unwind per pipeline layer.
+        The run loops route the returned error straight to _handle_error,
+        which only raises when on_row_error="fail".
 
-            # Write to sink
-            self.sink.write(state)
+        Args:
+            state: GlobalState to process (mutated in place)
+            resume: Skip steps already recorded in state.log. Used by the
+                batched fallback so rows partway through the pipeline
+                continue from the failed step instead of re-running (and
+                re-paying for) steps that already succeeded
 
-            return state
+        Returns:
+            None on success, or a StepExecutionError wrapping the failure
+        """
+        # Hoist attribute loads out of the per-row loop; this method runs
+        # once per row, potentially millions of times
+        client = self.llm_client
+
+        for step in self.steps:
+            if resume and step.name in state.log:
+                continue
+            updated, error = step.safe_run(state, client)
+            if error is not None:
+                return StepExecutionError(
+                    step_name=step.name,
+                    pk=state.pk,
+                    original_error=error,
+                )
+            state = updated
+
+        # Mark completion timestamp
+        state.completed_at = datetime.now()
 
-        except StepExecutionError:
-            # Re-raise StepExecutionError as-is (already has context)
-            raise
+        try:
+            self.sink.write(state)
         except Exception as e:
-            # Wrap other errors (like SinkError) with step context
-            # Use "sink" as the step name for sink errors
-            raise StepExecutionError(
+            return StepExecutionError(
                 step_name="sink",
                 pk=state.pk,
                 original_error=e,
             )
 
+        return None
+
     def _handle_error(self, state: GlobalState, error: Exception) -> None:
         """
         Handle a row processing error according to the configured strategy.
@@ -356,12 +908,14 @@ class Pipeline:
             error_msg = str(error)
 
         if self.on_row_error == "fail":
-            # Re-raise immediately
+            # Raise the error explicitly: callers may pass a constructed
+            # error value (from _process_row_safe) rather than call from
+            # inside an active except block
             self.logger.error(
                 f"Pipeline halted due to error in step '{step_name}' "
                 f"for pk={state.pk}: {error_msg}"
             )
-            raise
+            raise error
 
         elif self.on_row_error == "skip":
             # Log and continue
@@ -391,12 +945,16 @@ class Pipeline:
             error: The exception that occurred
 
         Note:
-            This method is synchronous and writes immediately to ensure
-            failed rows are never lost, even if the pipeline crashes.
+            Records are handed to a background writer thread so a burst of
+            failures doesn't block row processing on file I/O. The writer is
+            drained and joined before run() returns, so no record is lost on
+            a clean shutdown.
         """
         # Extract retry count if this was an LLMValidationError
         from ..core.exceptions import LLMValidationError, StepExecutionError
 
+        error_message = str(error)
+
         retry_attempts = 0
         # Check if error is LLMValidationError (direct or wrapped in StepExecutionError)
         actual_error = error
@@ -406,22 +964,147 @@ class Pipeline:
         if isinstance(actual_error, LLMValidationError):
             retry_attempts = actual_error.retry_count
 
+        # With dedup enabled, repeated identical failures are written once
+        # and then sampled, so systemic errors don't balloon the file. The
+        # key is built from the unwrapped error's stable parts: validation
+        # error messages embed the row's pk, so LLMValidationError is keyed
+        # on its per-field details instead.
+        duplicate_count = None
+        if self.dedup_dead_letters:
+            if isinstance(actual_error, LLMValidationError):
+                summary = (
+                    actual_error.validation_errors[0]
+                    if actual_error.validation_errors
+                    else ""
+                )
+            else:
+                summary = str(actual_error)
+            key = (
+                step_name,
+                type(actual_error).__name__,
+                summary.splitlines()[0][:200] if summary else "",
+            )
+            with self._dead_letter_seen_lock:
+                duplicate_count = self._dead_letter_seen.get(key, 0) + 1
+                self._dead_letter_seen[key] = duplicate_count
+            if duplicate_count != 1 and duplicate_count % self._DEAD_LETTER_SAMPLE_EVERY:
+                return
+
         # Create dead letter record
         record = {
             "pk": state.pk,
             "step_name": step_name,
             "error_type": type(error).__name__,
-            "error_message": str(error),
-            "raw_data": dict(state.raw),  # Convert MappingProxyType to dict
-            "processed_state": state.processed,
+            "error_message": error_message,
+            "raw_data": state.raw_as_dict(),  # Cached plain-dict copy of raw
+            "processed_state": state.processed_as_dict(),
             "steps_completed": state.log,
-            "timestamp": datetime.now().isoformat(),
+            # Serialized to ISO 8601 by the JSONL writer
+            "timestamp": datetime.now(),
             "retry_attempts": retry_attempts,
         }
+        if duplicate_count is not None:
+            record["duplicate_count"] = duplicate_count
+
+        # Hand off to the background writer; put() blocks if the queue is
+        # full, providing backpressure instead of unbounded memory growth
+        self._ensure_dead_letter_writer()
+        self._dead_letter_queue.put(record)
+
+    # Sentinel telling the dead-letter writer thread to drain and exit
+    _DEAD_LETTER_SENTINEL = object()
+
+    # With dedup enabled, every Nth duplicate failure is still written so
+    # long-running systemic errors remain visible in the file
+    _DEAD_LETTER_SAMPLE_EVERY = 100
+
+    def _ensure_dead_letter_writer(self) -> None:
+        """
+        Start the background dead-letter writer thread if not yet running.
+
+        Creates the parent directory and a bounded queue; the daemon thread
+        consumes records and appends them as JSONL lines.
+        """
+        if self._dead_letter_thread is not None:
+            return
 
-        # Ensure parent directory exists
         self.dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write synchronously (atomic append on most filesystems)
-        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._dead_letter_queue = queue.Queue(maxsize=10_000)
+        self._dead_letter_thread = threading.Thread(
+            target=self._dead_letter_loop,
+            name=f"llm_etl-dead-letter-{self.name}",
+            daemon=True,
+        )
+        self._dead_letter_thread.start()
+
+    def _dead_letter_loop(self) -> None:
+        """
+        Consume dead-letter records from the queue and append them to disk.
+
+        Keeps one file handle open for the life of the run and flushes
+        whenever the queue is momentarily empty, so bursts of failures are
+        batched into few write syscalls while idle periods stay durable.
+        """
+        # 1 MB userspace buffer: bursts of failures coalesce into few
+        # write syscalls; the explicit flushes below keep idle periods
+        # durable
+        with open(self.dead_letter_path, "ab", buffering=1 << 20) as f:
+            while True:
+                record = self._dead_letter_queue.get()
+                if record is self._DEAD_LETTER_SENTINEL:
+                    f.flush()
+                    return
+
+                try:
+                    f.write(dumps_line(record))
+                except Exception as e:
+                    self.logger.error(f"Failed to write dead letter record: {e}")
+
+                # Flush once the burst is over
+                if self._dead_letter_queue.empty():
+                    f.flush()
+
+    def _close_dead_letter_writer(self) -> None:
+        """
+        Drain the dead-letter queue and stop the writer thread.
+
+        Safe to call when the writer was never started. Blocks until every
+        queued record has been written, so callers can rely on the file
+        being complete once run() returns.
+        """
+        if self._dead_letter_thread is None:
+            return
+
+        self._dead_letter_queue.put(self._DEAD_LETTER_SENTINEL)
+        self._dead_letter_thread.join()
+        self._dead_letter_thread = None
+        self._dead_letter_queue = None
+
+    def _close_run_resources(self) -> None:
+        """
+        Flush and close everything a run holds open, each independently.
+
+        A failing sink must not prevent the dead-letter and payload-log
+        writers from draining — those records matter most exactly when
+        the sink is broken — so every shutdown step runs regardless of
+        the others. The first failure is re-raised once all four have
+        been attempted (with any in-flight exception chained as its
+        context); later failures are logged.
+        """
+        first_error: Optional[BaseException] = None
+        for close in (
+            self.sink.flush,
+            self.sink.close,
+            self._close_dead_letter_writer,
+            self.llm_client.flush_logs,
+        ):
+            try:
+                close()
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+                else:
+                    self.logger.error(f"Error during pipeline cleanup: {e!r}")
+        if first_error is not None:
+            raise first_error
@@ -0,0 +1,126 @@
+"""
+JSON serialization helpers for hot paths.
+
+Uses orjson (a Rust JSON encoder, ~3-5x faster than the stdlib) when it is
+installed, falling back to the stdlib json module otherwise. orjson stays an
+optional dependency, in line with how this project handles pyodbc and pyarrow.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_default(obj: Any) -> str:
+    """
+    Stdlib-fallback serializer for types orjson handles natively.
+
+    Keeps the fallback output format-compatible with orjson: datetimes
+    become ISO 8601 strings, anything else falls back to str().
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Non-ASCII characters are preserved (not escaped), matching the
+    ensure_ascii=False convention used throughout the framework's
+    JSONL writers.
+
+    Args:
+        obj: JSON-serializable object
+        default: Optional fallback called for otherwise unserializable values
+
+    Returns:
+        JSON string without trailing newline
+
+    Raises:
+        TypeError: If obj contains unserializable values and no default is given
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=default)
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, optionally indented.
+
+    For writing a single document straight to a binary stream (as opposed
+    to the JSONL records dumps_line produces). Datetimes are serialized to
+    ISO strings, matching the other helpers here.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: When True, indent with 2 spaces for human consumption
+
+    Returns:
+        UTF-8 encoded JSON document (no trailing newline)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        default=_stdlib_default,
+        indent=2 if pretty else None,
+    ).encode("utf-8")
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """
+    Serialize an object to canonical (sorted-key) JSON bytes.
+
+    For content hashing and dedup keys: two mappings with the same
+    entries produce identical bytes regardless of insertion order.
+    Datetimes become ISO strings as in the other helpers.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON document with keys sorted at every level
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        obj, ensure_ascii=False, default=_stdlib_default, sort_keys=True
+    ).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    Serialize an object to one newline-terminated JSONL record as bytes.
+
+    Intended for the hot JSONL writers (dead-letter file, payload log):
+    returning bytes lets callers write to binary-mode streams without an
+    extra encode, and orjson appends the newline without building an
+    intermediate string. Datetimes are serialized to ISO strings
+    (natively by orjson; via str() in the stdlib fallback), so callers
+    don't need manual isoformat() conversions.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON record ending in a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (
+        json.dumps(obj, ensure_ascii=False, default=_stdlib_default) + "\n"
+    ).encode("utf-8")
@@ -3,12 +3,123 @@ GlobalState - The core data container for pipeline execution.
 
 Each row from the source becomes a GlobalState object that travels through
 the pipeline, accumulating processed results while preserving the original data.
+
+The layout is deliberately row-wise (one object per row) rather than a
+columnar struct-of-arrays frame: the framework's extension points —
+input_map extractors, sink column_maps, per-row error handling and dead
+lettering — are all expressed against a single row, and the pipeline's
+cost is dominated by LLM round-trips, not dict lookups. Batch-aware
+steps and buffered sinks amortize the per-row overhead where it matters
+without changing this contract.
 """
 
-import json
+import hashlib
+import sys
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from types import MappingProxyType
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, Optional
+
+from llm_etl.core.serialization import dumps_bytes, dumps_canonical
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO timestamp, memoized per unique string.
+
+    Bulk from_dict restores (checkpoints, dead-letter replays) carry
+    highly repetitive timestamps — whole batches share one created_at —
+    so a hash lookup replaces the fromisoformat parse for every repeat.
+    datetime objects are immutable, so sharing one instance is safe.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """
+    Coerce a timestamp field from from_dict input to a datetime.
+
+    In-memory round trips often carry datetime objects straight through
+    in the dict; those pass untouched. ISO strings go through the
+    memoized parser, and empty/None values map to None.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return _parse_iso(value)
+
+
+class _FrozenDict(dict):
+    """
+    Dict subclass whose mutating methods raise TypeError.
+
+    Storage for GlobalState.raw: unlike the MappingProxyType wrapper it
+    replaces, item access goes straight through dict's C fast path with
+    no proxy indirection, and the JSON writers can encode it without a
+    plain-dict copy — while writes fail exactly as they did against the
+    proxy. Like the proxy, only the top level is frozen; nested
+    containers stay as the caller supplied them.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("GlobalState.raw is immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    del _immutable
+
+
+class ModelView(Mapping):
+    """
+    Read-only mapping view over a step's Pydantic output model.
+
+    Steps store their BaseModel result wrapped in this view instead of
+    eagerly calling model_dump(): downstream lookups such as
+    s.processed["visit_type"]["category"] resolve straight to attribute
+    access on the model, and the recursive dump — a known Pydantic
+    hotspot — runs at most once, lazily, when a serialization boundary
+    asks for a plain dict via as_dict().
+    """
+
+    __slots__ = ("model", "_dump")
+
+    def __init__(self, model: Any):
+        self.model = model
+        self._dump: Optional[dict[str, Any]] = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Full model_dump() of the model, computed once and cached."""
+        if self._dump is None:
+            self._dump = self.model.model_dump(mode="python")
+        return self._dump
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self.model, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(type(self.model).model_fields)
+
+    def __len__(self) -> int:
+        return len(type(self.model).model_fields)
+
+    def __repr__(self) -> str:
+        return f"ModelView({self.model!r})"
 
 
 class GlobalState:
@@ -25,6 +136,21 @@ class GlobalState:
         >>> state.raw["age"] = 50  # Raises TypeError - raw is immutable!
     """
 
+    # One GlobalState exists per row; __slots__ drops the per-instance
+    # __dict__ (~200 bytes/row on million-row runs) and speeds up
+    # attribute access
+    __slots__ = (
+        "pk",
+        "_raw",
+        "processed",
+        "log",
+        "created_at",
+        "completed_at",
+        "_raw_dict",
+        "_dict_cache",
+        "_content_hash",
+    )
+
     def __init__(
         self,
         pk: str,
@@ -46,14 +172,43 @@ class GlobalState:
             completed_at: Timestamp when processing finished (defaults to None)
         """
         self.pk = pk
-        self._raw = MappingProxyType(raw)  # Immutable view of raw data
+        # Plain dicts are copied once into an immutable dict subclass
+        # (direct C-level lookups); read-only mapping views from sources
+        # (e.g. the SQL source's row view) are stored as-is — they
+        # already reject mutation and copying them would defeat their
+        # zero-copy purpose
+        self._raw = _FrozenDict(raw) if type(raw) is dict else raw
+        self._raw_dict: Optional[dict[str, Any]] = None  # Lazy plain-dict copy
+        self._dict_cache: Optional[dict[str, Any]] = None  # to_dict memo, terminal states only
+        self._content_hash: Optional[bytes] = None  # Lazy content_hash() memo
         self.processed = processed if processed is not None else {}
         self.log = log if log is not None else []
         self.created_at = created_at if created_at is not None else datetime.now()
         self.completed_at = completed_at
 
+    @classmethod
+    def from_trusted(cls, pk: str, raw: dict[str, Any]) -> "GlobalState":
+        """
+        Build a state around a caller-relinquished dict without copying it.
+
+        The regular constructor copies plain dicts into the frozen
+        subclass — the right default when the caller may still hold a
+        reference. Sources that build a fresh dict per row and discard
+        it immediately can skip that copy: the dict is wrapped in a
+        zero-copy read-only proxy instead, preserving the immutability
+        contract. The caller must not mutate `raw` afterwards.
+
+        Args:
+            pk: Primary key value for this row
+            raw: Freshly built dict the caller will not touch again
+
+        Returns:
+            GlobalState sharing `raw` instead of copying it
+        """
+        return cls(pk=pk, raw=MappingProxyType(raw))
+
     @property
-    def raw(self) -> MappingProxyType[str, Any]:
+    def raw(self) -> Mapping[str, Any]:
         """
         Read-only access to original source data.
 
@@ -65,12 +220,73 @@ class GlobalState:
         """
         return self._raw
 
+    def raw_as_dict(self) -> dict[str, Any]:
+        """
+        Return the raw data as a plain dict, copied once and cached.
+
+        Serialization paths (to_dict, dead-letter records) need a real
+        dict. When raw is the frozen dict subclass, it is returned
+        directly (it already is a dict and the writers encode it as
+        one); non-dict mapping views are copied once and cached. Either
+        way the result is shared across callers and must be treated as
+        read-only.
+
+        Returns:
+            Plain-dict view of the raw data (read-only by convention)
+        """
+        if self._raw_dict is None:
+            self._raw_dict = (
+                self._raw if type(self._raw) is _FrozenDict else dict(self._raw)
+            )
+        return self._raw_dict
+
+    def content_hash(self) -> bytes:
+        """
+        Stable 16-byte digest of the raw data, computed once and cached.
+
+        Dedup and caching layers that want to compare rows by content
+        (e.g. skipping LLM work for repeated source rows) can compare
+        these digests instead of walking two mappings entry by entry:
+        after the first call, equality is a 16-byte compare. The digest
+        is BLAKE2b over the canonical (sorted-key) JSON of raw, so it is
+        independent of key insertion order. raw is immutable, which is
+        what makes caching the digest safe; processed and log are
+        deliberately excluded.
+
+        Returns:
+            16-byte BLAKE2b digest of the canonical raw serialization
+        """
+        if self._content_hash is None:
+            self._content_hash = hashlib.blake2b(
+                dumps_canonical(self.raw_as_dict()), digest_size=16
+            ).digest()
+        return self._content_hash
+
+    def processed_as_dict(self) -> dict[str, Any]:
+        """
+        Return processed with any lazy model views dumped to plain dicts.
+
+        Steps store their outputs as ModelView wrappers (see ModelView);
+        serialization paths (to_dict, dead-letter records) need real
+        dicts the JSON writers can encode. Values that are already plain
+        dicts pass through untouched.
+
+        Returns:
+            Plain-dict copy of processed, one level deep
+        """
+        return {
+            key: value.as_dict() if isinstance(value, ModelView) else value
+            for key, value in self.processed.items()
+        }
+
     def to_dict(self) -> dict[str, Any]:
         """
         Serialize the complete state to a JSON-serializable dictionary.
 
-        Converts the immutable raw data back to a regular dict for serialization.
-        Datetime objects are converted to ISO format strings.
+        Converts the immutable raw data back to a regular dict for
+        serialization (cached after the first call; treat the nested
+        "raw" mapping as read-only). Datetime objects are converted to
+        ISO format strings.
 
         Returns:
             Dictionary representation of the state
@@ -84,18 +300,27 @@ class GlobalState:
             >>> state_dict["raw"]["note"]
             'Patient presents...'
         """
-        return {
+        # A set completed_at marks the state terminal: no step will touch
+        # processed or log again, so the serialized form is memoized and
+        # shared by every later caller (multi-sink writes, debug dumps).
+        # In-flight states rebuild each time since steps still mutate them.
+        if self._dict_cache is not None:
+            return self._dict_cache
+        result = {
             "pk": self.pk,
-            "raw": dict(self._raw),  # Convert MappingProxyType back to dict
-            "processed": self.processed,
+            "raw": self.raw_as_dict(),  # Cached plain-dict copy of raw
+            "processed": self.processed_as_dict(),
             "log": self.log,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
+        if self.completed_at is not None:
+            self._dict_cache = result
+        return result
 
     def to_json(self) -> str:
         """
-        Serialize the complete state to a JSON string.
+        Serialize the complete state to an indented JSON string.
 
         Returns:
             JSON string representation of the state
@@ -106,7 +331,25 @@ class GlobalState:
             >>> "enc_123" in json_str
             True
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps_bytes(self.to_dict(), pretty=True).decode("utf-8")
+
+    def dump_to(self, fp: BinaryIO, pretty: bool = False) -> None:
+        """
+        Write the serialized state directly to a binary file-like object.
+
+        Skips the intermediate Python string to_json() builds, so code
+        that persists many states (debug dumps, checkpoints) pays one
+        encode and one write per state.
+
+        Args:
+            fp: Binary file-like object opened for writing
+            pretty: When True, indent with 2 spaces for human consumption
+
+        Example:
+            >>> with open("state.json", "wb") as f:
+            ...     state.dump_to(f, pretty=True)
+        """
+        fp.write(dumps_bytes(self.to_dict(), pretty=pretty))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "GlobalState":
@@ -131,29 +374,47 @@ class GlobalState:
             >>> restored.raw["note"] == original.raw["note"]
             True
         """
-        # Parse datetime strings back to datetime objects
-        created_at = None
-        if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
-
-        completed_at = None
-        if data.get("completed_at"):
-            completed_at = datetime.fromisoformat(data["completed_at"])
+        # Timestamps may arrive as ISO strings (JSON restores) or as
+        # datetime objects (in-memory round trips); _as_datetime handles
+        # both, with string parsing memoized since bulk restores repeat
+        # the same timestamps batch after batch
+        created_at = _as_datetime(data.get("created_at"))
+        completed_at = _as_datetime(data.get("completed_at"))
 
         return cls(
             pk=data["pk"],
             raw=data["raw"],
             processed=data.get("processed", {}),
-            log=data.get("log", []),
+            # Intern restored step names: live runs append the step's own
+            # name object (shared across every row), and interning here
+            # restores that sharing for bulk replays — one string per
+            # step instead of one per row, and `step in state.log`
+            # membership checks hit the identity fast path again
+            log=[sys.intern(name) for name in data.get("log", [])],
             created_at=created_at,
             completed_at=completed_at,
         )
 
+    @staticmethod
+    def _preview(items: Any, limit: int = 4) -> list:
+        """First `limit` entries of an iterable, with a trailing ellipsis marker."""
+        preview = list(islice(items, limit + 1))
+        if len(preview) > limit:
+            preview[limit:] = ["..."]
+        return preview
+
     def __repr__(self) -> str:
-        """String representation for debugging."""
+        """
+        Bounded summary for debugging.
+
+        Wide rows can carry hundreds of columns; error logging and
+        debugger display call repr() freely, so only the first few keys
+        of each mapping (and log entries) are shown rather than a
+        listing linear in the row width.
+        """
         return (
             f"GlobalState(pk={self.pk!r}, "
-            f"raw_keys={list(self._raw.keys())}, "
-            f"processed_keys={list(self.processed.keys())}, "
-            f"log={self.log})"
+            f"raw_keys={self._preview(self._raw)}, "
+            f"processed_keys={self._preview(self.processed)}, "
+            f"log={self._preview(self.log)})"
         )
@@ -2,12 +2,37 @@
 LLM client abstraction and schema definitions.
 
 Provides a unified interface for LLM providers with retry logic and validation.
+
+Symbols are resolved lazily (PEP 562) so importing the package never
+eagerly pulls in the pydantic-backed client and schema modules.
 """
 
-from llm_etl.llm.client import LLMClient
-from llm_etl.llm.base_schemas import LLMOutputBase
+_LAZY_IMPORTS = {
+    "LLMClient": ("llm_etl.llm.client", "LLMClient"),
+    "LLMClientWithRetry": ("llm_etl.llm.client", "LLMClientWithRetry"),
+    "LLMOutputBase": ("llm_etl.llm.base_schemas", "LLMOutputBase"),
+    "MemoryCache": ("llm_etl.llm.cache", "MemoryCache"),
+    "ResponseCache": ("llm_etl.llm.cache", "ResponseCache"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
-__all__ = [
-    "LLMClient",
-    "LLMOutputBase",
-]
+__all__ = [*_LAZY_IMPORTS]
@@ -3,6 +3,11 @@ Base Pydantic schemas for LLM outputs.
 
 All LLM responses inherit from LLMOutputBase to ensure consistent
 reasoning and debugging capabilities.
+
+Output schemas are deliberately Pydantic rather than a faster struct library:
+the provider layer hands these classes to instructor as response_model, and
+the retry wrapper's error feedback loop is driven by pydantic.ValidationError.
+Schema validation is not the pipeline bottleneck — LLM round-trips are.
 """
 
 from pydantic import BaseModel, Field
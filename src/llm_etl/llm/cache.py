@@ -0,0 +1,289 @@
+"""
+On-disk response cache for LLM calls.
+
+Clinical datasets contain frequent duplicate and near-duplicate inputs
+(templated discharge summaries, repeated encounters, re-runs over the
+same extract). Caching validated LLM responses keyed by the exact prompt
+content short-circuits those calls entirely: a re-run over unchanged
+data costs zero LLM round-trips.
+
+The cache is a single SQLite file, so it is safe across processes and
+threads and needs no extra dependencies.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Protocol
+
+from llm_etl.core.serialization import dumps_bytes
+
+# Default time-to-live for cached responses: 30 days
+DEFAULT_EXPIRE_SECONDS = 30 * 86400
+
+
+def make_cache_key(messages: list[dict], schema_name: str) -> str:
+    """
+    Compute the content-hash key for a prompt.
+
+    Args:
+        messages: The exact message dicts that would be sent to the LLM
+        schema_name: Name of the response model class, so the same prompt
+                    validated against different schemas cannot collide
+
+    Returns:
+        Hex digest identifying this prompt + schema combination
+    """
+    # Hash the encoder's bytes directly: with orjson installed this skips
+    # a bytes -> str -> bytes round-trip per lookup, which adds up when
+    # messages carry multi-KB clinical notes
+    hasher = hashlib.sha256(schema_name.encode("utf-8"))
+    hasher.update(dumps_bytes(messages))
+    return hasher.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for a cache instance.
+
+    A cache only pays off when duplicates actually occur; these counters
+    make that measurable (e.g. log cache.stats after a run to decide
+    whether the cache is worth keeping for a given dataset).
+
+    Attributes:
+        hits: Number of get() calls that returned a payload
+        misses: Number of get() calls that returned None (including expiry)
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache (0.0 when never queried)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(Protocol):
+    """
+    Interface a response cache must implement.
+
+    Any object with get/set over string keys and JSON payloads can back
+    LLMClientWithRetry: the on-disk ResponseCache, the in-process
+    MemoryCache, or an external store.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached JSON payload for key, or None on miss."""
+        ...
+
+    def set(self, key: str, payload: str) -> None:
+        """Store a validated response payload under key."""
+        ...
+
+
+class MemoryCache:
+    """
+    In-process LRU cache of validated LLM responses.
+
+    Useful when duplicates cluster within a single run (no persistence
+    wanted) or as a fast tier during tests. Thread-safe; evicts the
+    least recently used entry once capacity is reached.
+
+    Example:
+        >>> client = LLMClientWithRetry(provider, cache=MemoryCache())
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum number of entries held before the least
+                     recently used one is evicted (default: 1024)
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        self.capacity = capacity
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response payload, refreshing its recency.
+
+        Args:
+            key: Content-hash key from make_cache_key()
+
+        Returns:
+            The cached JSON payload, or None on miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+            return payload
+
+    def set(self, key: str, payload: str) -> None:
+        """
+        Store a validated response payload, evicting the LRU entry if full.
+
+        Args:
+            key: Content-hash key from make_cache_key()
+            payload: JSON serialization of the validated output model
+        """
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries currently cached."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"MemoryCache(capacity={self.capacity}, size={len(self)})"
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of validated LLM responses.
+
+    Entries are keyed by a content hash of the prompt messages and the
+    response schema, so any change to the prompt (including taxonomy or
+    rule edits, which are baked into the system message) naturally misses
+    the cache. Values are the JSON serialization of the validated output
+    model.
+
+    Example:
+        >>> cache = ResponseCache("output/llm_cache.db")
+        >>> client = LLMClientWithRetry(provider, cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        expire_seconds: float = DEFAULT_EXPIRE_SECONDS,
+    ):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Path to the SQLite database file. Parent directories
+                 are created if missing.
+            expire_seconds: Time-to-live for entries. Expired entries are
+                           treated as misses and deleted lazily on access
+                           (default: 30 days)
+
+        Raises:
+            ValueError: If expire_seconds is not positive
+        """
+        if expire_seconds <= 0:
+            raise ValueError(f"expire_seconds must be > 0, got {expire_seconds}")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.expire_seconds = expire_seconds
+        self.stats = CacheStats()
+
+        # A single shared connection guarded by a lock: cache operations
+        # are short, and this avoids per-call connection setup
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    # Kept as a method for callers that already hold a cache instance
+    make_key = staticmethod(make_cache_key)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response payload.
+
+        Args:
+            key: Content-hash key from make_key()
+
+        Returns:
+            The cached JSON payload, or None on miss or expiry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            payload, created_at = row
+            if time.time() - created_at > self.expire_seconds:
+                # Lazily evict the expired entry
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats.misses += 1
+                return None
+
+            self.stats.hits += 1
+            return payload
+
+    def set(self, key: str, payload: str) -> None:
+        """
+        Store a validated response payload.
+
+        Args:
+            key: Content-hash key from make_key()
+            payload: JSON serialization of the validated output model
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"ResponseCache(path={str(self.path)!r})"
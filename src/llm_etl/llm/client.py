@@ -1,18 +1,148 @@
 """LLM client abstraction with retry logic and validation."""
 
+import asyncio
 import json
+import queue
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import TypeVar, Generic, Type
+from typing import Optional, TypeVar, Generic, Type
 from pydantic import BaseModel, ValidationError
 
 from llm_etl.core.exceptions import LLMValidationError
+from llm_etl.core.serialization import dumps_line
+from llm_etl.llm.cache import CacheBackend, make_cache_key
 
 
 T = TypeVar('T', bound=BaseModel)
 
+# Userspace write buffer for the payload log; large enough that the OS
+# write syscall happens once per many batches
+_LOG_BUFFER_SIZE = 1 << 20
+
+
+class _PayloadLogWriter:
+    """
+    Background JSONL writer for the LLM payload log.
+
+    Every LLM attempt produces a log record; serializing and appending
+    them inline puts json encoding and filesystem syscalls on the hot
+    path, worst under retries. Records are enqueued instead and a daemon
+    thread drains them in batches through a single file handle held open
+    across flushes.
+    """
+
+    # Maximum records serialized into one write call
+    _BATCH_SIZE = 256
+
+    def __init__(self, path: Path, maxsize: int = 10_000):
+        """
+        Initialize the writer and start its daemon thread.
+
+        Args:
+            path: JSONL file to append records to
+            maxsize: Queue bound; enqueue blocks (back-pressure) once the
+                    writer falls this far behind
+        """
+        self.path = path
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._loop,
+            name=f"llm-etl-payload-log:{path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def enqueue(self, record: dict) -> None:
+        """
+        Queue a log record for the background thread.
+
+        Args:
+            record: JSON-serializable log entry
+        """
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Block until all queued records have been written and flushed.
+
+        Args:
+            timeout: Unused placeholder for interface stability; joining
+                    the queue has no native timeout
+        """
+        self._queue.join()
+
+    def _loop(self) -> None:
+        """
+        Drain the queue in batches, writing each batch in one call.
+
+        The file handle stays open across flushes; the stream is flushed
+        whenever the queue goes idle so records are durable between
+        bursts. Records are accumulated into one reusable bytearray per
+        batch: extend() appends serialized lines in place and clear()
+        keeps the allocation, so steady-state batches produce no
+        intermediate join strings, and the memoryview write hands the
+        buffer to the stream without copying it.
+        """
+        buf = bytearray()
+        with open(self.path, "ab", buffering=_LOG_BUFFER_SIZE) as f:
+            while True:
+                drained = 1
+                buf += dumps_line(self._queue.get())
+                while drained < self._BATCH_SIZE:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    buf += dumps_line(record)
+                    drained += 1
+
+                f.write(memoryview(buf))
+                buf.clear()
+
+                if self._queue.empty():
+                    f.flush()
+
+                for _ in range(drained):
+                    self._queue.task_done()
+
+
+@lru_cache(maxsize=128)
+def schema_for(model_cls: Type[BaseModel]) -> dict:
+    """
+    Return the JSON schema for a response model, cached per class.
+
+    Pydantic regenerates the schema on every model_json_schema() call,
+    which is O(fields) of pure-Python work. Response models are a small
+    fixed set per pipeline, so providers that need the schema per request
+    (e.g. to embed it in a prompt or a batch request body) should go
+    through this cache instead of the model class directly.
+
+    Args:
+        model_cls: Pydantic response model class
+
+    Returns:
+        The model's JSON schema dict (shared; treat as read-only)
+    """
+    return model_cls.model_json_schema()
+
+
+@lru_cache(maxsize=128)
+def schema_json_for(model_cls: Type[BaseModel]) -> str:
+    """
+    Return the compact JSON-encoded schema for a response model, cached.
+
+    Args:
+        model_cls: Pydantic response model class
+
+    Returns:
+        The schema serialized with compact separators
+    """
+    return json.dumps(schema_for(model_cls), separators=(",", ":"))
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM client implementations."""
@@ -35,6 +165,28 @@ class LLMClient(ABC):
         """
         pass
 
+    async def acomplete(self, messages: list[dict], response_model: Type[T]) -> T:
+        """
+        Async variant of complete().
+
+        The default offloads the synchronous complete() to a worker thread,
+        so every provider is awaitable out of the box. Providers with a
+        native async client should override this to await it directly and
+        skip the thread hop entirely.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            response_model: Pydantic model class to validate response against
+
+        Returns:
+            Validated instance of response_model
+
+        Raises:
+            ValidationError: If response doesn't match schema
+            Exception: For LLM API errors
+        """
+        return await asyncio.to_thread(self.complete, messages, response_model)
+
 
 class LLMClientWithRetry:
     """
@@ -49,7 +201,9 @@ class LLMClientWithRetry:
         self,
         client: LLMClient,
         max_retries: int = 3,
-        log_dir: str = "logs"
+        log_dir: str = "logs",
+        cache: Optional[CacheBackend] = None,
+        log_level: str = "error_only",
     ):
         """
         Initialize retry wrapper.
@@ -58,12 +212,38 @@ class LLMClientWithRetry:
             client: Underlying LLMClient implementation
             max_retries: Maximum number of retry attempts after initial failure
             log_dir: Directory for logging LLM payloads
+            log_level: Which payloads to log: "error_only" (the default)
+                      records failed attempts only, "all" also records
+                      every successful attempt. Success payloads dominate
+                      log volume on healthy runs, so they are opt-in.
+            cache: Optional response cache backend (e.g. ResponseCache for
+                  on-disk persistence, MemoryCache for in-process LRU).
+                  When set, calls whose exact prompt and schema have been
+                  seen before return the cached validated response without
+                  an LLM round-trip.
+
+        Raises:
+            ValueError: If log_level is not a valid option
         """
+        valid_levels = ("error_only", "all")
+        if log_level not in valid_levels:
+            raise ValueError(
+                f"Invalid log_level: {log_level!r}. "
+                f"Must be one of: {', '.join(valid_levels)}"
+            )
+
         self.client = client
         self.max_retries = max_retries
+        self.cache = cache
+        self.log_level = log_level
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Background payload-log writer, spawned lazily on the first
+        # record so clients that never log pay nothing
+        self._log_writer: Optional[_PayloadLogWriter] = None
+        self._log_writer_lock = threading.Lock()
+
     def complete_with_validation(
         self,
         messages: list[dict],
@@ -86,8 +266,24 @@ class LLMClientWithRetry:
         Raises:
             LLMValidationError: If validation fails after all retries
         """
-        # Work with a copy to avoid mutating original
-        current_messages = messages.copy()
+        # Short-circuit on a cache hit: the payload was validated against
+        # this exact schema before being stored, so revalidation is cheap
+        # and the LLM round-trip is skipped entirely
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(messages, response_model.__name__)
+            cached_payload = self.cache.get(cache_key)
+            if cached_payload is not None:
+                return response_model.model_validate_json(cached_payload)
+
+        # With retries disabled there is exactly one attempt: skip the
+        # loop, the error accumulator and the feedback-copy bookkeeping
+        if self.max_retries == 0:
+            return self._complete_once(messages, response_model, step_name, pk, cache_key)
+
+        # Most rows succeed on the first attempt, so defer copying the
+        # message list until a retry actually needs to append feedback
+        current_messages = messages
         accumulated_errors = []
 
         for attempt in range(self.max_retries + 1):
@@ -100,26 +296,230 @@ class LLMClientWithRetry:
                 response = self.client.complete(current_messages, response_model)
                 latency_ms = int((time.time() - start_time) * 1000)
 
-                # Log successful attempt
+                # Success payloads are logged only when opted in; on
+                # healthy runs they dominate log volume
+                if self.log_level == "all":
+                    self._log_payload(
+                        step_name=step_name,
+                        pk=pk,
+                        messages=current_messages,
+                        response=response.model_dump() if response else None,
+                        retry_count=attempt,
+                        latency_ms=latency_ms,
+                        error=None
+                    )
+
+                # Success! Cache the validated response for duplicate inputs
+                if cache_key is not None:
+                    self.cache.set(cache_key, response.model_dump_json())
+
+                return response
+
+            except ValidationError as e:
+                latency_ms = int((time.time() - start_time) * 1000)
+                # Compact per-field details instead of str(e): cheaper to
+                # build, and capping at the first few errors bounds prompt
+                # growth when the feedback is sent back to the model
+                error_details = e.errors(include_url=False, include_context=False)
+                error_msg = json.dumps(error_details[:3], default=str)
+                accumulated_errors.append(error_msg)
+
+                # Log failed attempt
+                self._log_payload(
+                    step_name=step_name,
+                    pk=pk,
+                    messages=current_messages,
+                    response=None,
+                    retry_count=attempt,
+                    latency_ms=latency_ms,
+                    error=error_msg
+                )
+
+                # If we have retries left, append error and try again
+                if attempt < self.max_retries:
+                    retry_message = {
+                        "role": "user",
+                        "content": f"Your previous response failed validation: {error_msg}. Please fix and try again."
+                    }
+                    # Copy lazily so the caller's list is never mutated
+                    if current_messages is messages:
+                        current_messages = list(messages)
+                    current_messages.append(retry_message)
+                else:
+                    # Out of retries
+                    raise LLMValidationError(
+                        step_name=step_name,
+                        pk=pk,
+                        validation_errors=accumulated_errors,
+                        retry_count=self.max_retries + 1
+                    )
+
+            except Exception as e:
+                # Non-validation errors (API errors, etc.)
+                latency_ms = int((time.time() - start_time) * 1000)
+                error_msg = f"{type(e).__name__}: {str(e)}"
+
                 self._log_payload(
                     step_name=step_name,
                     pk=pk,
                     messages=current_messages,
-                    response=response.model_dump() if response else None,
+                    response=None,
                     retry_count=attempt,
                     latency_ms=latency_ms,
-                    error=None
+                    error=error_msg
                 )
 
-                # Success!
+                # Re-raise non-validation errors immediately
+                raise
+
+    def _complete_once(
+        self,
+        messages: list[dict],
+        response_model: Type[T],
+        step_name: str,
+        pk: str,
+        cache_key: Optional[str],
+    ) -> T:
+        """
+        Single-attempt completion for the max_retries == 0 configuration.
+
+        Same logging, caching and error semantics as one iteration of the
+        retry loop, without its per-call bookkeeping.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            response_model: Pydantic model class to validate response against
+            step_name: Name of the pipeline step (for logging)
+            pk: Primary key of the record being processed (for logging)
+            cache_key: Precomputed cache key, or None when caching is off
+
+        Returns:
+            Validated instance of response_model
+
+        Raises:
+            LLMValidationError: If the single attempt fails validation
+        """
+        start_time = time.time()
+
+        try:
+            response = self.client.complete(messages, response_model)
+
+        except ValidationError as e:
+            latency_ms = int((time.time() - start_time) * 1000)
+            error_details = e.errors(include_url=False, include_context=False)
+            error_msg = json.dumps(error_details[:3], default=str)
+            self._log_payload(
+                step_name=step_name,
+                pk=pk,
+                messages=messages,
+                response=None,
+                retry_count=0,
+                latency_ms=latency_ms,
+                error=error_msg
+            )
+            raise LLMValidationError(
+                step_name=step_name,
+                pk=pk,
+                validation_errors=[error_msg],
+                retry_count=1
+            )
+
+        except Exception as e:
+            latency_ms = int((time.time() - start_time) * 1000)
+            self._log_payload(
+                step_name=step_name,
+                pk=pk,
+                messages=messages,
+                response=None,
+                retry_count=0,
+                latency_ms=latency_ms,
+                error=f"{type(e).__name__}: {str(e)}"
+            )
+            raise
+
+        if self.log_level == "all":
+            latency_ms = int((time.time() - start_time) * 1000)
+            self._log_payload(
+                step_name=step_name,
+                pk=pk,
+                messages=messages,
+                response=response.model_dump() if response else None,
+                retry_count=0,
+                latency_ms=latency_ms,
+                error=None
+            )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.model_dump_json())
+
+        return response
+
+    async def acomplete_with_validation(
+        self,
+        messages: list[dict],
+        response_model: Type[T],
+        step_name: str,
+        pk: str
+    ) -> T:
+        """
+        Async mirror of complete_with_validation().
+
+        Same cache short-circuit, retry-with-feedback and logging semantics,
+        but awaits the provider's acomplete() instead of blocking, so many
+        rows can be in flight on one event loop. Providers without a native
+        async client fall back to LLMClient.acomplete's thread offload.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            response_model: Pydantic model class to validate response against
+            step_name: Name of the pipeline step (for logging)
+            pk: Primary key of the record being processed (for logging)
+
+        Returns:
+            Validated instance of response_model
+
+        Raises:
+            LLMValidationError: If validation fails after all retries
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(messages, response_model.__name__)
+            cached_payload = self.cache.get(cache_key)
+            if cached_payload is not None:
+                return response_model.model_validate_json(cached_payload)
+
+        current_messages = messages
+        accumulated_errors = []
+
+        for attempt in range(self.max_retries + 1):
+            start_time = time.time()
+
+            try:
+                response = await self.client.acomplete(current_messages, response_model)
+                latency_ms = int((time.time() - start_time) * 1000)
+
+                if self.log_level == "all":
+                    self._log_payload(
+                        step_name=step_name,
+                        pk=pk,
+                        messages=current_messages,
+                        response=response.model_dump() if response else None,
+                        retry_count=attempt,
+                        latency_ms=latency_ms,
+                        error=None
+                    )
+
+                if cache_key is not None:
+                    self.cache.set(cache_key, response.model_dump_json())
+
                 return response
 
             except ValidationError as e:
                 latency_ms = int((time.time() - start_time) * 1000)
-                error_msg = str(e)
+                error_details = e.errors(include_url=False, include_context=False)
+                error_msg = json.dumps(error_details[:3], default=str)
                 accumulated_errors.append(error_msg)
 
-                # Log failed attempt
                 self._log_payload(
                     step_name=step_name,
                     pk=pk,
@@ -130,15 +530,15 @@ class LLMClientWithRetry:
                     error=error_msg
                 )
 
-                # If we have retries left, append error and try again
                 if attempt < self.max_retries:
                     retry_message = {
                         "role": "user",
                         "content": f"Your previous response failed validation: {error_msg}. Please fix and try again."
                     }
+                    if current_messages is messages:
+                        current_messages = list(messages)
                     current_messages.append(retry_message)
                 else:
-                    # Out of retries
                     raise LLMValidationError(
                         step_name=step_name,
                         pk=pk,
@@ -147,7 +547,6 @@ class LLMClientWithRetry:
                     )
 
             except Exception as e:
-                # Non-validation errors (API errors, etc.)
                 latency_ms = int((time.time() - start_time) * 1000)
                 error_msg = f"{type(e).__name__}: {str(e)}"
 
@@ -161,9 +560,67 @@ class LLMClientWithRetry:
                     error=error_msg
                 )
 
-                # Re-raise non-validation errors immediately
                 raise
 
+    async def acomplete_batch_with_validation(
+        self,
+        messages_list: list[list[dict]],
+        response_model: Type[T],
+        step_name: str,
+        pks: list[str],
+        concurrency: int = 8,
+    ) -> list[T]:
+        """
+        Validate-complete many prompts concurrently in one call.
+
+        Issues acomplete_with_validation() for every prompt under a
+        bounded semaphore, so the per-request overhead (connection setup,
+        request framing, server queueing) overlaps across rows instead of
+        accumulating serially. Each prompt keeps its own cache lookup,
+        retry-with-feedback loop and logging; results come back in input
+        order. A failure in any prompt propagates after the gather
+        completes.
+
+        Args:
+            messages_list: One message list per prompt, in row order
+            response_model: Pydantic model class to validate responses against
+            step_name: Name of the pipeline step (for logging)
+            pks: Primary keys aligned with messages_list (for logging)
+            concurrency: Maximum prompts in flight at once (default: 8)
+
+        Returns:
+            Validated response_model instances, in input order
+
+        Raises:
+            ValueError: If pks and messages_list lengths differ or
+                       concurrency is not positive
+            LLMValidationError: If any prompt fails validation after all retries
+        """
+        if len(messages_list) != len(pks):
+            raise ValueError(
+                f"messages_list and pks must align: "
+                f"{len(messages_list)} != {len(pks)}"
+            )
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(messages: list[dict], pk: str) -> T:
+            async with semaphore:
+                return await self.acomplete_with_validation(
+                    messages=messages,
+                    response_model=response_model,
+                    step_name=step_name,
+                    pk=pk,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(bounded(messages, pk) for messages, pk in zip(messages_list, pks))
+            )
+        )
+
     def _log_payload(
         self,
         step_name: str,
@@ -187,19 +644,42 @@ class LLMClientWithRetry:
             error: Error message if request failed
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Passed as a datetime; the JSONL writer serializes it to ISO
+            # 8601 natively, keeping string formatting off the hot path
+            "timestamp": datetime.now(timezone.utc),
             "step": step_name,
             "pk": pk,
-            "request": {"messages": messages},
+            # Snapshot the message list before handing it to the writer
+            # thread: the retry loops append feedback messages to the
+            # same list across attempts, and a live reference would let
+            # a late serialization log attempt N with attempt N+1's
+            # feedback. The dicts themselves are never mutated, so a
+            # shallow copy is enough.
+            "request": {"messages": list(messages)},
             "response": response,
             "retry_count": retry_count,
             "latency_ms": latency_ms,
             "error": error
         }
 
-        log_file = self.log_dir / "llm_payloads.jsonl"
+        # Hand off to the background writer; serialization and the file
+        # append happen off the hot path
+        if self._log_writer is None:
+            with self._log_writer_lock:
+                if self._log_writer is None:
+                    self._log_writer = _PayloadLogWriter(
+                        self.log_dir / "llm_payloads.jsonl"
+                    )
+
+        self._log_writer.enqueue(log_entry)
 
-        # Use append mode for concurrent writes
-        # Each write is a single line, which is atomic on most filesystems
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    def flush_logs(self) -> None:
+        """
+        Block until all queued payload-log records are on disk.
+
+        The pipeline calls this when a run finishes (including on
+        interrupt) so the payload log is complete before the process
+        exits. Safe to call when nothing was ever logged.
+        """
+        if self._log_writer is not None:
+            self._log_writer.flush()
@@ -2,12 +2,35 @@
 LLM provider implementations.
 
 Concrete implementations of LLM providers for different backends.
+
+Symbols are resolved lazily (PEP 562) so importing the package — e.g.
+for MockProvider in tests — never pulls in the Azure provider's heavy
+dependencies (openai, instructor, httpx).
 """
 
-from llm_etl.llm.providers.mock import MockProvider
-from llm_etl.llm.providers.azure_openai import AzureOpenAIProvider
+_LAZY_IMPORTS = {
+    "MockProvider": ("llm_etl.llm.providers.mock", "MockProvider"),
+    "AzureOpenAIProvider": ("llm_etl.llm.providers.azure_openai", "AzureOpenAIProvider"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
-__all__ = [
-    "MockProvider",
-    "AzureOpenAIProvider",
-]
+__all__ = [*_LAZY_IMPORTS]
@@ -1,13 +1,19 @@
 """Azure OpenAI provider with instructor integration and retry logic."""
 
+import asyncio
+import functools
+import io
+import json
 import logging
 import os
 import random
+import threading
 import time
 from typing import Type, TypeVar
 
+import httpx
 import instructor
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 from openai import RateLimitError, APIError, APIConnectionError, APITimeoutError
 from pydantic import BaseModel
 
@@ -18,6 +24,70 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Shared HTTP transports, keyed by timeout. The pooled httpx.Client (and
+# its warm TCP+TLS connections) is the expensive resource; sharing it
+# across provider instances means callers that construct a provider per
+# request (common in function apps) still reuse connections instead of
+# paying a handshake per instantiation.
+_HTTP_CLIENT_POOL: dict[float, httpx.Client] = {}
+_HTTP_POOL_LOCK = threading.Lock()
+
+# Ceiling on any single retry sleep
+MAX_BACKOFF = 60.0
+
+
+@functools.cache
+def _azure_defaults() -> dict[str, str | None]:
+    """
+    Read the Azure OpenAI environment variables once per process.
+
+    Providers are often constructed per test or per function-app request;
+    caching the lookups avoids re-reading four environment variables each
+    time. The environment is snapshotted on first call — tests that
+    monkeypatch these variables should call _azure_defaults.cache_clear().
+
+    Returns:
+        Dict of endpoint/api_key/deployment/api_version values (None when
+        unset, except api_version which has a default)
+    """
+    return {
+        "endpoint": os.getenv("AZURE_OPENAI_ENDPOINT"),
+        "api_key": os.getenv("AZURE_OPENAI_API_KEY"),
+        "deployment": os.getenv("AZURE_OPENAI_DEPLOYMENT"),
+        "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
+    }
+
+
+def _validate_config(
+    endpoint: str | None,
+    api_key: str | None,
+    deployment: str | None,
+) -> None:
+    """
+    Raise if any required Azure OpenAI setting is missing.
+
+    Args:
+        endpoint: Resolved endpoint URL
+        api_key: Resolved API key
+        deployment: Resolved deployment name
+
+    Raises:
+        ValueError: Naming every missing setting's environment variable
+    """
+    missing = []
+    if not endpoint:
+        missing.append("AZURE_OPENAI_ENDPOINT")
+    if not api_key:
+        missing.append("AZURE_OPENAI_API_KEY")
+    if not deployment:
+        missing.append("AZURE_OPENAI_DEPLOYMENT")
+
+    if missing:
+        raise ValueError(
+            f"Missing required Azure OpenAI configuration: {', '.join(missing)}. "
+            f"Please set environment variables or pass values to constructor."
+        )
+
 
 class AzureOpenAIProvider(LLMClient):
     """
@@ -31,6 +101,12 @@ class AzureOpenAIProvider(LLMClient):
     - Configurable timeouts and token limits
     """
 
+    # Client-error statuses where retrying cannot change the outcome
+    _FATAL_STATUSES = frozenset({400, 401, 403, 404, 422})
+
+    # Transient server-side statuses worth retrying
+    _RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
     def __init__(
         self,
         endpoint: str | None = None,
@@ -52,45 +128,241 @@ class AzureOpenAIProvider(LLMClient):
         Raises:
             ValueError: If required configuration is missing
         """
-        # Read from environment with fallbacks
-        self.endpoint = endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
-        self.api_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
-        self.deployment = deployment or os.getenv("AZURE_OPENAI_DEPLOYMENT")
-        self.api_version = api_version or os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+        # Read from environment with fallbacks (env values are cached
+        # process-wide; see _azure_defaults)
+        defaults = _azure_defaults()
+        self.endpoint = endpoint or defaults["endpoint"]
+        self.api_key = api_key or defaults["api_key"]
+        self.deployment = deployment or defaults["deployment"]
+        self.api_version = api_version or defaults["api_version"]
 
         self.timeout = timeout
 
         # Validate required parameters
-        missing = []
-        if not self.endpoint:
-            missing.append("AZURE_OPENAI_ENDPOINT")
-        if not self.api_key:
-            missing.append("AZURE_OPENAI_API_KEY")
-        if not self.deployment:
-            missing.append("AZURE_OPENAI_DEPLOYMENT")
-
-        if missing:
-            raise ValueError(
-                f"Missing required Azure OpenAI configuration: {', '.join(missing)}. "
-                f"Please set environment variables or pass values to constructor."
+        _validate_config(self.endpoint, self.api_key, self.deployment)
+
+        # Clients are built lazily on first use: __init__ only stores and
+        # validates config, so constructing a provider that is never
+        # called (CLI --help paths, test fixtures, config validation)
+        # skips the AzureOpenAI setup and the instructor patch entirely.
+        self._http_client = None
+        self._azure_client = None
+        self._instructor_client = None
+        self._sync_client_lock = threading.Lock()
+
+        # Async counterpart, built lazily on the first acomplete() call so
+        # sync-only pipelines never pay for a second client and transport
+        self._async_client = None
+        self._async_client_lock = threading.Lock()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Initialized AzureOpenAIProvider: deployment=%s, "
+                "api_version=%s, timeout=%ss",
+                self.deployment, self.api_version, self.timeout,
             )
 
-        # Initialize Azure OpenAI client
-        azure_client = AzureOpenAI(
-            azure_endpoint=self.endpoint,
-            api_key=self.api_key,
-            api_version=self.api_version,
-            timeout=self.timeout
+    @classmethod
+    def validate_env(cls) -> None:
+        """
+        Check the Azure OpenAI environment without building a provider.
+
+        Call once at process start (e.g. before scheduling a long run) to
+        fail fast on missing configuration instead of at the first
+        provider construction.
+
+        Raises:
+            ValueError: If any required environment variable is unset
+        """
+        defaults = _azure_defaults()
+        _validate_config(
+            defaults["endpoint"], defaults["api_key"], defaults["deployment"]
         )
 
-        # Patch with instructor for structured outputs
-        self.client = instructor.from_openai(azure_client)
+    @staticmethod
+    def _build_http_client(timeout: float) -> httpx.Client:
+        """
+        Build the shared pooled HTTP client for all API calls.
 
-        logger.info(
-            f"Initialized AzureOpenAIProvider: deployment={self.deployment}, "
-            f"api_version={self.api_version}, timeout={self.timeout}s"
+        Enables HTTP/2 when the optional 'h2' package is installed,
+        falling back to pooled HTTP/1.1 otherwise.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            Configured httpx.Client
+        """
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+        try:
+            return httpx.Client(http2=True, timeout=timeout, limits=limits)
+        except ImportError:
+            # httpx raises ImportError for http2=True without 'h2'
+            return httpx.Client(timeout=timeout, limits=limits)
+
+    @classmethod
+    def _shared_http_client(cls, timeout: float) -> httpx.Client:
+        """
+        Return the pooled HTTP client for a timeout, creating it on first use.
+
+        Args:
+            timeout: Request timeout in seconds (the pool key; only the
+                    transport settings matter, not endpoint or credentials)
+
+        Returns:
+            Shared httpx.Client for all providers with this timeout
+        """
+        with _HTTP_POOL_LOCK:
+            client = _HTTP_CLIENT_POOL.get(timeout)
+            if client is None or client.is_closed:
+                client = cls._build_http_client(timeout)
+                _HTTP_CLIENT_POOL[timeout] = client
+            return client
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Close every pooled HTTP client and empty the pool.
+
+        Intended for process shutdown (or test teardown). Providers built
+        afterwards transparently get fresh clients.
+        """
+        with _HTTP_POOL_LOCK:
+            for client in _HTTP_CLIENT_POOL.values():
+                client.close()
+            _HTTP_CLIENT_POOL.clear()
+
+    @staticmethod
+    def _build_async_http_client(timeout: float) -> httpx.AsyncClient:
+        """
+        Build a pooled async HTTP client, mirroring _build_http_client.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            Configured httpx.AsyncClient
+        """
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+        try:
+            return httpx.AsyncClient(http2=True, timeout=timeout, limits=limits)
+        except ImportError:
+            return httpx.AsyncClient(timeout=timeout, limits=limits)
+
+    @staticmethod
+    def _retry_delay(error: Exception, prev_delay: float, base_delay: float) -> float:
+        """
+        Compute the backoff delay for a retryable error.
+
+        Uses decorrelated jitter — uniform(base, prev*3), capped at
+        MAX_BACKOFF — rather than exponential-plus-uniform(0,1): under
+        heavy contention it spreads concurrent workers' retries across
+        the whole window instead of clustering them near the exponential
+        steps, so fewer retries land on the same instant.
+
+        Azure OpenAI's 429 (and throttled 503) responses additionally
+        carry a Retry-After / retry-after-ms header saying exactly when
+        capacity returns; sleeping less guarantees another 429. When the
+        header is present the server's figure acts as a floor, with
+        jitter scaled down so short server waits aren't overshot.
+
+        Args:
+            error: The exception raised by the SDK
+            prev_delay: Delay used for the previous attempt (base_delay
+                       before the first retry); feed the returned value
+                       back in on the next iteration
+            base_delay: Minimum backoff in seconds
+
+        Returns:
+            Seconds to sleep before the next attempt
+        """
+        delay = min(MAX_BACKOFF, random.uniform(base_delay, prev_delay * 3))
+
+        server_delay = None
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            raw_ms = headers.get("retry-after-ms")
+            raw_s = headers.get("retry-after")
+            try:
+                if raw_ms is not None:
+                    server_delay = float(raw_ms) / 1000.0
+                elif raw_s is not None:
+                    # May be an HTTP-date rather than seconds; ignore those
+                    server_delay = float(raw_s)
+            except ValueError:
+                server_delay = None
+
+        if server_delay is None:
+            return delay
+        return max(server_delay, delay) + random.uniform(
+            0, min(1.0, server_delay * 0.1)
         )
 
+    def _ensure_sync_client(self) -> None:
+        """
+        Build the sync AzureOpenAI client and its instructor wrapper once.
+
+        The HTTP transport comes from the module-level pool: under
+        concurrent row processing, per-call TCP+TLS handshakes dominate
+        small requests, and a shared client with generous keepalive
+        reuses connections (avoiding TIME_WAIT exhaustion on large runs).
+        HTTP/2 multiplexes calls over one TLS connection when 'h2' is
+        installed.
+        """
+        if self._instructor_client is not None:
+            return
+        with self._sync_client_lock:
+            if self._instructor_client is not None:
+                return
+
+            self._http_client = self._shared_http_client(self.timeout)
+            azure_client = AzureOpenAI(
+                azure_endpoint=self.endpoint,
+                api_key=self.api_key,
+                api_version=self.api_version,
+                timeout=self.timeout,
+                http_client=self._http_client,
+            )
+            # Keep the raw client for non-chat endpoints (files, batches);
+            # assign it before the instructor wrapper, which doubles as
+            # the "built" flag for the fast path above
+            self._azure_client = azure_client
+            self._instructor_client = instructor.from_openai(azure_client)
+
+    @property
+    def client(self):
+        """Instructor-patched chat client, built on first access."""
+        self._ensure_sync_client()
+        return self._instructor_client
+
+    @property
+    def _raw_client(self) -> AzureOpenAI:
+        """Unpatched AzureOpenAI client for files/batch endpoints."""
+        self._ensure_sync_client()
+        return self._azure_client
+
+    def _ensure_async_client(self):
+        """
+        Build the instructor-patched AsyncAzureOpenAI client on first use.
+
+        Returns:
+            The shared async client for this provider instance
+        """
+        if self._async_client is None:
+            with self._async_client_lock:
+                if self._async_client is None:
+                    self._async_client = instructor.from_openai(
+                        AsyncAzureOpenAI(
+                            azure_endpoint=self.endpoint,
+                            api_key=self.api_key,
+                            api_version=self.api_version,
+                            timeout=self.timeout,
+                            http_client=self._build_async_http_client(self.timeout),
+                        )
+                    )
+        return self._async_client
+
     def complete(self, messages: list[dict], response_model: Type[T]) -> T:
         """
         Send messages to Azure OpenAI and return validated structured response.
@@ -114,6 +386,7 @@ class AzureOpenAIProvider(LLMClient):
         """
         max_retries = 5
         base_delay = 1.0  # Start with 1 second
+        prev_delay = base_delay  # Decorrelated-jitter state
 
         for attempt in range(max_retries + 1):
             try:
@@ -130,41 +403,323 @@ class AzureOpenAIProvider(LLMClient):
 
             except RateLimitError as e:
                 if attempt < max_retries:
-                    # Exponential backoff with jitter
-                    delay = (base_delay * (2 ** attempt)) + random.uniform(0, 1)
+                    # Server-guided delay when a Retry-After header is
+                    # present, exponential backoff with jitter otherwise
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
+                    logger.warning(
+                        "Rate limit hit (429) on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s",
+                        attempt + 1, max_retries + 1, delay, e,
+                    )
+                    time.sleep(delay)
+                else:
+                    logger.error(
+                        "Rate limit persisted after %d attempts. Giving up.",
+                        max_retries + 1,
+                    )
+                    raise
+
+            except (APIConnectionError, APITimeoutError) as e:
+                # Connection issues and timeouts are always worth retrying
+                if attempt < max_retries:
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
                     logger.warning(
-                        f"Rate limit hit (429) on attempt {attempt + 1}/{max_retries + 1}. "
-                        f"Retrying in {delay:.2f}s... Error: {str(e)}"
+                        "Transient API error on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s: %s",
+                        attempt + 1, max_retries + 1, delay, type(e).__name__, e,
                     )
                     time.sleep(delay)
                 else:
                     logger.error(
-                        f"Rate limit persisted after {max_retries + 1} attempts. Giving up."
+                        "API error persisted after %d attempts. Error: %s: %s",
+                        max_retries + 1, type(e).__name__, e,
                     )
                     raise
 
-            except (APIError, APIConnectionError, APITimeoutError) as e:
-                # Handle transient errors (500, 503, connection issues, timeouts)
-                if attempt < max_retries and self._is_retryable_error(e):
-                    # Exponential backoff with jitter
-                    delay = (base_delay * (2 ** attempt)) + random.uniform(0, 1)
+            except APIError as e:
+                status = getattr(e, "status_code", None)
+                if status in self._FATAL_STATUSES:
+                    # Bad request / auth / not found: retrying cannot help,
+                    # so fail fast without burning attempts or sleeping
+                    logger.error(
+                        "Non-retryable API error (HTTP %s): %s: %s",
+                        status, type(e).__name__, e,
+                    )
+                    raise
+                if attempt < max_retries and (
+                    status is None or status in self._RETRYABLE_STATUSES
+                ):
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
                     logger.warning(
-                        f"Transient API error on attempt {attempt + 1}/{max_retries + 1}. "
-                        f"Retrying in {delay:.2f}s... Error: {type(e).__name__}: {str(e)}"
+                        "Transient API error on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s: %s",
+                        attempt + 1, max_retries + 1, delay, type(e).__name__, e,
                     )
                     time.sleep(delay)
                 else:
                     logger.error(
-                        f"API error persisted after {max_retries + 1} attempts or non-retryable. "
-                        f"Error: {type(e).__name__}: {str(e)}"
+                        "API error persisted after %d attempts or non-retryable. "
+                        "Error: %s: %s",
+                        max_retries + 1, type(e).__name__, e,
                     )
                     raise
 
             except Exception as e:
                 # Non-retryable errors (validation errors, etc.) - let them propagate
-                logger.error(f"Non-retryable error in Azure OpenAI call: {type(e).__name__}: {str(e)}")
+                logger.error(
+                    "Non-retryable error in Azure OpenAI call: %s: %s",
+                    type(e).__name__, e,
+                )
+                raise
+
+    async def acomplete(self, messages: list[dict], response_model: Type[T]) -> T:
+        """
+        Async variant of complete() backed by AsyncAzureOpenAI.
+
+        Awaits the request instead of blocking a thread, so a batch of
+        rows can be dispatched with asyncio.gather and overlap their
+        network waits on one event loop. Same rate-limit and transient
+        error backoff as complete(), with non-blocking sleeps.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            response_model: Pydantic model class to validate response against
+
+        Returns:
+            Validated instance of response_model
+
+        Raises:
+            RateLimitError: If rate limits persist after all retries
+            APIError: If API errors persist after all retries
+            ValidationError: If response doesn't match schema (instructor handles this)
+        """
+        client = self._ensure_async_client()
+        max_retries = 5
+        base_delay = 1.0
+        prev_delay = base_delay  # Decorrelated-jitter state
+
+        for attempt in range(max_retries + 1):
+            try:
+                return await client.chat.completions.create(
+                    model=self.deployment,
+                    messages=messages,
+                    response_model=response_model,
+                    timeout=self.timeout
+                )
+
+            except RateLimitError as e:
+                if attempt < max_retries:
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
+                    logger.warning(
+                        "Rate limit hit (429) on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s",
+                        attempt + 1, max_retries + 1, delay, e,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(
+                        "Rate limit persisted after %d attempts. Giving up.",
+                        max_retries + 1,
+                    )
+                    raise
+
+            except (APIConnectionError, APITimeoutError) as e:
+                # Connection issues and timeouts are always worth retrying
+                if attempt < max_retries:
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
+                    logger.warning(
+                        "Transient API error on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s: %s",
+                        attempt + 1, max_retries + 1, delay, type(e).__name__, e,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(
+                        "API error persisted after %d attempts. Error: %s: %s",
+                        max_retries + 1, type(e).__name__, e,
+                    )
+                    raise
+
+            except APIError as e:
+                status = getattr(e, "status_code", None)
+                if status in self._FATAL_STATUSES:
+                    # Bad request / auth / not found: retrying cannot help,
+                    # so fail fast without burning attempts or sleeping
+                    logger.error(
+                        "Non-retryable API error (HTTP %s): %s: %s",
+                        status, type(e).__name__, e,
+                    )
+                    raise
+                if attempt < max_retries and (
+                    status is None or status in self._RETRYABLE_STATUSES
+                ):
+                    delay = prev_delay = self._retry_delay(e, prev_delay, base_delay)
+                    logger.warning(
+                        "Transient API error on attempt %d/%d. "
+                        "Retrying in %.2fs... Error: %s: %s",
+                        attempt + 1, max_retries + 1, delay, type(e).__name__, e,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(
+                        "API error persisted after %d attempts or non-retryable. "
+                        "Error: %s: %s",
+                        max_retries + 1, type(e).__name__, e,
+                    )
+                    raise
+
+            except Exception as e:
+                logger.error(
+                    "Non-retryable error in Azure OpenAI call: %s: %s",
+                    type(e).__name__, e,
+                )
                 raise
 
+    def submit_batch(self, requests: list[dict]) -> str:
+        """
+        Submit requests to the Azure OpenAI Batch API.
+
+        Batch jobs run offline at roughly half the cost of synchronous calls
+        and with higher sustained throughput, which suits non-interactive
+        bulk runs (e.g. nightly enrichment).
+
+        Args:
+            requests: List of dicts with "custom_id" and "messages" keys.
+                     custom_id is echoed back in the results so callers can
+                     match responses to rows. When "response_schema" (a JSON
+                     schema dict) and "response_schema_name" are present,
+                     the request asks for strict schema-constrained decoding
+                     so the model cannot produce the wrong shape; otherwise
+                     plain JSON mode is used.
+
+        Returns:
+            The batch job id to poll with wait_for_batch()
+
+        Raises:
+            APIError: If the file upload or batch creation fails
+        """
+        lines = []
+        for request in requests:
+            schema = request.get("response_schema")
+            if schema is not None:
+                response_format = {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": request.get("response_schema_name", "response"),
+                        "schema": schema,
+                        "strict": True,
+                    },
+                }
+            else:
+                response_format = {"type": "json_object"}
+
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": request["custom_id"],
+                        "method": "POST",
+                        "url": "/chat/completions",
+                        "body": {
+                            "model": self.deployment,
+                            "messages": request["messages"],
+                            "response_format": response_format,
+                        },
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+        payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+        payload.name = "batch_requests.jsonl"
+
+        input_file = self._raw_client.files.create(file=payload, purpose="batch")
+        batch = self._raw_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+
+        logger.info(
+            f"Submitted batch job {batch.id} with {len(requests)} requests"
+        )
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: float = 86400.0,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """
+        Poll a batch job until it finishes and collect its results.
+
+        Args:
+            batch_id: Batch job id returned by submit_batch()
+            poll_interval: Seconds between status polls
+            timeout: Maximum seconds to wait before giving up
+
+        Returns:
+            Tuple of (results, errors): results maps custom_id to the raw
+            response content string; errors maps custom_id to an error message
+            for requests that failed server-side.
+
+        Raises:
+            TimeoutError: If the job does not finish within timeout
+            RuntimeError: If the job ends in a failed/expired/cancelled state
+        """
+        deadline = time.time() + timeout
+
+        while True:
+            batch = self._raw_client.batches.retrieve(batch_id)
+
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(
+                    f"Batch job {batch_id} ended with status '{batch.status}'"
+                )
+            if time.time() >= deadline:
+                raise TimeoutError(
+                    f"Batch job {batch_id} did not finish within {timeout:.0f}s "
+                    f"(last status: '{batch.status}')"
+                )
+
+            logger.debug(f"Batch job {batch_id} status: {batch.status}")
+            time.sleep(poll_interval)
+
+        results: dict[str, str] = {}
+        errors: dict[str, str] = {}
+
+        if batch.output_file_id:
+            content = self._raw_client.files.content(batch.output_file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                custom_id = record["custom_id"]
+                response = record.get("response")
+                if response and response.get("status_code") == 200:
+                    results[custom_id] = (
+                        response["body"]["choices"][0]["message"]["content"]
+                    )
+                else:
+                    errors[custom_id] = f"HTTP {response.get('status_code') if response else 'unknown'}"
+
+        if batch.error_file_id:
+            content = self._raw_client.files.content(batch.error_file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                error = record.get("error") or {}
+                errors[record["custom_id"]] = error.get("message", "unknown batch error")
+
+        logger.info(
+            f"Batch job {batch_id} completed: {len(results)} results, "
+            f"{len(errors)} errors"
+        )
+        return results, errors
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """
         Determine if an error is retryable.
@@ -175,16 +730,15 @@ class AzureOpenAIProvider(LLMClient):
         Returns:
             True if error is retryable (500, 503, connection issues)
         """
-        # APIError includes 500, 503, etc.
-        if isinstance(error, APIError):
-            # Check status code if available
-            if hasattr(error, 'status_code'):
-                return error.status_code in [500, 502, 503, 504]
-            # If no status code, assume retryable
-            return True
-
-        # Connection errors and timeouts are retryable
+        # Connection errors and timeouts are retryable (checked first:
+        # they subclass APIError in the SDK)
         if isinstance(error, (APIConnectionError, APITimeoutError)):
             return True
 
+        # APIError includes 500, 503, etc.
+        if isinstance(error, APIError):
+            # Check status code if available; if absent, assume retryable
+            status = getattr(error, "status_code", None)
+            return status is None or status in self._RETRYABLE_STATUSES
+
         return False
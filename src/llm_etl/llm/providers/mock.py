@@ -1,5 +1,8 @@
 """Mock LLM provider for testing without API calls."""
 
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Type, TypeVar
 from pydantic import BaseModel
 
@@ -9,6 +12,28 @@ from llm_etl.llm.client import LLMClient
 T = TypeVar('T', bound=BaseModel)
 
 
+@lru_cache(maxsize=32)
+def _get_validator(model_cls: type[BaseModel]):
+    """
+    Return the model's core validator handle, memoized per class.
+
+    model_validate() resolves the classmethod and parses kwargs on every
+    call; binding __pydantic_validator__ once per model class lets the
+    hot path call validate_python directly.
+    """
+    return model_cls.__pydantic_validator__
+
+# Matches "Step: classifier" / "step_name: classifier" lines, with optional
+# quoting around the value. One compiled C-level scan per message replaces
+# the previous lower() + split("\n") + per-line substring checks.
+_STEP_NAME_RE = re.compile(
+    r"(?im)^.*?step(?:_name)?\s*:\s*[\"']?([^\"'\n]+?)[\"']?\s*$"
+)
+
+# Bound on the per-provider step-name memo
+_STEP_NAME_CACHE_SIZE = 1024
+
+
 class MockProvider(LLMClient):
     """
     Mock LLM client that returns predefined responses.
@@ -37,6 +62,46 @@ class MockProvider(LLMClient):
         self.fail_validation_times = fail_validation_times
         self._failure_count: dict[str, int] = {}
 
+        # Memo of message-content hash -> extracted step name: tests often
+        # replay identical prompts thousands of times, and each replay
+        # would otherwise rescan every message. Bounded LRU; cleared by
+        # set_response() since tests mutate responses between replays.
+        self._step_name_cache: OrderedDict[int, str] = OrderedDict()
+
+        # Pre-validated prototypes keyed by (model class, response dict).
+        # Repeated identical mock calls then cost a deep model_copy
+        # instead of full pydantic validation. id() keys are safe here
+        # because both referents stay alive on this provider. Cleared by
+        # set_response().
+        self._validated_cache: dict[tuple[int, int], BaseModel] = {}
+
+    def reset(
+        self,
+        responses: dict[str, dict] | None = None,
+        default_response: dict | None = None,
+        fail_validation_times: int = 0,
+    ) -> None:
+        """
+        Reconfigure the provider in place, clearing all accumulated state.
+
+        Lets a single provider instance be shared across tests (e.g. a
+        session-scoped fixture) instead of rebuilding provider and client
+        per test: each test calls reset() with its own responses and the
+        failure counters and memo caches start fresh.
+
+        Args:
+            responses: Map of step_name -> response dict matching expected schema
+            default_response: Fallback response if step_name not found
+            fail_validation_times: Return invalid data this many times before
+                                    returning valid data (tests retry logic)
+        """
+        self.responses = responses or {}
+        self.default_response = default_response
+        self.fail_validation_times = fail_validation_times
+        self._failure_count.clear()
+        self._step_name_cache.clear()
+        self._validated_cache.clear()
+
     def set_response(self, step_name: str, response: dict) -> None:
         """
         Add or update response for a specific step.
@@ -46,6 +111,8 @@ class MockProvider(LLMClient):
             response: Dict that should validate against step's schema
         """
         self.responses[step_name] = response
+        self._step_name_cache.clear()
+        self._validated_cache.clear()
 
     def complete(self, messages: list[dict], response_model: Type[T]) -> T:
         """
@@ -75,23 +142,27 @@ class MockProvider(LLMClient):
             self._failure_count[step_name] += 1
             # Return intentionally invalid data
             invalid_data = {"invalid_field": "this should fail validation"}
-            return response_model.model_validate(invalid_data)
-
-        # Look up response data
-        response_data = None
-        if step_name in self.responses:
-            response_data = self.responses[step_name]
-        elif self.default_response is not None:
-            response_data = self.default_response
-        else:
+            return _get_validator(response_model).validate_python(invalid_data)
+
+        # Look up response data: one dict probe with the default as
+        # fallback, instead of a membership test plus a second lookup
+        response_data = self.responses.get(step_name, self.default_response)
+        if response_data is None:
             raise ValueError(
                 f"No mock response configured for step '{step_name}'. "
                 f"Available steps: {list(self.responses.keys())}. "
                 f"Use set_response() or provide default_response."
             )
 
-        # Validate and return
-        return response_model.model_validate(response_data)
+        # Validate once per (model, data) pair, then hand out deep copies
+        # of the prototype so callers mutating the result can't poison it.
+        # The transient invalid payloads above stay uncached.
+        cache_key = (id(response_model), id(response_data))
+        prototype = self._validated_cache.get(cache_key)
+        if prototype is None:
+            prototype = _get_validator(response_model).validate_python(response_data)
+            self._validated_cache[cache_key] = prototype
+        return prototype.model_copy(deep=True)
 
     def _extract_step_name(self, messages: list[dict]) -> str:
         """
@@ -107,31 +178,47 @@ class MockProvider(LLMClient):
         Returns:
             Extracted step name or 'unknown_step'
         """
-        # Strategy 1: Look in system message for step name
+        # Key on the message contents, not list identity: id() values are
+        # reused after garbage collection and would alias distinct prompts
+        cache_key = hash(
+            tuple((msg.get("role"), msg.get("content")) for msg in messages)
+        )
+        cached = self._step_name_cache.get(cache_key)
+        if cached is not None:
+            self._step_name_cache.move_to_end(cache_key)
+            return cached
+
+        step_name = self._scan_step_name(messages)
+
+        self._step_name_cache[cache_key] = step_name
+        while len(self._step_name_cache) > _STEP_NAME_CACHE_SIZE:
+            self._step_name_cache.popitem(last=False)
+        return step_name
+
+    @staticmethod
+    def _scan_step_name(messages: list[dict]) -> str:
+        """
+        Scan message contents for a step-name line.
+
+        Args:
+            messages: List of message dicts
+
+        Returns:
+            Extracted step name or 'unknown_step'
+        """
+        # Strategy 1: Look in system messages for a step-name line
         for msg in messages:
             if msg.get("role") == "system":
-                content = msg.get("content", "")
-                # Common patterns: "Step: classifier", "step_name: classifier"
-                if "step:" in content.lower() or "step_name:" in content.lower():
-                    for line in content.split("\n"):
-                        line_lower = line.lower()
-                        if "step:" in line_lower or "step_name:" in line_lower:
-                            # Extract value after colon
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                return parts[1].strip().strip('"\'')
-
-        # Strategy 2: Look for step in user messages (might contain step context)
-        for msg in reversed(messages):  # Check most recent first
+                match = _STEP_NAME_RE.search(msg.get("content", ""))
+                if match:
+                    return match.group(1).strip()
+
+        # Strategy 2: Look in user messages (most recent first)
+        for msg in reversed(messages):
             if msg.get("role") == "user":
-                content = msg.get("content", "")
-                if "step:" in content.lower() or "step_name:" in content.lower():
-                    for line in content.split("\n"):
-                        line_lower = line.lower()
-                        if "step:" in line_lower or "step_name:" in line_lower:
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                return parts[1].strip().strip('"\'')
+                match = _STEP_NAME_RE.search(msg.get("content", ""))
+                if match:
+                    return match.group(1).strip()
 
         # Fallback: return generic name
         return "unknown_step"
@@ -2,20 +2,42 @@
 Data sink implementations.
 
 Sinks are responsible for persisting processed data from the pipeline.
+
+Symbols are resolved lazily (PEP 562); in particular the SQL Server
+sink only imports (and with it pyodbc) on first access.
 """
 
-from llm_etl.sinks.base import AbstractSink
-from llm_etl.sinks.csv_sink import CSVSink
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from llm_etl.sinks.base import AbstractSink
+    from llm_etl.sinks.csv_sink import CSVSink
+    from llm_etl.sinks.sql_server import SQLServerSink
+
+_LAZY_IMPORTS = {
+    "AbstractSink": ("llm_etl.sinks.base", "AbstractSink"),
+    "CSVSink": ("llm_etl.sinks.csv_sink", "CSVSink"),
+    "SQLServerSink": ("llm_etl.sinks.sql_server", "SQLServerSink"),
+}
+
 
-# Lazy import for SQL Server to avoid pyodbc dependency when not needed
 def __getattr__(name):
-    if name == "SQLServerSink":
-        from llm_etl.sinks.sql_server import SQLServerSink
-        return SQLServerSink
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
-
-__all__ = [
-    "AbstractSink",
-    "SQLServerSink",
-    "CSVSink",
-]
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+__all__ = [*_LAZY_IMPORTS]
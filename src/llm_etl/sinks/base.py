@@ -5,18 +5,70 @@ Sinks are responsible for writing processed GlobalState objects to external syst
 (SQL Server, CSV files, APIs, etc.) using a configurable column mapping.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Callable
 
 from ..core.state import GlobalState
 
+# Compiled accessors keyed by path string, shared process-wide: sinks
+# re-created per run (or per test) reuse the same code objects
+_EXTRACTOR_CACHE: dict[str, Callable[[GlobalState], Any]] = {}
+
+
+def compile_extractor(
+    spec: "Callable[[GlobalState], Any] | str",
+) -> Callable[[GlobalState], Any]:
+    """
+    Normalize a column_map value into an extractor callable.
+
+    Callables pass through unchanged. Dotted-path strings such as
+    "processed.visit_type.category" are compiled once into a single
+    lambda (`lambda s: s.processed['visit_type']['category']`): the
+    first segment is an attribute on GlobalState, the rest are item
+    lookups. One generated lambda executes as one bytecode sequence,
+    which beats composing itemgetter chains call-by-call per row, and
+    the path form spares users writing boilerplate lambdas.
+
+    Args:
+        spec: Extractor callable, or a dotted path over GlobalState
+
+    Returns:
+        Callable extracting the value from a GlobalState
+
+    Raises:
+        ValueError: If a path string is empty or has non-identifier segments
+    """
+    if callable(spec):
+        return spec
+
+    fn = _EXTRACTOR_CACHE.get(spec)
+    if fn is not None:
+        return fn
+
+    segments = spec.split(".")
+    if not all(segment.isidentifier() for segment in segments):
+        raise ValueError(
+            f"Invalid extractor path {spec!r}: expected dot-separated "
+            f"identifiers like 'processed.visit_type.category'"
+        )
+
+    code = "lambda s: s." + segments[0] + "".join(
+        f"[{segment!r}]" for segment in segments[1:]
+    )
+    fn = eval(code, {"__builtins__": {}})  # noqa: S307 - identifiers only
+    _EXTRACTOR_CACHE[spec] = fn
+    return fn
+
 
 class AbstractSink(ABC):
     """
     Base class for all data sinks in the pipeline.
 
-    Subclasses must implement write() for single-row operations and
-    write_batch() for transactional batch operations.
+    Subclasses must implement write() for single-row operations.
+    write_batch() defaults to a per-row loop; sinks that can amortize
+    fixed per-call cost across rows (transactions, executemany, a single
+    file operation) should override it.
 
     Attributes:
         column_map: Dictionary mapping output column names to extractor functions
@@ -62,13 +114,14 @@ class AbstractSink(ABC):
         """
         pass
 
-    @abstractmethod
     def write_batch(self, states: list[GlobalState]) -> None:
         """
-        Write multiple GlobalState objects in a transaction.
+        Write multiple GlobalState objects.
 
-        Ensures atomicity: either all rows are written successfully,
-        or none are written (rollback on error).
+        The default implementation simply calls write() once per state,
+        so custom sinks only have to implement write(). Sinks backed by
+        transactional or bulk APIs should override this to write the
+        whole group in one operation (and roll back on error).
 
         Args:
             states: List of GlobalState objects to write
@@ -76,4 +129,67 @@ class AbstractSink(ABC):
         Raises:
             SinkError: If writing fails, includes pk of the failed row
         """
+        for state in states:
+            self.write(state)
+
+    async def awrite(self, state: GlobalState) -> None:
+        """
+        Async variant of write().
+
+        The default offloads the blocking write to a worker thread so a
+        caller on an event loop can overlap sink I/O with LLM calls.
+        Sinks backed by a native async driver should override this.
+
+        Args:
+            state: GlobalState object to write
+
+        Raises:
+            SinkError: If writing fails
+        """
+        await asyncio.to_thread(self.write, state)
+
+    async def awrite_batch(self, states: list[GlobalState]) -> None:
+        """
+        Async variant of write_batch(), offloaded like awrite().
+
+        Args:
+            states: List of GlobalState objects to write
+
+        Raises:
+            SinkError: If writing fails, includes pk of the failed row
+        """
+        await asyncio.to_thread(self.write_batch, states)
+
+    def flush(self) -> None:
+        """
+        Persist any rows the sink is still buffering.
+
+        Sinks that buffer writes for throughput (e.g. CSVSink with
+        flush_every > 1) must override this. The default is a no-op for
+        sinks that write immediately. The pipeline calls flush() once
+        after all rows have been processed.
+
+        Raises:
+            SinkError: If persisting buffered rows fails
+        """
         pass
+
+    def close(self) -> None:
+        """
+        Release any resources the sink holds open across writes.
+
+        Sinks that keep persistent handles or connections (e.g. CSVSink's
+        file handle) must override this. The default is a no-op. The
+        pipeline calls close() once after the final flush(); sinks also
+        work as context managers through this hook.
+        """
+        pass
+
+    def __enter__(self) -> "AbstractSink":
+        """Support `with sink:` blocks for standalone (non-pipeline) use."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Flush buffered rows and release resources on block exit."""
+        self.flush()
+        self.close()
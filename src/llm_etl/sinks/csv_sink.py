@@ -6,13 +6,18 @@ Useful for testing pipelines without SQL Server dependencies.
 """
 
 import csv
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from ..core.exceptions import SinkError
 from ..core.state import GlobalState
-from .base import AbstractSink
+from .base import AbstractSink, compile_extractor
 
 
 class CSVSink(AbstractSink):
@@ -49,6 +54,11 @@ class CSVSink(AbstractSink):
         self,
         file_path: str,
         column_map: dict[str, Callable[[GlobalState], Any]],
+        flush_every: int = 1,
+        linger_ms: Optional[float] = None,
+        thread_safe: bool = True,
+        use_arrow: bool = False,
+        extractor_workers: int = 1,
     ):
         """
         Initialize the CSV sink.
@@ -57,6 +67,31 @@ class CSVSink(AbstractSink):
             file_path: Path to the output CSV file (will be created if needed)
             column_map: Dictionary mapping column names to functions that extract
                        values from GlobalState. Column names determine CSV header order.
+            flush_every: Number of rows to buffer before writing to disk.
+                        Buffering amortizes the per-row open/write/close cost
+                        for large runs. The default of 1 writes every row
+                        immediately so no data is lost if the process dies.
+            linger_ms: Maximum time in milliseconds a buffered row may wait
+                      before being flushed, regardless of flush_every.
+                      Bounds data-loss exposure when rows trickle in slower
+                      than the buffer fills. None (the default) means rows
+                      wait until the count threshold or an explicit flush().
+            thread_safe: Guard writes with a lock. Required whenever
+                        multiple threads share this sink — which includes
+                        Pipeline runs with max_concurrency > 1, the
+                        default. Pass False only for strictly
+                        single-threaded use to drop the per-row
+                        acquire/release pair from the write path.
+            use_arrow: Route write_batch() through pyarrow's C-level CSV
+                      writer (see write_batch_arrow()). Requires pyarrow;
+                      only worthwhile for large batches.
+            extractor_workers: Number of threads used to run column
+                              extractors during write_batch(). The
+                              default of 1 extracts serially; raise it
+                              only when extractors do I/O (e.g. lookups
+                              against an external service) so their
+                              waits overlap. Pure dict-access extractors
+                              gain nothing from extra threads.
 
         Raises:
             SinkError: If parent directory creation fails
@@ -67,13 +102,71 @@ class CSVSink(AbstractSink):
             ...     column_map={
             ...         "id": lambda s: s.pk,
             ...         "category": lambda s: s.processed["class"]["category"],
-            ...         "processed_at": lambda s: s.completed_at.isoformat(),
-            ...     }
+            ...         "processed_at": lambda s: s.completed_at,
+            ...     },
+            ...     flush_every=5000,  # Buffer rows for throughput
             ... )
         """
         self.file_path = Path(file_path)
+        # Accept dotted-path strings alongside callables (see
+        # compile_extractor); everything downstream sees callables
+        column_map = {
+            name: compile_extractor(spec) for name, spec in column_map.items()
+        }
         self.column_map = column_map
-        self._lock = threading.Lock()  # Thread-safe file writes
+        # nullcontext's enter/exit are no-ops, so the `with self._lock:`
+        # blocks below cost nothing in the single-threaded case
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        self.use_arrow = use_arrow
+
+        # column_map is fixed after construction, so the CSV header is too;
+        # materialize the header and the extractor tuple once instead of
+        # per flush. Rows are built as tuples and written through
+        # csv.writer, whose C-level writerow consumes any iterable; that
+        # skips DictWriter's per-row, per-field dict lookups.
+        self._fieldnames = tuple(column_map.keys())
+        self._extractors = tuple(column_map.items())
+        # Set after the header question is settled, so only the first
+        # flush pays the exists()/stat() syscalls
+        self._header_written = False
+
+        # Persistent file handle and writer, opened lazily on the first
+        # flush and kept open for the life of the sink: one open() per run
+        # instead of one per flush, with writes landing in the userspace
+        # buffer. close() (called by the pipeline, or via `with sink:`)
+        # releases the handle.
+        self._fh = None
+        self._writer = None
+
+        # Optional background writer (see start_writer()); None means the
+        # inline buffered path is used
+        self._write_queue: Optional[queue.Queue] = None
+        self._write_thread: Optional[threading.Thread] = None
+        self._write_error: Optional[Exception] = None
+
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
+        self.flush_every = flush_every
+
+        if extractor_workers < 1:
+            raise ValueError(
+                f"extractor_workers must be >= 1, got {extractor_workers}"
+            )
+        self.extractor_workers = extractor_workers
+        # Created lazily on the first parallel batch; shut down by close()
+        self._extract_pool: Optional[ThreadPoolExecutor] = None
+
+        if linger_ms is not None and linger_ms <= 0:
+            raise ValueError(f"linger_ms must be > 0, got {linger_ms}")
+        self.linger_ms = linger_ms
+        self._last_flush = time.monotonic()
+        self._buffer: list[tuple[Any, ...]] = []
+        self._buffer_pks: list[str] = []
+
+        # One-entry memo for datetime formatting: rows completed in the
+        # same batch often share a timestamp, so repeated identical
+        # datetimes reuse the cached ISO string instead of reformatting
+        self._dt_memo: tuple[Optional[datetime], str] = (None, "")
 
         # Create parent directories if they don't exist
         try:
@@ -89,8 +182,13 @@ class CSVSink(AbstractSink):
         """
         Write a single GlobalState to the CSV file.
 
+        With flush_every=1 (the default) the row is written to disk
+        immediately. With a larger threshold, rows accumulate in memory and
+        are written in one batch when the threshold is reached or flush()
+        is called.
+
         If the file doesn't exist, creates it with a header row.
-        Otherwise, appends a data row.
+        Otherwise, appends data rows.
 
         Args:
             state: GlobalState object to write
@@ -99,34 +197,228 @@ class CSVSink(AbstractSink):
             SinkError: If extracting values from column_map fails or if
                       writing to the file fails
         """
+        # Background mode: hand the extracted tuple to the writer thread.
+        # Workers never touch the lock or the file, so N producers don't
+        # serialize behind one Python-level writer.
+        if self._write_queue is not None:
+            if self._write_error is not None:
+                raise self._write_error
+            self._write_queue.put(self._extract_row(state))
+            return
+
         with self._lock:  # Thread-safe access
+            # Extract values using column_map
+            row = self._extract_row(state)
+
+            self._buffer.append(row)
+            self._buffer_pks.append(state.pk)
+
+            if len(self._buffer) >= self.flush_every or self._linger_expired():
+                self._flush_buffer()
+
+    def flush(self) -> None:
+        """
+        Write any buffered rows to disk.
+
+        Called by the pipeline after all rows are processed; safe to call
+        when the buffer is empty.
+
+        Raises:
+            SinkError: If writing to the file fails
+        """
+        if self._write_queue is not None:
+            # Block until the writer thread has drained and written
+            # everything enqueued so far
+            self._write_queue.join()
+            if self._write_error is not None:
+                raise self._write_error
+            return
+
+        with self._lock:
+            self._flush_buffer()
+
+    # Maximum rows the background writer serializes in one writerows call
+    _WRITER_BATCH_SIZE = 1024
+
+    # Sentinel telling the background writer thread to drain and exit
+    _WRITER_SENTINEL = object()
+
+    def start_writer(self) -> None:
+        """
+        Switch the sink to a dedicated background writer thread.
+
+        With many worker threads producing rows, the inline path
+        serializes them all behind one lock and one Python-level writer.
+        After start_writer(), write() only extracts the row tuple and
+        enqueues it; a single daemon thread drains the queue in batches
+        and writes them through the persistent handle, so producers never
+        contend on the file. close() drains the queue and joins the
+        thread; flush_every and linger_ms are not used in this mode.
+
+        Raises:
+            RuntimeError: If the writer thread is already running
+        """
+        if self._write_thread is not None:
+            raise RuntimeError("background writer already started")
+
+        with self._lock:
+            # Move anything the inline path buffered before the switch
+            self._flush_buffer()
+
+        self._write_queue = queue.Queue(maxsize=10_000)
+        self._write_thread = threading.Thread(
+            target=self._writer_loop,
+            name=f"llm-etl-csv-sink:{self.file_path.name}",
+            daemon=True,
+        )
+        self._write_thread.start()
+
+    def _writer_loop(self) -> None:
+        """
+        Drain the write queue in batches until the sentinel arrives.
+
+        Write failures are captured into self._write_error (write() and
+        flush() re-raise them on the producer side) rather than killing
+        the thread silently. The stream is flushed whenever the queue
+        goes idle so rows are durable between bursts.
+        """
+        done = False
+        while not done:
+            batch = [self._write_queue.get()]
+            if batch[0] is self._WRITER_SENTINEL:
+                batch.clear()
+                done = True
+            while not done and len(batch) < self._WRITER_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._WRITER_SENTINEL:
+                    done = True
+                else:
+                    batch.append(item)
+
             try:
-                # Extract values using column_map
-                row = self._extract_row(state)
-
-                # Determine if we need to write a header
-                file_exists = self.file_path.exists() and self.file_path.stat().st_size > 0
-
-                # Open in append mode with UTF-8 encoding
-                with self.file_path.open("a", encoding="utf-8", newline="") as f:
-                    writer = csv.DictWriter(
-                        f,
-                        fieldnames=list(self.column_map.keys()),
-                        quoting=csv.QUOTE_MINIMAL,
-                        extrasaction="ignore",
+                if batch:
+                    if self._writer is None:
+                        self._open_writer()
+                    self._writer.writerows(batch)
+                if self._fh is not None and self._write_queue.empty():
+                    self._fh.flush()
+            except Exception as e:  # noqa: BLE001 - surfaced via _write_error
+                if self._write_error is None:
+                    self._write_error = SinkError(
+                        pk="<background writer>", original_error=e
                     )
+            finally:
+                for _ in range(len(batch) + (1 if done else 0)):
+                    self._write_queue.task_done()
 
-                    # Write header if file is new or empty
-                    if not file_exists:
-                        writer.writeheader()
+    def _stop_writer(self) -> None:
+        """
+        Drain the queue, stop the writer thread and revert to inline mode.
 
-                    # Write the data row
-                    writer.writerow(row)
+        Safe to call when the writer was never started.
+        """
+        if self._write_thread is None:
+            return
 
-            except SinkError:
-                raise  # Re-raise SinkErrors from _extract_row
-            except OSError as e:
-                raise SinkError(pk=state.pk, original_error=e)
+        self._write_queue.put(self._WRITER_SENTINEL)
+        self._write_thread.join()
+        self._write_thread = None
+        self._write_queue = None
+
+    def _linger_expired(self) -> bool:
+        """
+        Check whether buffered rows have waited past the linger deadline.
+
+        Caller must hold self._lock.
+
+        Returns:
+            True when linger_ms is configured and has elapsed since the
+            last flush
+        """
+        return (
+            self.linger_ms is not None
+            and (time.monotonic() - self._last_flush) * 1000 >= self.linger_ms
+        )
+
+    def _flush_buffer(self) -> None:
+        """
+        Write all buffered rows in a single file operation.
+
+        Caller must hold self._lock.
+
+        Raises:
+            SinkError: If writing to the file fails
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        try:
+            if self._writer is None:
+                self._open_writer()
+
+            # Write all buffered rows at once, then flush the userspace
+            # buffer so the rows are durable once _flush_buffer returns
+            self._writer.writerows(self._buffer)
+            self._fh.flush()
+
+            self._buffer.clear()
+            self._buffer_pks.clear()
+
+        except OSError as e:
+            raise SinkError(pk=self._buffer_pks[0], original_error=e)
+
+    def _open_writer(self) -> None:
+        """
+        Open the persistent file handle and writer, emitting the header.
+
+        Caller must hold self._lock. The handle stays open until close();
+        append mode means a sink re-opened over an existing file continues
+        where the previous run stopped.
+
+        Raises:
+            OSError: If opening the file fails
+        """
+        # Determine if we need to write a header (once; afterwards the
+        # answer cannot change)
+        file_exists = self.file_path.exists() and self.file_path.stat().st_size > 0
+
+        self._fh = self.file_path.open(
+            "a", encoding="utf-8", newline="", buffering=1 << 20
+        )
+        self._writer = csv.writer(self._fh, quoting=csv.QUOTE_MINIMAL)
+
+        if not file_exists and not self._header_written:
+            self._writer.writerow(self._fieldnames)
+        self._header_written = True
+
+    def close(self) -> None:
+        """
+        Flush buffered rows and close the persistent file handle.
+
+        Safe to call when nothing was ever written; the sink can be
+        reused afterwards (the next write reopens the file in append
+        mode).
+
+        Raises:
+            SinkError: If writing buffered rows fails
+        """
+        self._stop_writer()
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True)
+            self._extract_pool = None
+        with self._lock:
+            self._flush_buffer()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+                self._writer = None
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
 
     def write_batch(self, states: list[GlobalState]) -> None:
         """
@@ -149,67 +441,184 @@ class CSVSink(AbstractSink):
         if not states:
             return  # Nothing to write
 
+        if self.use_arrow:
+            self.write_batch_arrow(states)
+            return
+
+        if self._write_queue is not None:
+            if self._write_error is not None:
+                raise self._write_error
+            for row in self._extract_rows(states):
+                self._write_queue.put(row)
+            return
+
+        # Extract all rows first (fail fast if column_map has issues);
+        # _extract_row already raises SinkError with proper pk context
+        rows = self._extract_rows(states)
+
         with self._lock:  # Thread-safe access
+            for state, row in zip(states, rows):
+                self._buffer.append(row)
+                self._buffer_pks.append(state.pk)
+
+            # Batch callers expect durability, so write through immediately
+            self._flush_buffer()
+
+    def _extract_rows(self, states: list[GlobalState]) -> list[tuple[Any, ...]]:
+        """
+        Extract row tuples for a batch, optionally across threads.
+
+        With extractor_workers > 1, extractors run through a shared
+        thread pool so I/O-bound extractors overlap their waits; the pool
+        is created on first use and shut down by close(). Executor.map
+        re-raises the first SinkError in batch order, matching the serial
+        path's fail-fast behavior.
+
+        Args:
+            states: List of GlobalState objects to extract from
+
+        Raises:
+            SinkError: If any extractor function fails
+        """
+        if self.extractor_workers == 1 or len(states) <= 1:
+            return [self._extract_row(state) for state in states]
+
+        if self._extract_pool is None:
+            self._extract_pool = ThreadPoolExecutor(
+                max_workers=self.extractor_workers,
+                thread_name_prefix="llm-etl-csv-extract",
+            )
+        return list(self._extract_pool.map(self._extract_row, states))
+
+    def write_batch_arrow(self, states: list[GlobalState]) -> None:
+        """
+        Write a large batch through pyarrow's C-level CSV writer.
+
+        For batches of 10k+ rows the stdlib csv module is pure Python per
+        row; pyarrow serializes a columnar table in C. Values are
+        extracted column-at-a-time (one extractor dispatched per column,
+        not per cell-row pair) and handed to pyarrow as whole columns.
+
+        pyarrow is an optional dependency, imported lazily like pyodbc is
+        for SQLServerSink. Note that pyarrow applies its own type
+        formatting (None stays empty, datetimes use Arrow's timestamp
+        rendering), so mixed use with write() on the same file may format
+        edge cases differently.
+
+        Args:
+            states: List of GlobalState objects to write
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            SinkError: If extraction or writing fails
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            raise ImportError(
+                "write_batch_arrow requires pyarrow; install it or use "
+                "write_batch() for the stdlib path"
+            )
+
+        if not states:
+            return
+
+        with self._lock:
+            # Route any pending inline rows (and the persistent handle's
+            # userspace buffer) to disk first so ordering is preserved
+            self._flush_buffer()
+            if self._fh is not None:
+                self._fh.flush()
+
             try:
-                # Extract all rows first (fail fast if column_map has issues)
-                rows = []
-                for state in states:
-                    # _extract_row already raises SinkError with proper pk context
-                    rows.append(self._extract_row(state))
-
-                # Determine if we need to write a header
-                file_exists = self.file_path.exists() and self.file_path.stat().st_size > 0
-
-                # Open in append mode with UTF-8 encoding
-                with self.file_path.open("a", encoding="utf-8", newline="") as f:
-                    writer = csv.DictWriter(
-                        f,
-                        fieldnames=list(self.column_map.keys()),
-                        quoting=csv.QUOTE_MINIMAL,
-                        extrasaction="ignore",
+                columns = {
+                    name: [fn(state) for state in states]
+                    for name, fn in self._extractors
+                }
+                table = pa.table(columns)
+            except Exception as e:
+                raise SinkError(pk=states[0].pk, original_error=e)
+
+            try:
+                include_header = not self._header_written and not (
+                    self.file_path.exists() and self.file_path.stat().st_size > 0
+                )
+                with self.file_path.open("ab") as fh:
+                    pa_csv.write_csv(
+                        table,
+                        fh,
+                        write_options=pa_csv.WriteOptions(
+                            include_header=include_header
+                        ),
                     )
+                self._header_written = True
+            except OSError as e:
+                raise SinkError(pk=states[0].pk, original_error=e)
 
-                    # Write header if file is new or empty
-                    if not file_exists:
-                        writer.writeheader()
+    def _format_datetime(self, value: datetime) -> str:
+        """
+        Format a datetime as an ISO string, memoizing the last result.
 
-                    # Write all data rows
-                    writer.writerows(rows)
+        Column extractors can return datetime objects directly (e.g.
+        `lambda s: s.completed_at`); the sink formats them here. Rows
+        completing within the same timestamp resolution share one
+        formatted string.
 
-            except SinkError:
-                raise  # Re-raise our own errors
-            except OSError as e:
-                # For batch operations, we don't have a single pk, so use the first one
-                first_pk = states[0].pk if states else "unknown"
-                raise SinkError(pk=first_pk, original_error=e)
+        Deliberately lock-free: this runs from unlocked producers in
+        background-writer mode and from extractor-pool workers, so the
+        memo is read and replaced as a single tuple attribute — both
+        atomic under the GIL. A concurrent update can at worst waste one
+        isoformat() call; it can never pair a timestamp with the wrong
+        string. Keep it that way: anything non-atomic added here would
+        need self._lock at every call site.
+
+        Args:
+            value: The datetime to format
+
+        Returns:
+            ISO 8601 string representation
+        """
+        last_dt, last_str = self._dt_memo
+        if value == last_dt:
+            return last_str
+
+        formatted = value.isoformat()
+        self._dt_memo = (value, formatted)
+        return formatted
 
-    def _extract_row(self, state: GlobalState) -> dict[str, Any]:
+    def _extract_row(self, state: GlobalState) -> tuple[Any, ...]:
         """
-        Extract a row dictionary from a GlobalState using column_map.
+        Extract a row tuple from a GlobalState using the compiled extractors.
+
+        Values come back in column_map order, matching the header written
+        by _open_writer.
 
         Args:
             state: GlobalState to extract values from
 
         Returns:
-            Dictionary mapping column names to extracted values
+            Tuple of extracted values, one per column
 
         Raises:
             SinkError: If any extractor function raises an exception
         """
-        row = {}
-        for col_name, extractor_fn in self.column_map.items():
+        row = []
+        for col_name, extractor_fn in self._extractors:
             try:
                 value = extractor_fn(state)
 
                 # Convert None to empty string for CSV compatibility
                 if value is None:
                     value = ""
+                elif isinstance(value, datetime):
+                    value = self._format_datetime(value)
 
-                row[col_name] = value
+                row.append(value)
 
             except Exception as e:
                 # Wrap the extraction error with proper context
                 error_msg = f"Column '{col_name}' extractor failed: {e}"
                 raise SinkError(pk=state.pk, original_error=Exception(error_msg))
 
-        return row
+        return tuple(row)
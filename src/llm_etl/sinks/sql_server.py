@@ -5,14 +5,26 @@ Writes GlobalState objects to SQL Server using MERGE (upsert) operations.
 Supports environment variable fallback for connection strings.
 """
 
+import logging
 import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Optional
 
 import pyodbc
 
+# Let the ODBC Driver Manager pool physical connections across sink
+# instances sharing a connection string. Must be set before the first
+# connect() in the process to take effect.
+pyodbc.pooling = True
+
 from ..core.exceptions import SinkError
 from ..core.state import GlobalState
-from .base import AbstractSink
+from .base import AbstractSink, compile_extractor
+
+
+logger = logging.getLogger(__name__)
 
 
 class SQLServerSink(AbstractSink):
@@ -63,12 +75,21 @@ class SQLServerSink(AbstractSink):
         SQL_SERVER_CONN: Default ODBC connection string
     """
 
+    # Stay safely under the TDS limit of ~2100 parameters per statement;
+    # batches are chunked so each MERGE carries at most this many markers
+    _MAX_PARAMS = 2000
+
     def __init__(
         self,
         target_table: str,
         merge_keys: list[str],
         column_map: dict[str, Callable[[GlobalState], Any]],
         connection_string: Optional[str] = None,
+        parallel_batches: int = 1,
+        bulk_load: bool = False,
+        flush_every: int = 1,
+        linger_ms: Optional[float] = None,
+        column_types: Optional[dict[str, Any]] = None,
     ):
         """
         Initialize the SQL Server sink.
@@ -78,13 +99,56 @@ class SQLServerSink(AbstractSink):
             merge_keys: List of column names that uniquely identify a row
             column_map: Dictionary mapping column names to GlobalState extractors
             connection_string: ODBC connection string (optional, defaults to env var)
+            parallel_batches: Number of connections write_batch() may use
+                             concurrently. The default of 1 keeps the whole
+                             batch in one transaction; values > 1 split it
+                             into independently committed sub-batches whose
+                             network waits overlap (see write_batch notes
+                             on atomicity)
+            bulk_load: Route write_batch() through a temp staging table:
+                      all rows are pushed in one fast_executemany INSERT,
+                      then merged into the target with a single MERGE.
+                      Best for large initial loads where most rows are
+                      inserts; the default keeps the direct chunked MERGE
+            flush_every: Number of write() calls to coalesce before the
+                        buffered rows ship as one set-based write_batch().
+                        The default of 1 preserves immediate per-row
+                        upserts; larger values cut N round trips to
+                        roughly N/flush_every at the cost of rows sitting
+                        unwritten until the next flush (mirrors CSVSink)
+            linger_ms: Upper bound in milliseconds a buffered row may wait
+                      before write() forces a flush even though the buffer
+                      is below flush_every. None (the default) means rows
+                      wait for the count threshold or an explicit flush()
+            column_types: Optional mapping of column name to the pyodbc
+                         input size declaration passed to
+                         cursor.setinputsizes() — either a SQL type code
+                         (e.g. pyodbc.SQL_INTEGER) or a (type, size,
+                         precision) tuple. Declaring types once lets
+                         pyodbc bind with fixed SQL types instead of
+                         re-inferring them from Python values per call,
+                         and keeps the parameter metadata SQL Server
+                         sees stable across executes. Must cover every
+                         column in column_map when given
 
         Raises:
             ValueError: If connection_string is None and SQL_SERVER_CONN env var is not set,
-                       or if merge_keys is empty or contains columns not in column_map
+                       if merge_keys is empty or contains columns not in column_map,
+                       if parallel_batches, flush_every or linger_ms
+                       are not positive, or if column_types is missing
+                       a column from column_map
         """
         self.target_table = target_table
         self.merge_keys = merge_keys
+        # Set-based membership for the "is this column a merge key"
+        # tests in SQL generation: a list `in` is O(keys) per column,
+        # which adds up on wide column maps
+        self._merge_key_set = frozenset(merge_keys)
+        # Accept dotted-path strings alongside callables (see
+        # compile_extractor); everything downstream sees callables
+        column_map = {
+            name: compile_extractor(spec) for name, spec in column_map.items()
+        }
         self.column_map = column_map
 
         # Validate merge_keys
@@ -109,7 +173,126 @@ class SQLServerSink(AbstractSink):
 
         self.connection_string = connection_string
 
-    def _apply_column_map(self, state: GlobalState) -> dict[str, Any]:
+        if parallel_batches < 1:
+            raise ValueError(
+                f"parallel_batches must be >= 1, got {parallel_batches}"
+            )
+        self.parallel_batches = parallel_batches
+        self.bulk_load = bulk_load
+
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
+        self.flush_every = flush_every
+
+        if linger_ms is not None and linger_ms <= 0:
+            raise ValueError(f"linger_ms must be positive, got {linger_ms}")
+        self.linger_ms = linger_ms
+
+        # Coalescing buffer for per-row write() callers (flush_every > 1
+        # or linger_ms set): states wait here until a threshold trips,
+        # then ship together through the set-based write_batch() path
+        self._buffer: list[GlobalState] = []
+        self._last_flush = time.monotonic()
+        # Created lazily on the first parallel batch; shut down by close()
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+
+        # Persistent connection, established lazily by _get_conn() and
+        # reused across writes: per-row connect/close pays the TCP
+        # handshake plus TDS login round trip for every upsert, which
+        # dominates short MERGEs. close() releases it.
+        self._conn: Optional[pyodbc.Connection] = None
+        # Cursor reused across write() calls: the single-row MERGE text
+        # never changes, so keeping one statement handle lets pyodbc
+        # reuse the prepared statement (and SQL Server its plan) instead
+        # of allocating a handle per row
+        self._cursor: Optional[pyodbc.Cursor] = None
+
+        # Batch MERGE statements are pure functions of (columns, row
+        # count); memoize them so repeated equally-sized batches skip the
+        # string assembly
+        self._batch_sql_cache: dict[tuple[tuple[str, ...], int], str] = {}
+
+        # column_map and merge_keys are fixed at construction, so the
+        # column order, the extractor pairs and the single-row MERGE text
+        # are invariant; materialize them once instead of rebuilding the
+        # SQL and re-iterating dict keys on every write
+        self._columns = tuple(column_map.keys())
+        self._extractors = tuple(column_map.items())
+        self._merge_sql_single = self._build_merge_sql(list(self._columns))
+
+        # Fixed parameter type declarations for setinputsizes(), in
+        # self._columns order (None when the caller leaves pyodbc to
+        # infer types from the Python values)
+        if column_types is not None:
+            missing = [col for col in self._columns if col not in column_types]
+            if missing:
+                raise ValueError(
+                    f"column_types is missing declarations for: "
+                    f"{', '.join(missing)}"
+                )
+            self._input_sizes: Optional[list[Any]] = [
+                column_types[col] for col in self._columns
+            ]
+        else:
+            self._input_sizes = None
+
+    def _get_conn(self) -> pyodbc.Connection:
+        """
+        Return the persistent connection, connecting on first use.
+
+        No liveness probe: a SELECT 1 ping would cost a round trip per
+        write. Callers instead catch pyodbc.Error, discard the handle via
+        _discard_conn(), and retry once against a fresh connection (see
+        write()), so a connection dropped by the server costs one failed
+        execute rather than a ping on every healthy one.
+
+        Returns:
+            An open pyodbc connection with autocommit disabled
+
+        Raises:
+            pyodbc.Error: If establishing a new connection fails
+        """
+        if self._conn is None:
+            self._conn = pyodbc.connect(self.connection_string, autocommit=False)
+            self._cursor = self._conn.cursor()
+            if self._input_sizes is not None:
+                # Declared once per cursor: every single-row MERGE binds
+                # with the same fixed SQL types
+                self._cursor.setinputsizes(self._input_sizes)
+        return self._conn
+
+    def _discard_conn(self) -> None:
+        """Drop the persistent connection so the next call reconnects."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except pyodbc.Error:
+                pass
+            self._conn = None
+            self._cursor = None
+
+    def close(self) -> None:
+        """
+        Release the persistent connection.
+
+        Called by the pipeline after the final flush(); the sink can be
+        reused afterwards (the next write reconnects). Flushes first as a
+        safety net for callers that close() without an explicit flush().
+        """
+        self.flush()
+        if self._batch_pool is not None:
+            self._batch_pool.shutdown(wait=True)
+            self._batch_pool = None
+        self._discard_conn()
+
+    def __del__(self):
+        """Best-effort release if the sink is dropped without close()."""
+        try:
+            self._discard_conn()
+        except Exception:
+            pass
+
+    def _apply_column_map(self, state: GlobalState) -> list[Any]:
         """
         Apply the column_map to extract values from GlobalState.
 
@@ -117,15 +300,13 @@ class SQLServerSink(AbstractSink):
             state: GlobalState object to extract values from
 
         Returns:
-            Dictionary mapping column names to extracted values
+            Extracted values positionally, in self._columns order (the
+            order the precomputed MERGE statements expect)
 
         Raises:
             Exception: If any extractor function fails (caller wraps in SinkError)
         """
-        result = {}
-        for column_name, extractor in self.column_map.items():
-            result[column_name] = extractor(state)
-        return result
+        return [extractor(state) for _, extractor in self._extractors]
 
     def _build_merge_sql(self, columns: list[str]) -> str:
         """
@@ -174,7 +355,7 @@ class SQLServerSink(AbstractSink):
         )
 
         # Build UPDATE SET clause (only non-key columns)
-        non_key_columns = [col for col in columns if col not in self.merge_keys]
+        non_key_columns = [col for col in columns if col not in self._merge_key_set]
         if non_key_columns:
             update_set = ", ".join(
                 f"{col} = source.{col}" for col in non_key_columns
@@ -200,6 +381,93 @@ class SQLServerSink(AbstractSink):
 
         return merge_sql
 
+    def _build_batch_merge_sql(self, columns: tuple[str, ...], n_rows: int) -> str:
+        """
+        Generate a set-based MERGE whose source is a table value constructor.
+
+        Instead of one single-row MERGE per state, the whole chunk is
+        shipped as `USING (VALUES (?,...),(?,...),...)` so SQL Server
+        sees one statement, one round trip, and a set-based plan.
+        Results are memoized per (columns, n_rows) since the statement
+        text is invariant for a given shape.
+
+        Args:
+            columns: Column names in parameter order
+            n_rows: Number of value rows in the constructor
+
+        Returns:
+            T-SQL MERGE statement with n_rows * len(columns) placeholders
+        """
+        cache_key = (columns, n_rows)
+        cached = self._batch_sql_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        row_placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+        values_clause = ", ".join(row_placeholders for _ in range(n_rows))
+        column_list = ", ".join(columns)
+
+        on_conditions = " AND ".join(
+            f"target.{key} = source.{key}" for key in self.merge_keys
+        )
+
+        non_key_columns = [col for col in columns if col not in self._merge_key_set]
+        if non_key_columns:
+            update_set = ", ".join(
+                f"{col} = source.{col}" for col in non_key_columns
+            )
+            update_clause = f"""WHEN MATCHED THEN
+            UPDATE SET
+                {update_set}
+        """
+        else:
+            update_clause = ""
+
+        insert_values = ", ".join(f"source.{col}" for col in columns)
+
+        # OUTPUT $action returns one row per affected row, so callers can
+        # tally inserted vs updated without a second query
+        merge_sql = f"""MERGE {self.target_table} AS target
+        USING (VALUES {values_clause}) AS source ({column_list})
+        ON {on_conditions}
+        {update_clause}WHEN NOT MATCHED THEN
+            INSERT ({column_list})
+            VALUES ({insert_values})
+        OUTPUT $action;"""
+
+        self._batch_sql_cache[cache_key] = merge_sql
+        return merge_sql
+
+    def _linger_expired(self) -> bool:
+        """Whether the oldest buffered row has waited past linger_ms."""
+        if self.linger_ms is None:
+            return False
+        return (time.monotonic() - self._last_flush) * 1000.0 >= self.linger_ms
+
+    def flush(self) -> None:
+        """
+        Ship any rows buffered by write() as one set-based batch.
+
+        A no-op when nothing is buffered (in particular for the default
+        flush_every=1 configuration, where write() upserts immediately).
+        The pipeline calls this once after all rows are processed, so a
+        partially filled buffer never outlives the run.
+
+        On failure the rows stay buffered — they were already acknowledged
+        to the pipeline as successful write() calls, so they must remain
+        retryable (call flush() again) or recoverable from the raised
+        error rather than silently dropped. Matches CSVSink, whose
+        _flush_buffer also clears only after a successful write.
+
+        Raises:
+            SinkError: If the batch MERGE fails, includes the pk of the
+                      failing chunk; the buffered rows are retained
+        """
+        if self._buffer:
+            self.write_batch(self._buffer)
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
     def write(self, state: GlobalState) -> None:
         """
         Write a single GlobalState to SQL Server using MERGE.
@@ -207,15 +475,26 @@ class SQLServerSink(AbstractSink):
         Extracts values using column_map and executes a MERGE statement
         to upsert the row.
 
+        With flush_every > 1 (or linger_ms set) the state is only
+        buffered; the actual MERGE happens when the buffer reaches
+        flush_every rows, the linger deadline passes, or flush() is
+        called, and then goes through the set-based write_batch() path.
+
         Args:
             state: GlobalState object to write
 
         Raises:
             SinkError: If extraction fails, connection fails, or MERGE fails
         """
-        # Extract values from state
+        if self.flush_every > 1 or self.linger_ms is not None:
+            self._buffer.append(state)
+            if len(self._buffer) >= self.flush_every or self._linger_expired():
+                self.flush()
+            return
+
+        # Extract values from state (positional, in self._columns order)
         try:
-            row_data = self._apply_column_map(state)
+            values = self._apply_column_map(state)
         except Exception as e:
             raise SinkError(
                 pk=state.pk,
@@ -224,38 +503,41 @@ class SQLServerSink(AbstractSink):
                 ),
             ) from e
 
-        # Ensure columns are in consistent order
-        columns = list(row_data.keys())
-        values = [row_data[col] for col in columns]
-
-        # Build MERGE SQL
-        merge_sql = self._build_merge_sql(columns)
-
-        # Execute MERGE
-        try:
-            conn = pyodbc.connect(self.connection_string)
+        # Execute the precomputed MERGE over the persistent connection,
+        # reusing the persistent cursor's prepared statement. On a
+        # pyodbc error the handle may simply be dead (idle timeout,
+        # failover), so retry exactly once on a fresh connection before
+        # giving up.
+        for final_attempt in (False, True):
             try:
-                cursor = conn.cursor()
-                cursor.execute(merge_sql, values)
+                conn = self._get_conn()
+                self._cursor.execute(self._merge_sql_single, values)
                 conn.commit()
-            finally:
-                conn.close()
-        except pyodbc.Error as e:
-            raise SinkError(
-                pk=state.pk,
-                original_error=Exception(
-                    f"Failed to execute MERGE for table {self.target_table}: {e}"
-                ),
-            ) from e
-        except Exception as e:
-            raise SinkError(pk=state.pk, original_error=e) from e
+                return
+            except pyodbc.Error as e:
+                self._discard_conn()
+                if final_attempt:
+                    raise SinkError(
+                        pk=state.pk,
+                        original_error=Exception(
+                            f"Failed to execute MERGE for table "
+                            f"{self.target_table}: {e}"
+                        ),
+                    ) from e
+            except Exception as e:
+                raise SinkError(pk=state.pk, original_error=e) from e
 
     def write_batch(self, states: list[GlobalState]) -> None:
         """
         Write multiple GlobalState objects in a single transaction.
 
-        Ensures atomicity: either all rows are written successfully,
-        or the transaction is rolled back on any failure.
+        Rows are shipped in chunks as set-based MERGEs over a table value
+        constructor (see _build_batch_merge_sql), so a batch of N rows
+        costs a handful of round trips instead of N. Ensures atomicity:
+        either all rows are written successfully, or the transaction is
+        rolled back on any failure. With parallel_batches > 1 the batch
+        is instead split across concurrent connections that commit
+        independently (see _write_batch_parallel for the trade-off).
 
         Args:
             states: List of GlobalState objects to write
@@ -266,61 +548,273 @@ class SQLServerSink(AbstractSink):
         if not states:
             return  # Nothing to write
 
-        conn = None
-        failed_pk = None
+        # Extract all rows first (fail fast before touching the database)
+        rows = []
+        for state in states:
+            try:
+                rows.append(self._apply_column_map(state))
+            except Exception as e:
+                raise SinkError(
+                    pk=state.pk,
+                    original_error=Exception(
+                        f"Failed to apply column_map: {type(e).__name__}: {e}"
+                    ),
+                ) from e
 
-        try:
-            conn = pyodbc.connect(self.connection_string)
-            conn.autocommit = False  # Begin transaction
+        pks = [state.pk for state in states]
 
-            for state in states:
-                failed_pk = state.pk  # Track which row we're processing
+        if self.bulk_load:
+            self._write_batch_bulk(rows, pks)
+            return
 
-                # Extract values from state
-                try:
-                    row_data = self._apply_column_map(state)
-                except Exception as e:
-                    raise SinkError(
-                        pk=state.pk,
-                        original_error=Exception(
-                            f"Failed to apply column_map: {type(e).__name__}: {e}"
-                        ),
-                    ) from e
+        if self.parallel_batches > 1 and len(rows) > 1:
+            self._write_batch_parallel(rows, pks)
+            return
 
-                # Ensure columns are in consistent order
-                columns = list(row_data.keys())
-                values = [row_data[col] for col in columns]
+        conn = None
+        failed_pk = None
 
-                # Build and execute MERGE
-                merge_sql = self._build_merge_sql(columns)
+        try:
+            conn = self._get_conn()  # autocommit is off: begins a transaction
 
-                cursor = conn.cursor()
-                cursor.execute(merge_sql, values)
+            inserted, updated = self._merge_rows(conn, rows, pks)
 
             # Commit transaction if all writes succeeded
             conn.commit()
 
+            logger.debug(
+                "Merged %d rows into %s: %d inserted, %d updated",
+                len(rows), self.target_table, inserted, updated,
+            )
+
         except SinkError:
-            # Re-raise SinkError as-is
+            # Re-raise SinkError as-is (raised by _merge_rows with the
+            # failing chunk's pk context)
             if conn:
                 conn.rollback()
+            self._discard_conn()
             raise
-        except pyodbc.Error as e:
+        except Exception as e:
             if conn:
                 conn.rollback()
             raise SinkError(
                 pk=failed_pk or "unknown",
-                original_error=Exception(
-                    f"Failed to execute batch MERGE for table {self.target_table}: {e}"
-                ),
+                original_error=e,
             ) from e
-        except Exception as e:
+
+    def _merge_rows(
+        self,
+        conn: pyodbc.Connection,
+        rows: list[list[Any]],
+        pks: list[str],
+    ) -> tuple[int, int]:
+        """
+        Execute the chunked set-based MERGEs for rows on a connection.
+
+        Does not commit; the caller owns the transaction.
+
+        Args:
+            conn: Open connection with autocommit disabled
+            rows: Positional value lists in self._columns order
+            pks: Primary keys aligned with rows, for error context
+
+        Returns:
+            Tuple of (inserted, updated) row counts from OUTPUT $action
+
+        Raises:
+            SinkError: If any MERGE fails, carrying the first pk of the
+                      failing chunk
+        """
+        cursor = conn.cursor()
+        rows_per_chunk = max(1, self._MAX_PARAMS // len(self._columns))
+
+        inserted = updated = 0
+        for start in range(0, len(rows), rows_per_chunk):
+            chunk = rows[start:start + rows_per_chunk]
+            merge_sql = self._build_batch_merge_sql(self._columns, len(chunk))
+            flat_params = [value for row in chunk for value in row]
+            if self._input_sizes is not None:
+                # The table value constructor repeats the column set once
+                # per row, so the declarations repeat to match
+                cursor.setinputsizes(self._input_sizes * len(chunk))
+            try:
+                cursor.execute(merge_sql, flat_params)
+            except pyodbc.Error as e:
+                raise SinkError(
+                    pk=pks[start],
+                    original_error=Exception(
+                        f"Failed to execute batch MERGE for table "
+                        f"{self.target_table}: {e}"
+                    ),
+                ) from e
+
+            # Tally the OUTPUT $action rows emitted by the MERGE
+            for (action,) in cursor.fetchall():
+                if action == "INSERT":
+                    inserted += 1
+                else:
+                    updated += 1
+
+        return inserted, updated
+
+    def _write_batch_parallel(self, rows: list[list[Any]], pks: list[str]) -> None:
+        """
+        Merge a batch as concurrent, independently committed sub-batches.
+
+        Each of up to parallel_batches workers opens its own connection
+        (cheap with driver-manager pooling enabled), merges a contiguous
+        slice and commits it, so network round trips overlap across
+        connections. Note the atomicity trade-off: a failure rolls back
+        only its own slice — slices already committed by other workers
+        stay written. MERGE is idempotent over the merge keys, so re-running
+        the batch after a partial failure converges.
+
+        Args:
+            rows: Positional value lists in self._columns order
+            pks: Primary keys aligned with rows
+
+        Raises:
+            SinkError: The first slice failure, after all slices finish
+        """
+        if self._batch_pool is None:
+            self._batch_pool = ThreadPoolExecutor(
+                max_workers=self.parallel_batches,
+                thread_name_prefix="llm-etl-sql-sink",
+            )
+
+        slice_size = -(-len(rows) // self.parallel_batches)  # Ceiling division
+
+        def merge_slice(start: int) -> tuple[int, int]:
+            conn = pyodbc.connect(self.connection_string, autocommit=False)
+            try:
+                counts = self._merge_rows(
+                    conn,
+                    rows[start:start + slice_size],
+                    pks[start:start + slice_size],
+                )
+                conn.commit()
+                return counts
+            except SinkError:
+                conn.rollback()
+                raise
+            except Exception as e:
+                conn.rollback()
+                raise SinkError(pk=pks[start], original_error=e) from e
+            finally:
+                conn.close()
+
+        futures = [
+            self._batch_pool.submit(merge_slice, start)
+            for start in range(0, len(rows), slice_size)
+        ]
+
+        inserted = updated = 0
+        first_error: Optional[SinkError] = None
+        for future in futures:
+            try:
+                counts = future.result()
+            except SinkError as e:
+                if first_error is None:
+                    first_error = e
+            else:
+                inserted += counts[0]
+                updated += counts[1]
+
+        if first_error is not None:
+            raise first_error
+
+        logger.debug(
+            "Merged %d rows into %s: %d inserted, %d updated",
+            len(rows), self.target_table, inserted, updated,
+        )
+
+    def _write_batch_bulk(self, rows: list[list[Any]], pks: list[str]) -> None:
+        """
+        Load a batch through a temp staging table and one MERGE.
+
+        The rows are pushed into a session-scoped staging table with a
+        single fast_executemany INSERT (one round trip, parameters bound
+        server-side), then folded into the target with one set-based
+        MERGE and the staging table is dropped. Unlike the chunked
+        table-value-constructor path this is not bound by the per-
+        statement parameter limit, so very large batches stay one
+        INSERT + one MERGE regardless of size.
+
+        Args:
+            rows: Positional value lists in self._columns order
+            pks: Primary keys aligned with rows, for error context
+
+        Raises:
+            SinkError: If staging or merging fails
+        """
+        stage = f"#stage_{uuid.uuid4().hex[:12]}"
+        column_list = ", ".join(self._columns)
+        placeholders = ", ".join("?" for _ in self._columns)
+
+        on_conditions = " AND ".join(
+            f"target.{key} = source.{key}" for key in self.merge_keys
+        )
+        non_key_columns = [
+            col for col in self._columns if col not in self._merge_key_set
+        ]
+        if non_key_columns:
+            update_set = ", ".join(
+                f"{col} = source.{col}" for col in non_key_columns
+            )
+            update_clause = f"""WHEN MATCHED THEN
+            UPDATE SET
+                {update_set}
+        """
+        else:
+            update_clause = ""
+        insert_values = ", ".join(f"source.{col}" for col in self._columns)
+
+        conn = None
+        try:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+
+            # Clone the target's column types into the staging table
+            cursor.execute(
+                f"SELECT TOP 0 {column_list} INTO {stage} "
+                f"FROM {self.target_table};"
+            )
+
+            # One round trip for the whole batch. With fast_executemany,
+            # explicit input sizes also sidestep the driver probing
+            # parameter values for max widths (the documented
+            # VARCHAR(MAX) performance cliff).
+            cursor.fast_executemany = True
+            if self._input_sizes is not None:
+                cursor.setinputsizes(self._input_sizes)
+            cursor.executemany(
+                f"INSERT INTO {stage} ({column_list}) VALUES ({placeholders})",
+                rows,
+            )
+
+            cursor.execute(
+                f"""MERGE {self.target_table} AS target
+        USING {stage} AS source
+        ON {on_conditions}
+        {update_clause}WHEN NOT MATCHED THEN
+            INSERT ({column_list})
+            VALUES ({insert_values});"""
+            )
+            cursor.execute(f"DROP TABLE {stage};")
+            conn.commit()
+
+            logger.debug(
+                "Bulk-loaded %d rows into %s via staging table",
+                len(rows), self.target_table,
+            )
+
+        except pyodbc.Error as e:
             if conn:
                 conn.rollback()
+            self._discard_conn()
             raise SinkError(
-                pk=failed_pk or "unknown",
-                original_error=e,
+                pk=pks[0],
+                original_error=Exception(
+                    f"Failed bulk load into {self.target_table}: {e}"
+                ),
             ) from e
-        finally:
-            if conn:
-                conn.close()
@@ -2,20 +2,35 @@
 Data source implementations.
 
 Sources are responsible for ingesting data into the pipeline.
+
+Symbols are resolved lazily (PEP 562); in particular the SQL Server
+source only imports (and with it pyodbc) on first access.
 """
 
-from llm_etl.sources.base import AbstractSource
-from llm_etl.sources.csv_source import CSVSource
+_LAZY_IMPORTS = {
+    "AbstractSource": ("llm_etl.sources.base", "AbstractSource"),
+    "CSVSource": ("llm_etl.sources.csv_source", "CSVSource"),
+    "SQLServerSource": ("llm_etl.sources.sql_server", "SQLServerSource"),
+}
+
 
-# Lazy import for SQL Server to avoid pyodbc dependency when not needed
 def __getattr__(name):
-    if name == "SQLServerSource":
-        from llm_etl.sources.sql_server import SQLServerSource
-        return SQLServerSource
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
-
-__all__ = [
-    "AbstractSource",
-    "SQLServerSource",
-    "CSVSource",
-]
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+__all__ = [*_LAZY_IMPORTS]
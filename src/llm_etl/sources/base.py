@@ -5,8 +5,9 @@ Sources are responsible for reading data from external systems
 (SQL Server, CSV files, APIs, etc.) and converting each row into a GlobalState object.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from typing import AsyncIterator, Iterator, Optional
 
 from ..core.state import GlobalState
 
@@ -57,6 +58,29 @@ class AbstractSource(ABC):
         """
         pass
 
+    async def __aiter__(self) -> AsyncIterator[GlobalState]:
+        """
+        Async iteration over the source.
+
+        The default pulls each row from the blocking iterator on a worker
+        thread, so an event-loop caller (e.g. Pipeline.arun) is never
+        blocked by source I/O. Sources backed by a native async driver
+        should override this.
+
+        Yields:
+            GlobalState objects, one per row
+
+        Raises:
+            SourceError: If reading from the source fails
+        """
+        iterator = iter(self)
+        sentinel = object()
+        while True:
+            state = await asyncio.to_thread(next, iterator, sentinel)
+            if state is sentinel:
+                break
+            yield state
+
     @abstractmethod
     def count(self) -> Optional[int]:
         """
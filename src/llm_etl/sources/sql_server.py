@@ -6,8 +6,9 @@ Supports environment variable fallback for connection strings.
 """
 
 import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Any, Iterator, Optional
 
 import pyodbc
 
@@ -16,6 +17,45 @@ from ..core.state import GlobalState
 from .base import AbstractSource
 
 
+class _RowView(Mapping):
+    """
+    Read-only mapping over one result row's value tuple.
+
+    Rows share one column tuple and one name-to-index map built per
+    query, so yielding a row costs a tuple copy instead of a dict of all
+    columns — on wide tables most of which downstream steps never read.
+    GlobalState accepts any mapping, and consumers that do need a plain
+    dict get one lazily via GlobalState.raw_as_dict().
+    """
+
+    __slots__ = ("_columns", "_idx_map", "_values")
+
+    def __init__(
+        self,
+        columns: tuple[str, ...],
+        idx_map: dict[str, int],
+        values: tuple[Any, ...],
+    ):
+        self._columns = columns
+        self._idx_map = idx_map
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._idx_map[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"_RowView({dict(self)!r})"
+
+
 class SQLServerSource(AbstractSource):
     """
     SQL Server data source.
@@ -61,6 +101,8 @@ class SQLServerSource(AbstractSource):
         sql_file: str,
         primary_key_column: str,
         connection_string: Optional[str] = None,
+        fetch_size: int = 1000,
+        use_turbodbc: bool = False,
     ):
         """
         Initialize the SQL Server source.
@@ -72,14 +114,29 @@ class SQLServerSource(AbstractSource):
             sql_file: Path to .sql file containing the query
             primary_key_column: Column name to use as GlobalState.pk
             connection_string: ODBC connection string (optional, defaults to env var)
+            fetch_size: Rows pulled per fetchmany() call. Larger values
+                       amortize network round trips across more rows at
+                       the cost of memory for one chunk (default: 1000)
+            use_turbodbc: Read results through turbodbc's Arrow fetch
+                         path instead of pyodbc. Batches are materialized
+                         columnar in C++ rather than row-by-row through
+                         Python, which is much faster on wide result
+                         sets. Requires the optional turbodbc package;
+                         the pyodbc default adds no new dependency
 
         Raises:
             FileNotFoundError: If the SQL file does not exist
-            ValueError: If connection_string is None and SQL_SERVER_CONN env var is not set
+            ValueError: If connection_string is None and SQL_SERVER_CONN env var is not set,
+                       or if fetch_size is not positive
         """
         self.primary_key_column = primary_key_column
         self.sql_file = sql_file
 
+        if fetch_size < 1:
+            raise ValueError(f"fetch_size must be >= 1, got {fetch_size}")
+        self.fetch_size = fetch_size
+        self.use_turbodbc = use_turbodbc
+
         # Read SQL file content (fail fast if file doesn't exist)
         sql_path = Path(sql_file)
         if not sql_path.exists():
@@ -101,6 +158,55 @@ class SQLServerSource(AbstractSource):
 
         self.connection_string = connection_string
 
+        # Persistent connection and cursor, reused across iterations
+        # (retries, multi-pass runs). Reusing one cursor lets pyodbc's
+        # statement cache hand SQL Server the already-compiled plan for
+        # the identical query text instead of re-parsing it per run.
+        self._conn: Optional[pyodbc.Connection] = None
+        self._cursor: Optional[pyodbc.Cursor] = None
+
+    def _get_cursor(self) -> pyodbc.Cursor:
+        """
+        Return the persistent cursor, reconnecting if the link went stale.
+
+        Returns:
+            An open cursor on the persistent connection
+
+        Raises:
+            pyodbc.Error: If establishing a new connection fails
+        """
+        if self._conn is not None:
+            try:
+                self._conn.execute("SELECT 1")
+                return self._cursor
+            except pyodbc.Error:
+                self.close()
+
+        self._conn = pyodbc.connect(self.connection_string)
+        self._cursor = self._conn.cursor()
+        return self._cursor
+
+    def close(self) -> None:
+        """
+        Release the persistent connection.
+
+        Safe to call repeatedly; the next iteration reconnects.
+        """
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except pyodbc.Error:
+                pass
+            self._conn = None
+            self._cursor = None
+
+    def __del__(self):
+        """Best-effort release if the source is dropped without close()."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def __iter__(self) -> Iterator[GlobalState]:
         """
         Execute the SQL query and yield GlobalState objects for each row.
@@ -114,9 +220,13 @@ class SQLServerSource(AbstractSource):
         Raises:
             SourceError: If connection fails, query execution fails, or primary key column is missing
         """
+        if self.use_turbodbc:
+            yield from self._iter_turbodbc()
+            return
+
         try:
-            # Connect to SQL Server
-            conn = pyodbc.connect(self.connection_string)
+            # Connect (or reuse the persistent connection)
+            cursor = self._get_cursor()
         except pyodbc.Error as e:
             raise SourceError(
                 f"Failed to connect to SQL Server: {e}. "
@@ -124,8 +234,6 @@ class SQLServerSource(AbstractSource):
             ) from e
 
         try:
-            cursor = conn.cursor()
-
             # Execute the query
             try:
                 cursor.execute(self.sql_content)
@@ -151,33 +259,121 @@ class SQLServerSource(AbstractSource):
                     f"Available columns: {column_names}"
                 )
 
-            # Yield GlobalState for each row
-            for row in cursor:
-                # Convert row to dictionary
-                row_dict = dict(zip(column_names, row))
-
-                # Extract primary key value
-                pk_value = row_dict[self.primary_key_column]
-                if pk_value is None:
-                    raise SourceError(
-                        f"Primary key column '{self.primary_key_column}' has NULL value. "
-                        f"All primary keys must be non-NULL."
+            # Positional pk access inside the hot loop skips a dict
+            # lookup per row
+            pk_idx = column_names.index(self.primary_key_column)
+
+            # Shared across every _RowView yielded from this query
+            columns_tuple = tuple(column_names)
+            idx_map = {name: i for i, name in enumerate(column_names)}
+
+            # Pull rows in chunks: per-row iteration pays a round trip's
+            # worth of driver work per row, while fetchmany keeps the
+            # ODBC row cache full and amortizes it across fetch_size rows
+            cursor.arraysize = self.fetch_size
+            while True:
+                rows = cursor.fetchmany(self.fetch_size)
+                if not rows:
+                    break
+
+                for row in rows:
+                    # Extract primary key value
+                    pk_value = row[pk_idx]
+                    if pk_value is None:
+                        raise SourceError(
+                            f"Primary key column '{self.primary_key_column}' has NULL value. "
+                            f"All primary keys must be non-NULL."
+                        )
+
+                    # Wrap the value tuple instead of materializing a
+                    # dict per row; see _RowView
+                    yield GlobalState(
+                        pk=str(pk_value),
+                        raw=_RowView(columns_tuple, idx_map, tuple(row)),
                     )
 
-                # Convert pk to string for consistency
-                pk_str = str(pk_value)
-
-                # Create and yield GlobalState
-                yield GlobalState(pk=pk_str, raw=row_dict)
-
         except SourceError:
             # Re-raise SourceError as-is
             raise
         except Exception as e:
             # Wrap any other errors
             raise SourceError(f"Unexpected error while reading from SQL Server: {e}") from e
+
+    def _iter_turbodbc(self) -> Iterator[GlobalState]:
+        """
+        Iterate over rows using turbodbc's Arrow fetch path.
+
+        turbodbc reads the TDS result set directly into Arrow record
+        batches in C++, so row data never round-trips through the Python
+        row layer — typically several times faster than pyodbc on wide
+        result sets. Batches stream one at a time, keeping memory bounded
+        like the fetchmany loop. A fresh connection is opened per
+        iteration (the persistent pyodbc connection is not shared).
+
+        Yields:
+            GlobalState objects, one per row
+
+        Raises:
+            SourceError: If turbodbc is not installed, connection fails,
+                        or the primary key column is missing
+        """
+        try:
+            import turbodbc
+        except ImportError:
+            raise SourceError(
+                "use_turbodbc=True requires the turbodbc package. "
+                "Install it or leave the default pyodbc reader."
+            )
+
+        try:
+            conn = turbodbc.connect(
+                connection_string=self.connection_string,
+                turbodbc_options=turbodbc.make_options(
+                    prefer_unicode=True,
+                    use_async_io=True,
+                ),
+            )
+        except turbodbc.Error as e:
+            raise SourceError(
+                f"Failed to connect to SQL Server via turbodbc: {e}. "
+                f"Check your connection string and network connectivity."
+            ) from e
+
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.sql_content)
+            except turbodbc.Error as e:
+                raise SourceError(
+                    f"Failed to execute SQL query from {self.sql_file}: {e}. "
+                    f"Check your SQL syntax and table permissions."
+                ) from e
+
+            validated_pk = False
+            for batch in cursor.fetcharrowbatches():
+                if not validated_pk:
+                    if self.primary_key_column not in batch.schema.names:
+                        raise SourceError(
+                            f"Primary key column '{self.primary_key_column}' not found "
+                            f"in query results. Available columns: {batch.schema.names}"
+                        )
+                    validated_pk = True
+
+                for row in batch.to_pylist():
+                    pk_value = row.get(self.primary_key_column)
+                    if pk_value is None:
+                        raise SourceError(
+                            f"Primary key column '{self.primary_key_column}' has NULL value. "
+                            f"All primary keys must be non-NULL."
+                        )
+
+                    yield GlobalState(pk=str(pk_value), raw=row)
+
+        except SourceError:
+            raise
+        except Exception as e:
+            raise SourceError(f"Unexpected error while reading from SQL Server: {e}") from e
         finally:
-            # Always close the connection
             conn.close()
 
     def count(self) -> Optional[int]:
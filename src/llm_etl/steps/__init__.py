@@ -2,14 +2,36 @@
 Processing steps for LLM-based transformations.
 
 Steps are reusable, composable transformation units that operate on GlobalState.
+
+Symbols are resolved lazily (PEP 562) so importing the package never
+eagerly pulls in the pydantic-backed step modules.
 """
 
-from llm_etl.steps.base import AbstractBaseStep
-from llm_etl.steps.classifier import ClassifierStep
-from llm_etl.steps.summarizer import SummarizerStep
+_LAZY_IMPORTS = {
+    "AbstractBaseStep": ("llm_etl.steps.base", "AbstractBaseStep"),
+    "ClassifierStep": ("llm_etl.steps.classifier", "ClassifierStep"),
+    "FusedStep": ("llm_etl.steps.fused", "FusedStep"),
+    "SummarizerStep": ("llm_etl.steps.summarizer", "SummarizerStep"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    import importlib
+
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
-__all__ = [
-    "AbstractBaseStep",
-    "ClassifierStep",
-    "SummarizerStep",
-]
+__all__ = [*_LAZY_IMPORTS]
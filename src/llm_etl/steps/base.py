@@ -5,12 +5,34 @@ Steps are reusable, composable transformation units that operate on GlobalState.
 They use the input_map pattern to decouple from other steps.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Optional
 
 from pydantic import BaseModel
 
-from llm_etl.core.state import GlobalState
+from llm_etl.core.state import GlobalState, ModelView
+
+
+class _AttrView:
+    """
+    Read-only attribute-style view over a mapping.
+
+    Lets format templates like "Dept: {raw.department}" resolve dict keys
+    through attribute access, which is what str.format_map expects.
+    """
+
+    __slots__ = ("_mapping",)
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._mapping[name]
+        except KeyError:
+            raise AttributeError(name)
 
 
 class AbstractBaseStep(ABC):
@@ -55,8 +77,15 @@ class AbstractBaseStep(ABC):
 
         Args:
             name: Unique identifier for this step (used in logs and errors)
-            input_map: Dictionary mapping parameter names to lambdas that extract
-                      values from GlobalState. Keys become parameters in execute().
+            input_map: Dictionary mapping parameter names to extractors.
+                      Each extractor is one of:
+                      - a callable taking GlobalState (e.g. lambda s: s.raw["note"])
+                      - a dotted path spec like "raw.clinical_note" or
+                        "processed.visit_type.category", compiled at
+                        construction into itemgetter chains
+                      - a format template like "Dept: {raw.department}"
+                        resolved per row with str.format_map
+                      Keys become parameters in execute().
             output_key: Key under which to store this step's output in
                        GlobalState.processed
 
@@ -64,8 +93,8 @@ class AbstractBaseStep(ABC):
             >>> step = MyStep(
             ...     name="classifier",
             ...     input_map={
-            ...         "text": lambda s: s.raw["clinical_note"],
-            ...         "context": lambda s: f"Dept: {s.raw['department']}"
+            ...         "text": "raw.clinical_note",
+            ...         "context": "Dept: {raw.department}",
             ...     },
             ...     output_key="visit_type"
             ... )
@@ -74,6 +103,67 @@ class AbstractBaseStep(ABC):
         self.input_map = input_map
         self.output_key = output_key
 
+        # Compile extractors once; path specs become itemgetter chains so
+        # per-row extraction is a handful of C-level calls
+        self._accessors: tuple[tuple[str, Callable[[GlobalState], Any]], ...] = tuple(
+            (key, self._compile_accessor(spec)) for key, spec in input_map.items()
+        )
+
+    @staticmethod
+    def _compile_accessor(spec: Any) -> Callable[[GlobalState], Any]:
+        """
+        Compile a single input_map entry into an accessor callable.
+
+        Callables pass through unchanged. Dotted path specs are compiled
+        into an attrgetter on the state followed by itemgetters for each
+        nested key. Format templates are bound to str.format_map over an
+        attribute-style view of the state.
+
+        Args:
+            spec: Callable, dotted path string, or format template string
+
+        Returns:
+            Callable taking GlobalState and returning the extracted value
+
+        Raises:
+            TypeError: If spec is neither a callable nor a string
+        """
+        if callable(spec):
+            return spec
+
+        if not isinstance(spec, str):
+            raise TypeError(
+                f"input_map values must be callables or path/template strings, "
+                f"got {type(spec).__name__}"
+            )
+
+        if "{" in spec:
+            def template_accessor(state: GlobalState, _template: str = spec) -> str:
+                return _template.format_map(
+                    {
+                        "pk": state.pk,
+                        "raw": _AttrView(state.raw),
+                        "processed": _AttrView(state.processed),
+                    }
+                )
+
+            return template_accessor
+
+        head, *rest = spec.split(".")
+        attr_get = attrgetter(head)
+        if not rest:
+            return attr_get
+
+        item_gets = tuple(itemgetter(part) for part in rest)
+
+        def path_accessor(state: GlobalState) -> Any:
+            value = attr_get(state)
+            for get in item_gets:
+                value = get(value)
+            return value
+
+        return path_accessor
+
     def _apply_input_map(self, state: GlobalState) -> dict[str, Any]:
         """
         Apply the input_map to extract values from GlobalState.
@@ -103,7 +193,43 @@ class AbstractBaseStep(ABC):
             >>> mapped["context"]
             'Age: 45'
         """
-        return {key: func(state) for key, func in self.input_map.items()}
+        return {key: func(state) for key, func in self._accessors}
+
+    @staticmethod
+    def _get_processed(
+        state: GlobalState,
+        key: str,
+        model_cls: Optional[type[BaseModel]] = None,
+    ) -> Any:
+        """
+        Fetch an earlier step's output, as a model when one is wanted.
+
+        Outputs in state.processed were validated when the producing step
+        ran, so consumers must never pay a second validation pass. Live
+        pipeline states hold ModelView wrappers and the original model is
+        returned directly; states rehydrated from plain dicts (from_dict,
+        dead-letter replays) are re-materialized with
+        model_cls.model_construct(), which skips validation entirely.
+
+        Args:
+            state: The GlobalState holding the earlier output
+            key: The producing step's output_key
+            model_cls: Expected model class; when None the stored
+                      mapping is returned as-is
+
+        Returns:
+            The model instance when model_cls is given, otherwise the
+            stored mapping
+
+        Raises:
+            KeyError: If no output is stored under key
+        """
+        value = state.processed[key]
+        if model_cls is None:
+            return value
+        if isinstance(value, ModelView):
+            return value.model
+        return model_cls.model_construct(**value)
 
     @abstractmethod
     def execute(self, mapped_input: dict[str, Any], llm_client: Any, pk: str) -> BaseModel:
@@ -134,6 +260,51 @@ class AbstractBaseStep(ABC):
         """
         pass
 
+    async def aexecute(
+        self, mapped_input: dict[str, Any], llm_client: Any, pk: str
+    ) -> BaseModel:
+        """
+        Async variant of execute().
+
+        The default offloads the blocking execute() to a worker thread so
+        async callers never block the event loop. Steps whose client
+        supports native async calls (acomplete_with_validation) should
+        override this to await them directly and avoid the thread hop.
+
+        Args:
+            mapped_input: Dictionary of inputs resolved from input_map
+            llm_client: LLM client instance for making API calls
+            pk: Primary key of the record being processed (for logging)
+
+        Returns:
+            Pydantic BaseModel containing the step's output
+
+        Raises:
+            StepExecutionError: If step logic fails
+            LLMValidationError: If LLM output fails validation
+        """
+        return await asyncio.to_thread(self.execute, mapped_input, llm_client, pk)
+
+    def _validate_output(self, result: BaseModel) -> BaseModel:
+        """
+        Apply step-specific business validation to an LLM output.
+
+        Called after Pydantic schema validation. The default is a no-op;
+        steps with business rules beyond the schema (e.g. the classifier's
+        taxonomy membership check) override this. Offline execution paths
+        that bypass execute() use this hook to keep validation consistent.
+
+        Args:
+            result: The schema-validated LLM output
+
+        Returns:
+            The validated result
+
+        Raises:
+            ValueError: If the output violates the step's business rules
+        """
+        return result
+
     def run(self, state: GlobalState, llm_client: Any) -> GlobalState:
         """
         Execute the step on a GlobalState, updating it with results.
@@ -171,8 +342,10 @@ class AbstractBaseStep(ABC):
         # 2. Execute the step's core logic
         result = self.execute(mapped_input, llm_client, pk=state.pk)
 
-        # 3. Store result as dict in processed
-        state.processed[self.output_key] = result.model_dump()
+        # 3. Store the result behind a lazy mapping view: downstream
+        # lookups hit model attributes directly, and the recursive
+        # model_dump() only runs if a serialization boundary needs it
+        state.processed[self.output_key] = ModelView(result)
 
         # 4. Log that this step ran
         state.log.append(self.name)
@@ -180,6 +353,107 @@ class AbstractBaseStep(ABC):
         # 5. Return updated state
         return state
 
+    async def arun(self, state: GlobalState, llm_client: Any) -> GlobalState:
+        """
+        Async variant of run(): awaits aexecute() instead of blocking.
+
+        Performs the same input mapping, result storage and logging as
+        run(), so sync and async callers observe identical state updates.
+
+        Args:
+            state: The GlobalState to process
+            llm_client: LLM client instance for making API calls
+
+        Returns:
+            The updated GlobalState with results in .processed and step logged
+        """
+        mapped_input = self._apply_input_map(state)
+
+        result = await self.aexecute(mapped_input, llm_client, pk=state.pk)
+
+        state.processed[self.output_key] = ModelView(result)
+        state.log.append(self.name)
+
+        return state
+
+    async def arun_many(
+        self,
+        states: list[GlobalState],
+        llm_client: Any,
+        concurrency: int = 8,
+    ) -> list[GlobalState]:
+        """
+        Run the step over many states concurrently.
+
+        The hot path of a step is a network-bound LLM round trip, so
+        dispatching rows concurrently under a bounded semaphore overlaps
+        those waits and scales throughput near-linearly up to concurrency
+        (and the provider's rate limits). Order is preserved; a failure
+        in any row propagates after the gather completes.
+
+        Args:
+            states: List of GlobalStates to process
+            llm_client: LLM client instance for making API calls
+            concurrency: Maximum rows in flight at once (default: 8)
+
+        Returns:
+            The updated GlobalStates, in the same order as the input
+
+        Raises:
+            ValueError: If concurrency is not positive
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(state: GlobalState) -> GlobalState:
+            async with semaphore:
+                return await self.arun(state, llm_client)
+
+        return list(await asyncio.gather(*(bounded(state) for state in states)))
+
+    def safe_run(
+        self, state: GlobalState, llm_client: Any
+    ) -> tuple[Optional[GlobalState], Optional[Exception]]:
+        """
+        Execute the step, returning failure as a value instead of raising.
+
+        Raising and unwinding an exception costs microseconds per row; on
+        pipelines where failures are routine (skip or dead-letter modes)
+        that cost lands on every bad row. This wrapper converts failures
+        into a returned error so the pipeline only pays for a raise when
+        it actually propagates one (on_row_error="fail").
+
+        Args:
+            state: The GlobalState to process
+            llm_client: LLM client instance for making API calls
+
+        Returns:
+            (updated_state, None) on success, (None, error) on failure
+        """
+        try:
+            return self.run(state, llm_client), None
+        except Exception as e:
+            return None, e
+
+    def run_batch(self, states: list[GlobalState], llm_client: Any) -> list[GlobalState]:
+        """
+        Execute the step on a group of GlobalStates.
+
+        The default implementation simply calls run() once per state. Steps
+        that can amortize work across rows (e.g. marshaling several rows into
+        a single LLM call) should override this method.
+
+        Args:
+            states: List of GlobalStates to process
+            llm_client: LLM client instance for making API calls
+
+        Returns:
+            The updated GlobalStates, in the same order as the input
+        """
+        return [self.run(state, llm_client) for state in states]
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
@@ -6,35 +6,36 @@ Enforces strict taxonomy validation to ensure only valid categories are returned
 """
 
 import json
+import sys
+from dataclasses import dataclass
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field, RootModel, field_validator
 
+from llm_etl.core.exceptions import LLMValidationError
+from llm_etl.core.state import ModelView
 from llm_etl.llm.base_schemas import LLMOutputBase
 from llm_etl.llm.client import LLMClientWithRetry
 from llm_etl.steps.base import AbstractBaseStep
 
 
-class TaxonomyCategory(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TaxonomyCategory:
     """
     A single category in a classification taxonomy.
 
+    A plain frozen dataclass rather than a Pydantic model: taxonomy
+    entries are internal configuration containers that never cross an
+    LLM-output validation boundary, so they don't need (or pay for)
+    Pydantic's validation machinery at construction.
+
     Attributes:
         name: Unique identifier for the category (e.g., "Emergency")
         definition: Clear description of what this category represents
     """
 
-    name: str = Field(..., description="Category identifier")
-    definition: str = Field(..., description="What this category means")
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "name": "Emergency",
-                "definition": "Urgent, unplanned visit for acute symptoms or trauma",
-            }
-        }
-    }
+    name: str
+    definition: str
 
 
 class ClassificationOutput(LLMOutputBase):
@@ -59,6 +60,36 @@ class ClassificationOutput(LLMOutputBase):
         }
     }
 
+    @field_validator("category", mode="after")
+    @classmethod
+    def intern_category(cls, v: str) -> str:
+        """
+        Intern the category string.
+
+        The same handful of taxonomy names recurs across every row of a
+        run; interning stores one shared str object per name, so
+        millions of outputs share pointers and membership checks against
+        the (equally interned) taxonomy set compare identity first.
+        """
+        return sys.intern(v)
+
+
+class BatchClassificationItem(ClassificationOutput):
+    """
+    One row's classification within a marshaled (multi-row) LLM call.
+
+    Extends ClassificationOutput with the primary key so results can be
+    matched back to their input rows.
+    """
+
+    pk: str = Field(..., description="Primary key of the row this result belongs to")
+
+
+class BatchClassificationOutput(RootModel[list[BatchClassificationItem]]):
+    """JSON array of per-row classifications returned by a marshaled call."""
+
+    pass
+
 
 class ClassifierStep(AbstractBaseStep):
     """
@@ -87,6 +118,7 @@ class ClassifierStep(AbstractBaseStep):
         taxonomy: list[TaxonomyCategory | dict],
         input_map: dict,
         output_key: str,
+        batch_size: int = 8,
     ):
         """
         Initialize the classifier step.
@@ -96,12 +128,21 @@ class ClassifierStep(AbstractBaseStep):
             taxonomy: List of TaxonomyCategory objects or dicts defining valid categories
             input_map: Mapping of parameter names to lambdas extracting from GlobalState
             output_key: Key under which to store classification results
+            batch_size: Maximum number of rows marshaled into a single LLM call
+                       when the step runs in batch mode. Amortizes network
+                       round-trips across rows. Set to 1 to always classify
+                       one row per call (default: 8)
 
         Raises:
-            ValueError: If taxonomy is empty or contains duplicate names
+            ValueError: If taxonomy is empty or contains duplicate names,
+                       or if batch_size is less than 1
         """
         super().__init__(name, input_map, output_key)
 
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.batch_size = batch_size
+
         # Normalize taxonomy: convert dicts to TaxonomyCategory objects
         self.taxonomy: list[TaxonomyCategory] = []
         for item in taxonomy:
@@ -113,13 +154,33 @@ class ClassifierStep(AbstractBaseStep):
         if not self.taxonomy:
             raise ValueError("Taxonomy cannot be empty")
 
-        # Build set of valid category names for fast validation
-        self.valid_categories: set[str] = {cat.name for cat in self.taxonomy}
+        # Frozen set of valid category names: O(1) membership in the
+        # validation hot path, and immutability guarantees the cached
+        # sorted list below can never go stale. Names are interned to
+        # match ClassificationOutput.intern_category, so the membership
+        # probe hits the identity fast path
+        self.valid_categories: frozenset[str] = frozenset(
+            sys.intern(cat.name) for cat in self.taxonomy
+        )
 
         # Check for duplicates
         if len(self.valid_categories) != len(self.taxonomy):
             raise ValueError("Taxonomy contains duplicate category names")
 
+        # Partial-evaluate the static prompt segments once: the taxonomy
+        # description and JSON name list never change per row, so rebuilding
+        # them per call is pure waste and an unstable prefix would defeat
+        # provider-side prompt caching
+        self._taxonomy_str = "\n".join(
+            f"- {cat.name}: {cat.definition}" for cat in self.taxonomy
+        )
+        # Sorted once; reused by the prompt JSON, validation error
+        # messages and __repr__ instead of re-sorting per use
+        self._sorted_valid = sorted(self.valid_categories)
+        self._valid_names_json = json.dumps(self._sorted_valid)
+        self._system_message = self._build_system_message()
+        self._batch_system_message = self._build_batch_system_message()
+
     @property
     def output_schema(self) -> type[ClassificationOutput]:
         """
@@ -129,41 +190,22 @@ class ClassifierStep(AbstractBaseStep):
         """
         return ClassificationOutput
 
-    def _build_prompt(self, mapped_input: dict[str, Any]) -> list[dict]:
+    def _build_system_message(self) -> dict:
         """
-        Build LLM prompt messages for classification.
-
-        Args:
-            mapped_input: Dictionary with "text" (required) and "context" (optional)
+        Build the static system message for per-row classification.
 
         Returns:
-            List of message dicts with role and content
-
-        Raises:
-            KeyError: If "text" not in mapped_input
+            Message dict with role and content
         """
-        if "text" not in mapped_input:
-            raise KeyError("mapped_input must contain 'text' key")
-
-        # Build taxonomy description
-        taxonomy_lines = []
-        for cat in self.taxonomy:
-            taxonomy_lines.append(f"- {cat.name}: {cat.definition}")
-        taxonomy_str = "\n".join(taxonomy_lines)
-
-        # Valid category names as JSON array
-        valid_names_json = json.dumps(sorted(self.valid_categories))
-
-        # System message with taxonomy and instructions
-        system_message = {
+        return {
             "role": "system",
             "content": f"""You are a precise classification system. Classify the provided text into exactly one category from the taxonomy below.
 
 TAXONOMY:
-{taxonomy_str}
+{self._taxonomy_str}
 
 VALID CATEGORY NAMES (you MUST use one of these exactly):
-{valid_names_json}
+{self._valid_names_json}
 
 Respond with a JSON object matching this schema:
 - category: string (must be one of the valid names above)
@@ -173,6 +215,25 @@ Respond with a JSON object matching this schema:
 Step: {self.name}""",
         }
 
+    def _build_prompt(self, mapped_input: dict[str, Any]) -> list[dict]:
+        """
+        Build LLM prompt messages for classification.
+
+        The cached system message is emitted verbatim as the first message;
+        only the user message is built per row.
+
+        Args:
+            mapped_input: Dictionary with "text" (required) and "context" (optional)
+
+        Returns:
+            List of message dicts with role and content
+
+        Raises:
+            KeyError: If "text" not in mapped_input
+        """
+        if "text" not in mapped_input:
+            raise KeyError("mapped_input must contain 'text' key")
+
         # User message with text to classify
         user_content_parts = [f"Text to classify:\n{mapped_input['text']}"]
 
@@ -182,7 +243,7 @@ Step: {self.name}""",
 
         user_message = {"role": "user", "content": "\n".join(user_content_parts)}
 
-        return [system_message, user_message]
+        return [self._system_message, user_message]
 
     def _validate_category(self, result: ClassificationOutput) -> ClassificationOutput:
         """
@@ -203,10 +264,25 @@ Step: {self.name}""",
         if result.category not in self.valid_categories:
             raise ValueError(
                 f"Invalid category '{result.category}'. "
-                f"Must be one of: {sorted(self.valid_categories)}"
+                f"Must be one of: {self._sorted_valid}"
             )
         return result
 
+    def _validate_output(self, result: ClassificationOutput) -> ClassificationOutput:
+        """
+        Business validation hook: enforce taxonomy membership.
+
+        Args:
+            result: The schema-validated classification output
+
+        Returns:
+            The validated result
+
+        Raises:
+            ValueError: If category is not in valid_categories
+        """
+        return self._validate_category(result)
+
     def execute(
         self,
         mapped_input: dict[str, Any],
@@ -245,11 +321,249 @@ Step: {self.name}""",
         # 4. Return validated result
         return result
 
+    async def aexecute(
+        self,
+        mapped_input: dict[str, Any],
+        llm_client: LLMClientWithRetry,
+        pk: str,
+    ) -> ClassificationOutput:
+        """
+        Async variant of execute(): awaits the client's native async call.
+
+        Avoids the default thread offload — the event loop drives the
+        HTTP wait directly, so many classifications can be in flight at
+        once (see AbstractBaseStep.arun_many).
+
+        Args:
+            mapped_input: Dictionary with "text" and optional "context"
+            llm_client: LLM client with retry logic
+            pk: Primary key of the record being processed
+
+        Returns:
+            Validated ClassificationOutput with category, confidence, and reasoning
+
+        Raises:
+            LLMValidationError: If validation fails after all retries
+            ValueError: If category not in taxonomy (triggers retry)
+        """
+        messages = self._build_prompt(mapped_input)
+
+        result = await llm_client.acomplete_with_validation(
+            messages=messages,
+            response_model=self.output_schema,
+            step_name=self.name,
+            pk=pk,
+        )
+
+        return self._validate_category(result)
+
+    def _build_batch_system_message(self) -> dict:
+        """
+        Build the static system message for marshaled (multi-row) classification.
+
+        Returns:
+            Message dict with role and content
+        """
+        return {
+            "role": "system",
+            "content": f"""You are a precise classification system. Classify EACH of the provided rows into exactly one category from the taxonomy below.
+
+TAXONOMY:
+{self._taxonomy_str}
+
+VALID CATEGORY NAMES (you MUST use one of these exactly):
+{self._valid_names_json}
+
+Respond with a JSON array containing one object per row, each matching this schema:
+- pk: string (the row identifier, copied exactly from the input)
+- category: string (must be one of the valid names above)
+- confidence: number between 0.0 and 1.0
+- reasoning: string explaining your classification decision
+
+Step: {self.name}""",
+        }
+
+    def _build_batch_prompt(self, rows: list[tuple[str, dict[str, Any]]]) -> list[dict]:
+        """
+        Build LLM prompt messages for a marshaled (multi-row) classification.
+
+        Enumerates all rows in a single user message so one LLM round-trip
+        classifies the whole group. The cached system message comes first.
+
+        Args:
+            rows: List of (pk, mapped_input) tuples to classify together
+
+        Returns:
+            List of message dicts with role and content
+        """
+        row_parts = []
+        for pk, mapped_input in rows:
+            part = f"Row {pk}: {mapped_input['text']}"
+            if "context" in mapped_input and mapped_input["context"]:
+                part += f"\nContext: {mapped_input['context']}"
+            row_parts.append(part)
+
+        user_message = {
+            "role": "user",
+            "content": "Rows to classify:\n\n" + "\n\n".join(row_parts),
+        }
+
+        return [self._batch_system_message, user_message]
+
+    def execute_batch(
+        self,
+        mapped_inputs: list[dict[str, Any]],
+        llm_client: LLMClientWithRetry,
+        pks: list[str],
+    ) -> list[ClassificationOutput]:
+        """
+        Classify multiple rows with a single marshaled LLM call.
+
+        Results are matched back to input rows by pk, falling back to
+        positional matching if the model omitted or mangled a pk. If the
+        marshaled call fails validation entirely, falls back to one
+        execute() call per row so a single bad batch cannot fail all rows.
+
+        Args:
+            mapped_inputs: One mapped_input dict per row (same order as pks)
+            llm_client: LLM client with retry logic
+            pks: Primary keys of the rows being classified
+
+        Returns:
+            One validated ClassificationOutput per row, in input order
+
+        Raises:
+            LLMValidationError: If the per-row fallback also fails validation
+        """
+        rows = list(zip(pks, mapped_inputs))
+        messages = self._build_batch_prompt(rows)
+
+        try:
+            batch_result = llm_client.complete_with_validation(
+                messages=messages,
+                response_model=BatchClassificationOutput,
+                step_name=self.name,
+                pk=",".join(pks),
+            )
+            items = batch_result.root
+
+            if len(items) != len(rows):
+                raise ValueError(
+                    f"Marshaled call returned {len(items)} results "
+                    f"for {len(rows)} rows"
+                )
+
+            # Match results back to rows by pk, positionally if pk is unknown
+            by_pk = {item.pk: item for item in items}
+            results = []
+            for position, (pk, _) in enumerate(rows):
+                item = by_pk.get(pk, items[position])
+                results.append(
+                    self._validate_category(
+                        ClassificationOutput(
+                            category=item.category,
+                            confidence=item.confidence,
+                            reasoning=item.reasoning,
+                        )
+                    )
+                )
+            return results
+
+        except (LLMValidationError, ValueError):
+            # Fall back to per-row calls so one bad batch doesn't fail all
+            # rows. Only validation/shape failures are worth retrying row
+            # by row (pydantic's ValidationError is a ValueError, and the
+            # count-mismatch above raises ValueError directly); hard API
+            # errors — auth, timeouts — would just fail K more times and
+            # propagate instead
+            return [
+                self.execute(mapped_input, llm_client, pk=pk)
+                for pk, mapped_input in rows
+            ]
+
+    async def aclassify_texts(
+        self,
+        texts: list[str],
+        llm_client: LLMClientWithRetry,
+        concurrency: int = 8,
+    ) -> dict[str, list]:
+        """
+        Classify a column of bare texts concurrently, returning columns.
+
+        A convenience for bulk ETL callers that have a column of texts
+        rather than GlobalStates: all prompts are built up front, fired
+        concurrently through the client's batch helper, and the results
+        come back struct-of-arrays (one list per output field) so they
+        drop straight into columnar containers without a per-row dict.
+
+        Args:
+            texts: Texts to classify, one prompt per entry
+            llm_client: LLM client with retry logic
+            concurrency: Maximum prompts in flight at once (default: 8)
+
+        Returns:
+            Dict with "category", "confidence" and "reasoning" lists,
+            aligned with texts
+
+        Raises:
+            LLMValidationError: If any prompt fails validation after all retries
+            ValueError: If a returned category is not in the taxonomy
+        """
+        messages_list = [self._build_prompt({"text": text}) for text in texts]
+        pks = [str(i) for i in range(len(texts))]
+
+        results = await llm_client.acomplete_batch_with_validation(
+            messages_list=messages_list,
+            response_model=self.output_schema,
+            step_name=self.name,
+            pks=pks,
+            concurrency=concurrency,
+        )
+
+        for result in results:
+            self._validate_category(result)
+
+        return {
+            "category": [result.category for result in results],
+            "confidence": [result.confidence for result in results],
+            "reasoning": [result.reasoning for result in results],
+        }
+
+    def run_batch(self, states: list, llm_client: Any) -> list:
+        """
+        Process a group of states, marshaling up to batch_size rows per LLM call.
+
+        Overrides the per-row default from AbstractBaseStep. Falls back to
+        the default behavior when batch_size is 1 or only one state is given.
+
+        Args:
+            states: List of GlobalStates to classify
+            llm_client: LLM client with retry logic
+
+        Returns:
+            The updated GlobalStates, in input order
+        """
+        if self.batch_size <= 1 or len(states) <= 1:
+            return super().run_batch(states, llm_client)
+
+        for start in range(0, len(states), self.batch_size):
+            chunk = states[start : start + self.batch_size]
+            mapped_inputs = [self._apply_input_map(state) for state in chunk]
+            pks = [state.pk for state in chunk]
+
+            results = self.execute_batch(mapped_inputs, llm_client, pks)
+
+            for state, result in zip(chunk, results):
+                state.processed[self.output_key] = ModelView(result)
+                state.log.append(self.name)
+
+        return states
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
             f"ClassifierStep("
             f"name={self.name!r}, "
             f"output_key={self.output_key!r}, "
-            f"categories={sorted(self.valid_categories)})"
+            f"categories={self._sorted_valid})"
         )
@@ -0,0 +1,263 @@
+"""
+FusedStep: fuse several steps into a single LLM call.
+
+When consecutive steps each make their own LLM round-trip per row, the
+pipeline pays network latency and prompt-prefill cost once per step.
+FusedStep composes a joint output schema from its sub-steps and asks the
+model to produce all outputs in one call, cutting API calls per row from
+N to 1 while leaving downstream consumers (input_maps, sink column_maps)
+unchanged.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, create_model
+
+from llm_etl.core.state import GlobalState, ModelView
+from llm_etl.steps.base import AbstractBaseStep
+
+
+class FusedStep(AbstractBaseStep):
+    """
+    Step that executes several sub-steps with a single LLM call.
+
+    The joint output schema has one field per sub-step, keyed by the
+    sub-step's output_key and typed with its output_schema. The joint
+    prompt concatenates each sub-step's instructions and tells the model
+    to resolve the fields in order, so a later field (e.g. a summary) can
+    take an earlier one (e.g. the classification) into account without a
+    second round-trip. The returned object is split back into
+    state.processed[output_key] per sub-step, so sinks and downstream
+    steps see exactly what they would have seen with separate calls.
+
+    Sub-steps must be independent at the input level: because all outputs
+    are produced by one call, a sub-step's input_map cannot reference
+    another fused sub-step's processed output.
+
+    Example:
+        >>> fused = FusedStep(
+        ...     name="classify_and_summarize",
+        ...     steps=[classifier_step, summarizer_step],
+        ... )
+        >>> pipeline = Pipeline(source=source, steps=[fused], sink=sink, ...)
+    """
+
+    def __init__(self, name: str, steps: list[AbstractBaseStep]):
+        """
+        Initialize the fused step.
+
+        Args:
+            name: Unique identifier for the fused step (used in logs)
+            steps: Sub-steps to fuse, in resolution order. Each must expose
+                  an output_schema property and a static system message
+                  (the framework's built-in steps all do).
+
+        Raises:
+            ValueError: If fewer than two sub-steps are given, output_keys
+                       collide, or a sub-step lacks the required attributes
+        """
+        if len(steps) < 2:
+            raise ValueError(
+                f"FusedStep requires at least 2 sub-steps, got {len(steps)}"
+            )
+
+        output_keys = [step.output_key for step in steps]
+        if len(set(output_keys)) != len(output_keys):
+            raise ValueError(
+                f"Fused sub-steps must have distinct output_keys, got {output_keys}"
+            )
+
+        for step in steps:
+            if not hasattr(step, "output_schema") or not hasattr(
+                step, "_system_message"
+            ):
+                raise ValueError(
+                    f"Sub-step '{step.name}' cannot be fused: it must expose "
+                    f"an output_schema property and a static system message"
+                )
+
+        # The fused step owns no input_map of its own; inputs are resolved
+        # through each sub-step's compiled accessors
+        super().__init__(name=name, input_map={}, output_key=name)
+        self.steps = steps
+
+        # Compose the joint schema once: one field per sub-step, typed with
+        # that sub-step's output schema
+        self._output_model: type[BaseModel] = create_model(
+            "FusedOutput",
+            **{step.output_key: (step.output_schema, ...) for step in steps},
+        )
+
+        # Build the static system message once, same as the other steps, so
+        # the prompt prefix stays byte-identical across rows
+        self._system_message = self._build_system_message()
+
+    @property
+    def output_schema(self) -> type[BaseModel]:
+        """Return the composed joint output schema."""
+        return self._output_model
+
+    @staticmethod
+    def _sub_instructions(step: AbstractBaseStep) -> str:
+        """
+        Extract a sub-step's instructions for embedding as a section.
+
+        Drops the sub-step's own "Step: <name>" marker line so the fused
+        message carries exactly one step marker (the fused step's).
+
+        Args:
+            step: The sub-step to extract instructions from
+
+        Returns:
+            The sub-step's system message content, without step markers
+        """
+        content = step._system_message["content"]
+        lines = [
+            line for line in content.split("\n") if not line.startswith("Step:")
+        ]
+        return "\n".join(lines).strip()
+
+    def _build_system_message(self) -> dict:
+        """
+        Build the static system message for the fused call.
+
+        Returns:
+            Message dict with role and content
+        """
+        parts = [
+            "You are a precise multi-task processing system. Produce ALL of "
+            "the outputs described below in a single response. Resolve the "
+            "outputs in the order listed: decide earlier outputs first and "
+            "let later outputs take them into account (e.g. first decide the "
+            "category, then write a summary that emphasizes that category)."
+        ]
+
+        for step in self.steps:
+            parts.append(
+                f"OUTPUT '{step.output_key}':\n{self._sub_instructions(step)}"
+            )
+
+        keys = ", ".join(step.output_key for step in self.steps)
+        parts.append(
+            f"Respond with a single JSON object with exactly these keys: "
+            f"{keys}. Each value must be an object matching that output's "
+            f"schema above."
+        )
+
+        parts.append(f"Step: {self.name}")
+
+        return {"role": "system", "content": "\n\n".join(parts)}
+
+    def _build_prompt(self, mapped_input: dict[str, Any]) -> list[dict]:
+        """
+        Build the joint prompt messages.
+
+        Each sub-step formats its own user content from its mapped inputs;
+        the sections are concatenated under the sub-step's output_key so
+        the model can match inputs to outputs.
+
+        Args:
+            mapped_input: Dict of output_key -> that sub-step's mapped inputs
+
+        Returns:
+            List of message dicts for the LLM
+        """
+        sections = []
+        for step in self.steps:
+            # The sub-step's user message is always the last prompt message
+            sub_messages = step._build_prompt(mapped_input[step.output_key])
+            sections.append(
+                f"=== Input for '{step.output_key}' ===\n"
+                f"{sub_messages[-1]['content']}"
+            )
+
+        user_message = {"role": "user", "content": "\n\n".join(sections)}
+
+        return [self._system_message, user_message]
+
+    def _validate_output(self, result: BaseModel) -> BaseModel:
+        """
+        Apply each sub-step's business validation to its output field.
+
+        Args:
+            result: The schema-validated joint output
+
+        Returns:
+            The validated result
+
+        Raises:
+            ValueError: If any sub-step's output violates its business rules
+        """
+        for step in self.steps:
+            step._validate_output(getattr(result, step.output_key))
+        return result
+
+    def execute(
+        self, mapped_input: dict[str, Any], llm_client: Any, pk: str
+    ) -> BaseModel:
+        """
+        Execute all fused sub-steps with a single LLM call.
+
+        Args:
+            mapped_input: Dict of output_key -> that sub-step's mapped inputs
+            llm_client: LLMClientWithRetry instance
+            pk: Primary key of the record being processed
+
+        Returns:
+            Validated joint output with one field per sub-step
+
+        Raises:
+            LLMValidationError: If validation fails after all retries
+            ValueError: If a sub-step's business validation rejects its field
+        """
+        messages = self._build_prompt(mapped_input)
+
+        result = llm_client.complete_with_validation(
+            messages=messages,
+            response_model=self.output_schema,
+            step_name=self.name,
+            pk=pk,
+        )
+
+        return self._validate_output(result)
+
+    def run(self, state: GlobalState, llm_client: Any) -> GlobalState:
+        """
+        Execute the fused call on a GlobalState, updating it with results.
+
+        Each sub-step's input_map is applied against the state, the joint
+        call is made, and the returned object is split back into
+        state.processed under each sub-step's output_key. Both the
+        sub-step names and the fused step's name are logged so downstream
+        checks written against the unfused pipeline keep working.
+
+        Args:
+            state: The GlobalState to process
+            llm_client: LLM client instance for making API calls
+
+        Returns:
+            The updated GlobalState
+        """
+        mapped_input = {
+            step.output_key: step._apply_input_map(state) for step in self.steps
+        }
+
+        result = self.execute(mapped_input, llm_client, pk=state.pk)
+
+        for step in self.steps:
+            state.processed[step.output_key] = ModelView(
+                getattr(result, step.output_key)
+            )
+            state.log.append(step.name)
+
+        state.log.append(self.name)
+
+        return state
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"FusedStep("
+            f"name={self.name!r}, "
+            f"steps={[step.name for step in self.steps]})"
+        )
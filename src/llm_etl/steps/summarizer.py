@@ -1,10 +1,13 @@
 """
 SummarizerStep: Text summarization with automatic validation.
 
-Calls the LLM to summarize text with optional focus context.
+Calls the LLM to summarize text with optional focus context and
+configurable summarization rules.
 """
 
-from pydantic import Field, field_validator
+from typing import Optional
+
+from pydantic import Field, field_validator, model_validator
 
 from ..llm.base_schemas import LLMOutputBase
 from .base import AbstractBaseStep
@@ -19,6 +22,13 @@ class SummaryOutput(LLMOutputBase):
     """Validated output from SummarizerStep."""
 
     text: str = Field(..., description="The summarized text")
+    word_count: Optional[int] = Field(
+        None, description="Number of words in the summary, as counted by the model"
+    )
+    rules_applied: list[str] = Field(
+        default_factory=list,
+        description="Which of the configured rules the model applied",
+    )
 
     @field_validator("text")
     @classmethod
@@ -29,6 +39,19 @@ class SummaryOutput(LLMOutputBase):
             raise ValueError("Summary text cannot be empty")
         return v
 
+    @model_validator(mode="after")
+    def fill_word_count(self) -> "SummaryOutput":
+        """
+        Fill word_count locally when the model omits it.
+
+        A single str.split() pass is cheap and deterministic, so downstream
+        consumers can rely on the field without a retry round-trip just to
+        get a count.
+        """
+        if self.word_count is None:
+            self.word_count = len(self.text.split())
+        return self
+
 
 # ============================================================================
 # SummarizerStep
@@ -39,11 +62,18 @@ class SummarizerStep(AbstractBaseStep):
     """
     Text summarization step.
 
-    Calls the LLM to summarize text with optional focus context.
+    Calls the LLM to summarize text with optional focus context and
+    an optional list of summarization rules (e.g. length limits).
+
+    The system message (including the rules) is built once at construction
+    and emitted verbatim as the first message of every call. Keeping this
+    static prefix byte-identical across rows lets provider-side prompt
+    caching reuse the prefill instead of recomputing it per row.
 
     Example:
         step = SummarizerStep(
             name="note_summarizer",
+            rules=["Maximum 20 words", "Focus on diagnosis"],
             input_map={
                 "text": lambda s: s.raw["clinical_notes"],
                 "focus": lambda s: s.processed["visit_type"]["category"],
@@ -57,6 +87,7 @@ class SummarizerStep(AbstractBaseStep):
         name: str,
         input_map: dict,
         output_key: str,
+        rules: Optional[list[str]] = None,
     ):
         """
         Initialize the summarizer step.
@@ -65,26 +96,67 @@ class SummarizerStep(AbstractBaseStep):
             name: Step identifier for logging
             input_map: Dict of lambdas to extract inputs from GlobalState
             output_key: Key to store result in state.processed
+            rules: Optional list of summarization rules to enforce
+                  (e.g. "Maximum 20 words"). Included in the system prompt
+                  in the given order.
         """
         super().__init__(name=name, input_map=input_map, output_key=output_key)
+        self.rules = rules or []
+
+        # Build the static system message once; reusing it verbatim keeps the
+        # prompt prefix stable so provider-side prompt caching can hit
+        self._system_message = self._build_system_message()
 
+    @property
+    def output_schema(self) -> type[SummaryOutput]:
+        """
+        Return the output schema for this summarizer.
+
+        Allows subclasses to override with custom summary schemas, and lets
+        offline execution paths validate responses without calling execute().
+        """
+        return SummaryOutput
+
+    def _build_system_message(self) -> dict:
+        """
+        Build the static system message for this step.
+
+        Returns:
+            Message dict with role and content
+        """
+        parts = [
+            "You are a precise text summarization system. Summarize the provided text concisely."
+        ]
+
+        if self.rules:
+            rules_lines = "\n".join(f"- {rule}" for rule in self.rules)
+            parts.append(f"RULES (you MUST follow all of these):\n{rules_lines}")
+
+        parts.append(
+            """Respond with a JSON object:
+- text: your summarized text
+- word_count: number of words in your summary
+- rules_applied: list of the rules you applied
+- reasoning: explain your summarization approach"""
+        )
+
+        parts.append(f"Step: {self.name}")
+
+        return {"role": "system", "content": "\n\n".join(parts)}
 
     def _build_prompt(self, mapped_input: dict) -> list[dict]:
         """
         Construct the system and user messages for the LLM.
 
+        The cached system message always comes first so the static prefix
+        is identical across calls.
+
         Args:
             mapped_input: Dictionary of inputs extracted via input_map
 
         Returns:
             List of message dicts for the LLM
         """
-        system_message = """You are a precise text summarization system. Summarize the provided text concisely.
-
-Respond with a JSON object:
-- text: your summarized text
-- reasoning: explain your summarization approach"""
-
         # Build user message
         user_parts = [f"Text to summarize:\n{mapped_input['text']}"]
 
@@ -94,11 +166,10 @@ Respond with a JSON object:
         user_message = "\n".join(user_parts)
 
         return [
-            {"role": "system", "content": system_message},
+            self._system_message,
             {"role": "user", "content": user_message},
         ]
 
-
     def execute(self, mapped_input: dict, llm_client, pk: str) -> SummaryOutput:
         """
         Execute the summarization step.
@@ -124,9 +195,39 @@ Respond with a JSON object:
         # Call LLM with validation
         result = llm_client.complete_with_validation(
             messages=messages,
-            response_model=SummaryOutput,
+            response_model=self.output_schema,
             step_name=self.name,
             pk=pk,
         )
 
         return result
+
+    async def aexecute(self, mapped_input: dict, llm_client, pk: str) -> SummaryOutput:
+        """
+        Async variant of execute(): awaits the client's native async call.
+
+        Avoids the default thread offload so the event loop can overlap
+        many summarizations (see AbstractBaseStep.arun_many).
+
+        Args:
+            mapped_input: Dictionary of inputs extracted via input_map
+            llm_client: LLMClientWithRetry instance
+            pk: Primary key for logging
+
+        Returns:
+            Validated SummaryOutput
+
+        Raises:
+            ValidationError: If Pydantic validation fails after max_retries
+        """
+        if not mapped_input.get("text", "").strip():
+            raise ValueError("Cannot summarize empty text")
+
+        messages = self._build_prompt(mapped_input)
+
+        return await llm_client.acomplete_with_validation(
+            messages=messages,
+            response_model=self.output_schema,
+            step_name=self.name,
+            pk=pk,
+        )
@@ -0,0 +1,174 @@
+"""
+Tests for the on-disk LLM response cache.
+
+Validates:
+- A repeated identical prompt skips the provider call
+- The cache persists across client instances (re-run scenario)
+- Different prompts do not collide
+- Expired entries are treated as misses
+"""
+
+import pytest
+
+from llm_etl.llm.cache import ResponseCache
+from llm_etl.llm.client import LLMClientWithRetry
+from llm_etl.llm.providers.mock import MockProvider
+from llm_etl.steps.classifier import ClassificationOutput
+
+
+class CountingMock(MockProvider):
+    """Mock provider that counts how many calls actually reach it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.call_count = 0
+
+    def complete(self, messages, response_model):
+        self.call_count += 1
+        return super().complete(messages, response_model)
+
+
+RESPONSE = {
+    "category": "Emergency",
+    "confidence": 0.9,
+    "reasoning": "Acute symptoms",
+}
+
+MESSAGES = [
+    {"role": "system", "content": "Classify the text.\n\nStep: classifier"},
+    {"role": "user", "content": "Chest pain"},
+]
+
+
+def make_client(cache: ResponseCache) -> tuple[LLMClientWithRetry, CountingMock]:
+    """Build a cached retry client over a call-counting mock."""
+    provider = CountingMock(default_response=RESPONSE)
+    return LLMClientWithRetry(provider, max_retries=2, cache=cache), provider
+
+
+def test_repeated_prompt_skips_provider(tmp_path):
+    """The second identical call is served from the cache."""
+    cache = ResponseCache(tmp_path / "cache.db")
+    client, provider = make_client(cache)
+
+    first = client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+    second = client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="2"
+    )
+
+    assert provider.call_count == 1
+    assert first.category == second.category == "Emergency"
+
+
+def test_cache_persists_across_clients(tmp_path):
+    """A fresh client over the same cache file gets hits from a prior run."""
+    path = tmp_path / "cache.db"
+
+    client, provider = make_client(ResponseCache(path))
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+    assert provider.call_count == 1
+
+    client2, provider2 = make_client(ResponseCache(path))
+    client2.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+    assert provider2.call_count == 0
+
+
+def test_different_prompts_do_not_collide(tmp_path):
+    """Changing the user content produces a distinct cache key."""
+    cache = ResponseCache(tmp_path / "cache.db")
+    client, provider = make_client(cache)
+
+    other = [MESSAGES[0], {"role": "user", "content": "Routine checkup"}]
+
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+    client.complete_with_validation(
+        other, ClassificationOutput, step_name="classifier", pk="2"
+    )
+
+    assert provider.call_count == 2
+
+
+def test_expired_entries_miss(tmp_path):
+    """Entries older than expire_seconds are evicted on access."""
+    cache = ResponseCache(tmp_path / "cache.db", expire_seconds=0.001)
+    client, provider = make_client(cache)
+
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+
+    import time
+
+    time.sleep(0.01)
+
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+
+    assert provider.call_count == 2
+
+
+def test_rejects_nonpositive_expiry(tmp_path):
+    """expire_seconds must be positive."""
+    with pytest.raises(ValueError, match="expire_seconds"):
+        ResponseCache(tmp_path / "cache.db", expire_seconds=0)
+
+
+def test_memory_cache_hit_skips_provider():
+    """MemoryCache serves repeated prompts without touching the provider."""
+    from llm_etl.llm.cache import MemoryCache
+
+    client, provider = make_client(MemoryCache())
+
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="1"
+    )
+    client.complete_with_validation(
+        MESSAGES, ClassificationOutput, step_name="classifier", pk="2"
+    )
+
+    assert provider.call_count == 1
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Entries past capacity are evicted oldest-first."""
+    from llm_etl.llm.cache import MemoryCache
+
+    cache = MemoryCache(capacity=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")  # refresh 'a'
+    cache.set("c", "3")  # evicts 'b'
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+
+
+def test_cache_stats_count_hits_and_misses(tmp_path):
+    """Both backends track lookup outcomes in stats."""
+    from llm_etl.llm.cache import MemoryCache
+
+    cache = ResponseCache(tmp_path / "cache.db")
+    assert cache.get("absent") is None
+    cache.set("present", "{}")
+    assert cache.get("present") == "{}"
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+    memory = MemoryCache()
+    memory.set("k", "v")
+    memory.get("k")
+    memory.get("other")
+    assert memory.stats.hits == 1
+    assert memory.stats.misses == 1
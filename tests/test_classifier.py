@@ -358,6 +358,136 @@ def test_valid_category_names_json_in_prompt(simple_taxonomy):
     assert valid_names_sorted in system_content
 
 
+def test_input_map_accepts_path_specs(simple_taxonomy, mock_llm_client):
+    """Test that input_map entries can be dotted path specs instead of lambdas."""
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={"text": "raw.note"},
+        output_key="classification",
+    )
+
+    state = GlobalState(pk="test_001", raw={"note": "Path spec note"})
+    mapped = step._apply_input_map(state)
+
+    assert mapped["text"] == "Path spec note"
+
+    # Full run should work the same as with a lambda
+    updated = step.run(state, mock_llm_client)
+    assert updated.processed["classification"]["category"] == "CategoryA"
+
+
+def test_input_map_accepts_format_templates(simple_taxonomy):
+    """Test that input_map entries can be format templates over state fields."""
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={
+            "text": "raw.note",
+            "context": "Dept: {raw.department}, pk: {pk}",
+        },
+        output_key="classification",
+    )
+
+    state = GlobalState(
+        pk="test_001", raw={"note": "A note", "department": "Cardiology"}
+    )
+    mapped = step._apply_input_map(state)
+
+    assert mapped["context"] == "Dept: Cardiology, pk: test_001"
+
+
+def test_run_batch_marshals_rows_into_one_call(simple_taxonomy):
+    """Test that run_batch classifies multiple rows from one marshaled response."""
+    mock_provider = MockProvider(
+        responses={
+            "test_classifier": [
+                {"pk": "row_1", "category": "CategoryA", "confidence": 0.9, "reasoning": "First"},
+                {"pk": "row_2", "category": "CategoryB", "confidence": 0.8, "reasoning": "Second"},
+            ]
+        }
+    )
+    llm_client = LLMClientWithRetry(mock_provider, max_retries=2)
+
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="classification",
+        batch_size=8,
+    )
+
+    states = [
+        GlobalState(pk="row_1", raw={"note": "First note"}),
+        GlobalState(pk="row_2", raw={"note": "Second note"}),
+    ]
+
+    updated = step.run_batch(states, llm_client)
+
+    # Results should be matched back to rows by pk
+    assert updated[0].processed["classification"]["category"] == "CategoryA"
+    assert updated[1].processed["classification"]["category"] == "CategoryB"
+    assert all("test_classifier" in s.log for s in updated)
+
+
+def test_run_batch_falls_back_to_per_row_on_bad_batch(simple_taxonomy):
+    """Test that an invalid marshaled response falls back to per-row calls."""
+
+    class BatchFailingMock(MockProvider):
+        """Returns garbage for batch calls, valid output for per-row calls."""
+
+        def complete(self, messages, response_model):
+            from llm_etl.steps.classifier import BatchClassificationOutput
+
+            if response_model is BatchClassificationOutput:
+                # Wrong shape: fails RootModel validation on every attempt
+                return response_model.model_validate({"not": "a list"})
+            return response_model.model_validate(
+                {"category": "CategoryA", "confidence": 0.7, "reasoning": "Fallback"}
+            )
+
+    llm_client = LLMClientWithRetry(BatchFailingMock(), max_retries=1)
+
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="classification",
+        batch_size=8,
+    )
+
+    states = [
+        GlobalState(pk="row_1", raw={"note": "First note"}),
+        GlobalState(pk="row_2", raw={"note": "Second note"}),
+    ]
+
+    updated = step.run_batch(states, llm_client)
+
+    # Per-row fallback should still classify every row
+    assert all(s.processed["classification"]["category"] == "CategoryA" for s in updated)
+
+
+def test_batch_prompt_enumerates_rows(simple_taxonomy):
+    """Test that the marshaled prompt lists every row with its pk."""
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="classification",
+    )
+
+    rows = [
+        ("row_1", {"text": "First note"}),
+        ("row_2", {"text": "Second note", "context": "Dept: Cardiology"}),
+    ]
+    messages = step._build_batch_prompt(rows)
+
+    user_message = next(msg for msg in messages if msg["role"] == "user")
+    assert "Row row_1: First note" in user_message["content"]
+    assert "Row row_2: Second note" in user_message["content"]
+    assert "Dept: Cardiology" in user_message["content"]
+
+
 def test_case_sensitive_category_validation(simple_taxonomy):
     """Test that category validation is case-sensitive."""
     step = ClassifierStep(
@@ -375,3 +505,27 @@ def test_case_sensitive_category_validation(simple_taxonomy):
     invalid = ClassificationOutput(category="categorya", confidence=0.8, reasoning="Test")
     with pytest.raises(ValueError):
         step._validate_category(invalid)
+
+
+def test_arun_many_classifies_states_concurrently(simple_taxonomy, mock_llm_client):
+    """Test that arun_many processes all states and preserves order."""
+    import asyncio
+
+    step = ClassifierStep(
+        name="test_classifier",
+        taxonomy=simple_taxonomy,
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="classification"
+    )
+
+    states = [
+        GlobalState(pk=f"row_{i}", raw={"note": f"Note {i}"})
+        for i in range(5)
+    ]
+
+    results = asyncio.run(step.arun_many(states, mock_llm_client, concurrency=3))
+
+    assert [state.pk for state in results] == [f"row_{i}" for i in range(5)]
+    for state in results:
+        assert state.processed["classification"]["category"] == "CategoryA"
+        assert "test_classifier" in state.log
@@ -0,0 +1,125 @@
+"""
+Tests for FusedStep.
+
+Validates:
+- Joint schema composes one field per sub-step
+- One call fills processed under every sub-step's output_key
+- Sub-step business validation still applies to fused outputs
+- Construction rejects invalid sub-step combinations
+"""
+
+import pytest
+
+from llm_etl.core.state import GlobalState
+from llm_etl.llm.client import LLMClientWithRetry
+from llm_etl.llm.providers.mock import MockProvider
+from llm_etl.steps.classifier import ClassifierStep
+from llm_etl.steps.fused import FusedStep
+from llm_etl.steps.summarizer import SummarizerStep
+
+
+@pytest.fixture
+def classifier_step():
+    """Classifier sub-step for fusion."""
+    return ClassifierStep(
+        name="visit_classifier",
+        taxonomy=[
+            {"name": "Emergency", "definition": "Urgent care needed"},
+            {"name": "Routine", "definition": "Scheduled visit"},
+        ],
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="visit_type",
+    )
+
+
+@pytest.fixture
+def summarizer_step():
+    """Summarizer sub-step for fusion."""
+    return SummarizerStep(
+        name="note_summarizer",
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="summary",
+    )
+
+
+@pytest.fixture
+def fused_step(classifier_step, summarizer_step):
+    """Fused classifier + summarizer."""
+    return FusedStep(
+        name="classify_and_summarize",
+        steps=[classifier_step, summarizer_step],
+    )
+
+
+def make_client(response: dict) -> LLMClientWithRetry:
+    """Build a retry client whose mock answers the fused step."""
+    provider = MockProvider(responses={"classify_and_summarize": response})
+    return LLMClientWithRetry(provider, max_retries=2)
+
+
+def test_joint_schema_has_one_field_per_substep(fused_step):
+    """The composed schema exposes each sub-step's output_key as a field."""
+    fields = fused_step.output_schema.model_fields
+    assert set(fields) == {"visit_type", "summary"}
+
+
+def test_single_call_fills_all_output_keys(fused_step):
+    """One fused call populates processed for every sub-step."""
+    client = make_client(
+        {
+            "visit_type": {
+                "category": "Emergency",
+                "confidence": 0.95,
+                "reasoning": "Acute symptoms",
+            },
+            "summary": {
+                "text": "Patient seen for chest pain.",
+                "reasoning": "Condensed the note",
+            },
+        }
+    )
+    state = GlobalState(pk="enc_001", raw={"note": "Chest pain, urgent."})
+
+    state = fused_step.run(state, client)
+
+    assert state.processed["visit_type"]["category"] == "Emergency"
+    assert state.processed["summary"]["text"] == "Patient seen for chest pain."
+    # Sub-step names are logged so unfused downstream checks keep working
+    assert "visit_classifier" in state.log
+    assert "note_summarizer" in state.log
+
+
+def test_substep_business_validation_applies(fused_step):
+    """A category outside the taxonomy is rejected even when fused."""
+    client = make_client(
+        {
+            "visit_type": {
+                "category": "NotInTaxonomy",
+                "confidence": 0.9,
+                "reasoning": "Bad",
+            },
+            "summary": {"text": "Summary.", "reasoning": "Ok"},
+        }
+    )
+    state = GlobalState(pk="enc_002", raw={"note": "Some note"})
+
+    with pytest.raises(ValueError, match="Invalid category"):
+        fused_step.run(state, client)
+
+
+def test_requires_at_least_two_substeps(classifier_step):
+    """Fusing a single step is rejected."""
+    with pytest.raises(ValueError, match="at least 2"):
+        FusedStep(name="solo", steps=[classifier_step])
+
+
+def test_rejects_duplicate_output_keys(classifier_step):
+    """Sub-steps writing to the same output_key cannot be fused."""
+    other = ClassifierStep(
+        name="other_classifier",
+        taxonomy=[{"name": "A", "definition": "A"}],
+        input_map={"text": lambda s: s.raw["note"]},
+        output_key="visit_type",
+    )
+    with pytest.raises(ValueError, match="distinct output_keys"):
+        FusedStep(name="dup", steps=[classifier_step, other])
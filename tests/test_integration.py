@@ -126,6 +126,53 @@ def test_full_pipeline_processes_all_rows(temp_dir, sample_csv, taxonomy, summar
     assert "Emergency" in output_content
 
 
+def test_arun_processes_all_rows_from_event_loop(temp_dir, sample_csv, taxonomy):
+    """Test the awaitable entry point from inside a running event loop."""
+    import asyncio
+
+    output_path = temp_dir / "output.csv"
+
+    mock_provider = MockProvider(
+        default_response={
+            "category": "Emergency",
+            "confidence": 0.85,
+            "reasoning": "Test classification",
+        }
+    )
+
+    pipeline = Pipeline(
+        name="test_arun",
+        source=CSVSource(str(sample_csv), "id"),
+        steps=[
+            ClassifierStep(
+                name="classifier",
+                taxonomy=taxonomy,
+                input_map={"text": lambda s: s.raw["note"]},
+                output_key="classification",
+            ),
+        ],
+        sink=CSVSink(
+            str(output_path),
+            column_map={
+                "id": lambda s: s.pk,
+                "category": lambda s: s.processed["classification"]["category"],
+            },
+        ),
+        llm_provider=mock_provider,
+        on_row_error="fail",
+    )
+
+    async def driver():
+        # run() would raise here; arun() awaits inside the caller's loop
+        return await pipeline.arun()
+
+    result = asyncio.run(driver())
+
+    assert result.total_count == 3
+    assert result.success_count == 3
+    assert "ENC003" in output_path.read_text()
+
+
 def test_mock_provider_retry_logic(temp_dir, sample_csv, taxonomy):
     """Test that validation failures trigger retry with error feedback."""
     output_path = temp_dir / "output.csv"
@@ -232,6 +279,124 @@ def test_dead_letter_captures_validation_failure(temp_dir, sample_csv, taxonomy)
         assert record["retry_attempts"] == 3  # Initial + 2 retries
 
 
+def test_dead_letter_dedup_collapses_identical_failures(temp_dir, sample_csv, taxonomy):
+    """Test that dedup writes one record for rows failing identically."""
+    output_path = temp_dir / "output.csv"
+    dead_letter_path = temp_dir / "failed.jsonl"
+
+    mock_provider = MockProvider(
+        default_response={
+            "category": "Emergency",
+            "confidence": 0.85,
+            "reasoning": "Test classification",
+        },
+        fail_validation_times=100,  # Every row fails the same way
+    )
+
+    pipeline = Pipeline(
+        name="test_dead_letter_dedup",
+        source=CSVSource(str(sample_csv), "id"),
+        steps=[
+            ClassifierStep(
+                name="classifier",
+                taxonomy=taxonomy,
+                input_map={"text": lambda s: s.raw["note"]},
+                output_key="classification",
+            ),
+        ],
+        sink=CSVSink(
+            str(output_path),
+            column_map={"id": lambda s: s.pk},
+        ),
+        llm_provider=mock_provider,
+        on_row_error="dead_letter",
+        dead_letter_path=str(dead_letter_path),
+        dedup_dead_letters=True,
+        max_retries=2,
+    )
+
+    result = pipeline.run()
+
+    # All 3 rows fail, but they share one (step, error type, message) key
+    assert result.failure_count == 3
+
+    import json
+    lines = dead_letter_path.read_text().strip().split("\n")
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["duplicate_count"] == 1
+    assert record["error_type"] == "StepExecutionError"
+
+
+def test_run_batch_api_processes_all_rows(temp_dir, sample_csv, taxonomy):
+    """Test the offline Batch API path with a stubbed batch-capable provider."""
+    import json
+
+    output_path = temp_dir / "output.csv"
+
+    class BatchCapableMock(MockProvider):
+        """Mock provider that answers Batch API submissions synchronously."""
+
+        def __init__(self):
+            super().__init__()
+            self.submitted_requests = []
+
+        def submit_batch(self, requests):
+            self.submitted_requests.extend(requests)
+            return "batch_test_001"
+
+        def wait_for_batch(self, batch_id, poll_interval=30.0, timeout=86400.0):
+            results = {
+                request["custom_id"]: json.dumps(
+                    {
+                        "category": "Emergency",
+                        "confidence": 0.9,
+                        "reasoning": "Batch classification",
+                    }
+                )
+                for request in self.submitted_requests
+            }
+            return results, {}
+
+    provider = BatchCapableMock()
+
+    pipeline = Pipeline(
+        name="test_batch_api",
+        source=CSVSource(str(sample_csv), "id"),
+        steps=[
+            ClassifierStep(
+                name="classifier",
+                taxonomy=taxonomy,
+                input_map={"text": lambda s: s.raw["note"]},
+                output_key="classification",
+            ),
+        ],
+        sink=CSVSink(
+            str(output_path),
+            column_map={
+                "id": lambda s: s.pk,
+                "category": lambda s: s.processed["classification"]["category"],
+            },
+        ),
+        llm_provider=provider,
+        on_row_error="fail",
+    )
+
+    result = pipeline.run_batch_api(poll_interval=0.0)
+
+    assert result.total_count == 3
+    assert result.success_count == 3
+    assert result.failure_count == 0
+
+    # One request per row was submitted, keyed by pk and step name
+    custom_ids = {request["custom_id"] for request in provider.submitted_requests}
+    assert custom_ids == {"ENC001:classifier", "ENC002:classifier", "ENC003:classifier"}
+
+    output_content = output_path.read_text()
+    assert "ENC001" in output_content
+    assert "Emergency" in output_content
+
+
 def test_pipeline_dry_run_validates_without_processing(temp_dir, sample_csv, taxonomy):
     """Test that dry_run=True validates configuration without processing data."""
     output_path = temp_dir / "output.csv"
@@ -386,3 +551,129 @@ def test_invalid_category_triggers_retry(temp_dir, sample_csv, taxonomy):
     for line in lines:
         record = json.loads(line)
         assert "InvalidCategory" in record["error_message"]
+
+
+def test_sink_formats_datetime_values(temp_dir):
+    """Column extractors may return datetimes; the sink ISO-formats them."""
+    from datetime import datetime
+
+    from llm_etl.core.state import GlobalState
+
+    output_path = temp_dir / "output.csv"
+    sink = CSVSink(
+        str(output_path),
+        column_map={
+            "id": lambda s: s.pk,
+            "processed_at": lambda s: s.completed_at,
+        },
+    )
+
+    ts = datetime(2026, 1, 2, 3, 4, 5)
+    for pk in ("A", "B"):
+        state = GlobalState(pk=pk, raw={})
+        state.completed_at = ts
+        sink.write(state)
+
+    lines = output_path.read_text().strip().split("\n")
+    assert lines[1] == f"A,{ts.isoformat()}"
+    assert lines[2] == f"B,{ts.isoformat()}"
+
+
+def test_sink_linger_flushes_slow_buffers(temp_dir):
+    """A buffered sink with linger_ms flushes rows that have waited too long."""
+    import time
+
+    from llm_etl.core.state import GlobalState
+
+    output_path = temp_dir / "output.csv"
+    sink = CSVSink(
+        str(output_path),
+        column_map={"id": lambda s: s.pk},
+        flush_every=100,
+        linger_ms=1,
+    )
+
+    sink.write(GlobalState(pk="A", raw={}))
+    time.sleep(0.01)
+    # Second write trips the linger deadline even though the buffer is
+    # far below flush_every
+    sink.write(GlobalState(pk="B", raw={}))
+
+    lines = output_path.read_text().strip().split("\n")
+    assert lines == ["id", "A", "B"]
+
+
+def test_sink_background_writer_persists_all_rows(temp_dir):
+    """With start_writer(), enqueued rows land on disk after close()."""
+    from llm_etl.core.state import GlobalState
+
+    output_path = temp_dir / "output.csv"
+    sink = CSVSink(str(output_path), column_map={"id": lambda s: s.pk})
+    sink.start_writer()
+
+    pks = [f"ROW{i:03d}" for i in range(50)]
+    for pk in pks:
+        sink.write(GlobalState(pk=pk, raw={}))
+
+    # flush() blocks until the writer thread has drained the queue
+    sink.flush()
+    sink.close()
+
+    lines = output_path.read_text().strip().split("\n")
+    assert lines == ["id"] + pks
+
+
+def test_csv_source_count_handles_missing_trailing_newline(temp_dir):
+    """count() reports the same row total with or without a final newline."""
+    from llm_etl.sources.csv_source import CSVSource
+
+    path = temp_dir / "rows.csv"
+    path.write_text("id,value\nA,1\nB,2\nC,3\n")
+    assert CSVSource(str(path), "id").count() == 3
+
+    path.write_text("id,value\nA,1\nB,2\nC,3")
+    assert CSVSource(str(path), "id").count() == 3
+
+
+def test_async_source_and_sink_wrappers(temp_dir, sample_csv):
+    """async for over a source and sink.awrite round-trip rows correctly."""
+    import asyncio
+
+    from llm_etl.sources.csv_source import CSVSource
+
+    output_path = temp_dir / "output.csv"
+    sink = CSVSink(str(output_path), column_map={"id": lambda s: s.pk})
+    source = CSVSource(str(sample_csv), "id")
+
+    async def driver():
+        async for state in source:
+            await sink.awrite(state)
+        sink.close()
+
+    asyncio.run(driver())
+
+    lines = output_path.read_text().strip().split("\n")
+    assert lines[0] == "id"
+    assert len(lines) == 4  # Header + 3 rows
+
+
+def test_sink_accepts_dotted_path_extractors(temp_dir):
+    """column_map values may be dotted paths compiled into accessors."""
+    from llm_etl.core.state import GlobalState
+
+    output_path = temp_dir / "output.csv"
+    sink = CSVSink(
+        str(output_path),
+        column_map={
+            "id": "pk",
+            "category": "processed.visit_type.category",
+        },
+    )
+
+    state = GlobalState(pk="ENC001", raw={})
+    state.processed["visit_type"] = {"category": "Emergency"}
+    sink.write(state)
+    sink.close()
+
+    lines = output_path.read_text().strip().split("\n")
+    assert lines == ["id,category", "ENC001,Emergency"]
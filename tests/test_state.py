@@ -280,3 +280,32 @@ def test_none_values_in_serialization():
     # Deserialize
     restored = GlobalState.from_dict(state_dict)
     assert restored.completed_at is None
+
+
+def test_state_has_no_instance_dict():
+    """__slots__ keeps per-row objects compact."""
+    state = GlobalState(pk="1", raw={"a": 1})
+    assert not hasattr(state, "__dict__")
+
+
+def test_raw_as_dict_is_cached():
+    """The plain-dict copy of raw is built once and reused."""
+    state = GlobalState(pk="1", raw={"a": 1})
+    first = state.raw_as_dict()
+    assert first == {"a": 1}
+    assert state.raw_as_dict() is first
+    assert state.to_dict()["raw"] is first
+
+
+def test_content_hash_is_stable_and_order_independent():
+    """content_hash depends on raw content, not key order, and is cached."""
+    state_a = GlobalState(pk="1", raw={"a": 1, "b": 2})
+    state_b = GlobalState(pk="2", raw={"b": 2, "a": 1})
+    state_c = GlobalState(pk="3", raw={"a": 1, "b": 3})
+
+    # Same content in different insertion order hashes identically
+    assert state_a.content_hash() == state_b.content_hash()
+    # Different content hashes differently
+    assert state_a.content_hash() != state_c.content_hash()
+    # Repeated calls return the cached digest
+    assert state_a.content_hash() is state_a.content_hash()